@@ -38,8 +38,13 @@ from .helpers.dispatcher import async_dispatcher_send
 from .helpers.typing import ConfigType
 from .setup import (
     DATA_SETUP,
+    DATA_SETUP_PHASE_TIME,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    SETUP_PHASE_IMPORT,
+    SETUP_PHASE_LOADER,
+    SETUP_PHASE_SETUP,
+    async_pre_import_integrations,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -68,6 +73,8 @@ COOLDOWN_TIME = 60
 
 MAX_LOAD_CONCURRENTLY = 6
 
+SLOWEST_IMPORTS_TO_LOG = 20
+
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 CORE_INTEGRATIONS = {"homeassistant", "persistent_notification"}
 LOGGING_INTEGRATIONS = {
@@ -579,6 +586,13 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import the integrations that allow it in the executor while they are
+    # being set up
+    pre_import_task = hass.async_create_background_task(
+        async_pre_import_integrations(hass, integration_cache.values()),
+        "pre-import integrations",
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -670,6 +684,7 @@ async def _async_set_up_integrations(
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
 
     watch_task.cancel()
+    pre_import_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATIONS, {})
 
     _LOGGER.debug(
@@ -681,3 +696,49 @@ async def _async_set_up_integrations(
             )
         },
     )
+    _async_log_startup_timings(hass)
+
+
+@core.callback
+def _async_log_startup_timings(hass: core.HomeAssistant) -> None:
+    """Log the time spent loading, importing and setting up integrations."""
+    phase_time: dict[str, dict[str, float]] = hass.data.get(DATA_SETUP_PHASE_TIME, {})
+    phases = (SETUP_PHASE_LOADER, SETUP_PHASE_IMPORT, SETUP_PHASE_SETUP)
+    totals = {
+        phase: sum(timings.get(phase, 0.0) for timings in phase_time.values())
+        for phase in phases
+    }
+    import_time: dict[str, float] = hass.data.get(loader.DATA_IMPORT_TIME, {})
+    _LOGGER.info(
+        (
+            "Integrations spent %.2fs in the loader, %.2fs waiting on imports and"
+            " %.2fs setting up; %d modules were imported in %.2fs"
+        ),
+        *totals.values(),
+        len(import_time),
+        sum(import_time.values()),
+    )
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
+    _LOGGER.debug(
+        "Slowest module imports in seconds: %s",
+        {
+            module: round(seconds, 3)
+            for module, seconds in sorted(
+                import_time.items(), key=lambda item: item[1], reverse=True
+            )[:SLOWEST_IMPORTS_TO_LOG]
+        },
+    )
+    report = "\n".join(
+        f"{domain:<32} "
+        + " ".join(f"{timings.get(phase, 0.0):>8.3f}" for phase in phases)
+        for domain, timings in sorted(
+            phase_time.items(), key=lambda item: sum(item[1].values()), reverse=True
+        )
+    )
+    _LOGGER.debug(
+        "Integration startup times in seconds:\n%-32s %8s %8s %8s\n%s",
+        "domain",
+        *phases,
+        report,
+    )
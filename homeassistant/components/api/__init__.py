@@ -1,6 +1,5 @@
 """Rest API for Home Assistant."""
 import asyncio
-from functools import lru_cache
 from http import HTTPStatus
 import logging
 
@@ -13,6 +12,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     MATCH_ALL,
     URL_API,
@@ -29,10 +29,9 @@ import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceNotFound, TemplateError, Unauthorized
 from homeassistant.helpers import config_validation as cv, template
-from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.util.json import json_loads
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -111,7 +110,7 @@ class APIEventStream(HomeAssistantView):
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
                 data = stop_obj
             else:
-                data = json_dumps(event)
+                data = event.as_dict_json()
 
             await to_write.put(data)
 
@@ -179,7 +178,12 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        try:
+            json_data = f'[{",".join(state.as_dict_json() for state in states)}]'
+        except JSON_ENCODE_EXCEPTIONS:
+            # Logs where the bad data is found
+            return self.json(states)
+        return _json_response(json_data)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -196,7 +200,11 @@ class APIEntityStateView(HomeAssistantView):
             raise Unauthorized(entity_id=entity_id)
 
         if state := request.app["hass"].states.get(entity_id):
-            return self.json(state)
+            try:
+                return _json_response(state.as_dict_json())
+            except JSON_ENCODE_EXCEPTIONS:
+                # Logs where the bad data is found
+                return self.json(state)
         return self.json_message("Entity not found.", HTTPStatus.NOT_FOUND)
 
     async def post(self, request, entity_id):
@@ -353,12 +361,6 @@ class APIComponentsView(HomeAssistantView):
         return self.json(request.app["hass"].config.components)
 
 
-@lru_cache
-def _cached_template(template_str: str, hass: ha.HomeAssistant) -> template.Template:
-    """Return a cached template."""
-    return template.Template(template_str, hass)
-
-
 class APITemplateView(HomeAssistantView):
     """View to handle Template requests."""
 
@@ -371,7 +373,7 @@ class APITemplateView(HomeAssistantView):
             raise Unauthorized()
         try:
             data = await request.json()
-            tpl = _cached_template(data["template"], request.app["hass"])
+            tpl = template.Template(data["template"], request.app["hass"])
             return tpl.async_render(variables=data.get("variables"), parse_result=False)
         except (ValueError, TemplateError) as ex:
             return self.json_message(
@@ -405,3 +407,12 @@ def async_events_json(hass):
         {"event": key, "listener_count": value}
         for key, value in hass.bus.async_listeners().items()
     ]
+
+
+def _json_response(json_data: str) -> web.Response:
+    """Return a JSON response of data that is already serialized."""
+    response = web.Response(
+        body=json_data.encode("utf-8"), content_type=CONTENT_TYPE_JSON
+    )
+    response.enable_compression()
+    return response
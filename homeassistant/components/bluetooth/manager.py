@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
 from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta
 import itertools
 import logging
+import time
 from typing import TYPE_CHECKING, Any, Final
 
 from bleak.backends.scanner import AdvertisementDataCallback
@@ -74,6 +76,12 @@ APPLE_START_BYTES_WANTED: Final = {
 
 MONOTONIC_TIME: Final = monotonic_time_coarse
 
+# Stages of scanner_adv_received that count the advertisements ending there
+STAGE_FILTERED: Final = "filtered"
+STAGE_NOT_PREFERRED: Final = "not_preferred"
+STAGE_UNCHANGED: Final = "unchanged"
+STAGE_DISPATCHED: Final = "dispatched"
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -139,6 +147,11 @@ class BluetoothManager:
         self.storage = storage
         self.slot_manager = slot_manager
         self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        # Number of advertisements per stage they ended in
+        self._stage_counts: Counter[str] = Counter()
+        # Seconds spent matching and dispatching changed advertisements
+        self._match_seconds = 0.0
+        self._dispatch_seconds = 0.0
 
     @property
     def supports_passive_scan(self) -> bool:
@@ -173,6 +186,16 @@ class BluetoothManager:
                 service_info.as_dict() for service_info in self._all_history.values()
             ],
             "advertisement_tracker": self._advertisement_tracker.async_diagnostics(),
+            "advertisement_stages": self.async_advertisement_stages(),
+        }
+
+    @hass_callback
+    def async_advertisement_stages(self) -> dict[str, Any]:
+        """Return the number of advertisements per stage and the time spent."""
+        return {
+            "counts": dict(self._stage_counts),
+            "match_seconds": self._match_seconds,
+            "dispatch_seconds": self._dispatch_seconds,
         }
 
     def _find_adapter_by_address(self, address: str) -> str | None:
@@ -417,6 +440,7 @@ class BluetoothManager:
             and apple_data[0] not in APPLE_START_BYTES_WANTED
             and not advertisement_data.service_data
         ):
+            self._stage_counts[STAGE_FILTERED] += 1
             return
 
         device = service_info.device
@@ -477,10 +501,12 @@ class BluetoothManager:
                         )
                     )
                 ):
+                    self._stage_counts[STAGE_NOT_PREFERRED] += 1
                     return
 
                 connectable_history[address] = service_info
 
+            self._stage_counts[STAGE_NOT_PREFERRED] += 1
             return
 
         if connectable:
@@ -513,6 +539,7 @@ class BluetoothManager:
                 or service_info.name != old_service_info.name
             )
         ):
+            self._stage_counts[STAGE_UNCHANGED] += 1
             return
 
         if not connectable and old_connectable_service_info:
@@ -534,7 +561,11 @@ class BluetoothManager:
                 time=service_info.time,
             )
 
+        self._stage_counts[STAGE_DISPATCHED] += 1
+        start = time.perf_counter()
         matched_domains = self._integration_matcher.match_domains(service_info)
+        matched = time.perf_counter()
+        self._match_seconds += matched - start
         if self._debug:
             _LOGGER.debug(
                 "%s: %s %s match: %s",
@@ -564,6 +595,8 @@ class BluetoothManager:
                 service_info,
             )
 
+        self._dispatch_seconds += time.perf_counter() - matched
+
     @hass_callback
     def _async_describe_source(self, service_info: BluetoothServiceInfoBleak) -> str:
         """Describe a source."""
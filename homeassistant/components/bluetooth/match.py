@@ -169,6 +169,9 @@ class BluetoothMatcherIndexBase(Generic[_T]):
         self.service_uuid: dict[str, list[_T]] = {}
         self.service_data_uuid: dict[str, list[_T]] = {}
         self.manufacturer_id: dict[int, list[_T]] = {}
+        # Matchers with a manufacturer_data_start by manufacturer id and the
+        # first byte of the manufacturer data
+        self.manufacturer_start_byte: dict[tuple[int, int], list[_T]] = {}
         self.service_uuid_set: set[str] = set()
         self.service_data_uuid_set: set[str] = set()
         self.manufacturer_id_set: set[int] = set()
@@ -189,9 +192,7 @@ class BluetoothMatcherIndexBase(Generic[_T]):
 
         # Manufacturer data is 2nd cheapest since its all ints
         if MANUFACTURER_ID in matcher:
-            self.manufacturer_id.setdefault(matcher[MANUFACTURER_ID], []).append(
-                matcher
-            )
+            self._manufacturer_bucket(matcher).append(matcher)
             return True
 
         if SERVICE_UUID in matcher:
@@ -219,7 +220,7 @@ class BluetoothMatcherIndexBase(Generic[_T]):
             return True
 
         if MANUFACTURER_ID in matcher:
-            self.manufacturer_id[matcher[MANUFACTURER_ID]].remove(matcher)
+            self._manufacturer_bucket(matcher).remove(matcher)
             return True
 
         if SERVICE_UUID in matcher:
@@ -232,11 +233,26 @@ class BluetoothMatcherIndexBase(Generic[_T]):
 
         return False
 
+    def _manufacturer_bucket(self, matcher: _T) -> list[_T]:
+        """Return the bucket for a matcher with a manufacturer id.
+
+        Many matchers share a manufacturer id and only differ in the start of the
+        manufacturer data, so they are bucketed by its first byte as well.
+        """
+        manufacturer_id = matcher[MANUFACTURER_ID]
+        if manufacturer_data_start := matcher.get(MANUFACTURER_DATA_START):
+            return self.manufacturer_start_byte.setdefault(
+                (manufacturer_id, manufacturer_data_start[0]), []
+            )
+        return self.manufacturer_id.setdefault(manufacturer_id, [])
+
     def build(self) -> None:
         """Rebuild the index sets."""
         self.service_uuid_set = set(self.service_uuid)
         self.service_data_uuid_set = set(self.service_data_uuid)
-        self.manufacturer_id_set = set(self.manufacturer_id)
+        self.manufacturer_id_set = set(self.manufacturer_id) | {
+            manufacturer_id for manufacturer_id, _ in self.manufacturer_start_byte
+        }
 
     def match(self, service_info: BluetoothServiceInfoBleak) -> list[_T]:
         """Check for a match."""
@@ -256,13 +272,29 @@ class BluetoothMatcherIndexBase(Generic[_T]):
                     if ble_device_matches(matcher, service_info):
                         matches.append(matcher)
 
-        if self.manufacturer_id_set and service_info.manufacturer_data:
+        if self.manufacturer_id_set and (
+            manufacturer_data := service_info.manufacturer_data
+        ):
+            first_bytes: set[int] | None = None
             for manufacturer_id in self.manufacturer_id_set.intersection(
-                service_info.manufacturer_data
+                manufacturer_data
             ):
-                for matcher in self.manufacturer_id[manufacturer_id]:
+                for matcher in self.manufacturer_id.get(manufacturer_id, ()):
                     if ble_device_matches(matcher, service_info):
                         matches.append(matcher)
+                if not self.manufacturer_start_byte:
+                    continue
+                # ble_device_matches checks the start against all manufacturer data
+                if first_bytes is None:
+                    first_bytes = {
+                        data[0] for data in manufacturer_data.values() if data
+                    }
+                for first_byte in first_bytes:
+                    for matcher in self.manufacturer_start_byte.get(
+                        (manufacturer_id, first_byte), ()
+                    ):
+                        if ble_device_matches(matcher, service_info):
+                            matches.append(matcher)
 
         if self.service_uuid_set and service_info.service_uuids:
             for service_uuid in self.service_uuid_set.intersection(
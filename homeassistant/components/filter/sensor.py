@@ -8,9 +8,9 @@ from datetime import datetime, timedelta
 from functools import partial
 import logging
 from numbers import Number
-import statistics
 from typing import Any, cast
 
+import numpy as np
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
@@ -77,6 +77,10 @@ DEFAULT_PRECISION = 2
 DEFAULT_FILTER_RADIUS = 2.0
 DEFAULT_FILTER_TIME_CONSTANT = 10
 
+# Upper bound of the number of values in the sliding windows of one batch
+# processed at once, to keep the memory usage of replaying history bounded
+BATCH_WINDOW_VALUES = 1_000_000
+
 NAME_TEMPLATE = "{} filter"
 ICON = "mdi:chart-line-variant"
 
@@ -272,7 +276,38 @@ class SensorFilter(SensorEntity):
             return
 
         self._state = temp_state.state
+        self._update_attributes(new_state)
+
+        if update_ha:
+            self.async_write_ha_state()
+
+    @callback
+    def _update_filter_sensor_states(self, new_states: list[State]) -> None:
+        """Process a batch of device states, without writing the state."""
+        temp_states = [
+            (idx, _State(state.last_updated, state.state))
+            for idx, state in enumerate(new_states)
+        ]
+
+        for filt in self._filters:
+            temp_states = filt.filter_states(temp_states)
+            _LOGGER.debug(
+                "%s(%s) kept %s of the states",
+                filt.name,
+                self._entity,
+                len(temp_states),
+            )
+
+        if not temp_states:
+            return
+
+        self._attr_available = True
+        self._state = temp_states[-1][1].state
+        for idx, _ in temp_states:
+            self._update_attributes(new_states[idx])
 
+    def _update_attributes(self, new_state: State) -> None:
+        """Take the attributes of the sensor from the source state."""
         if self._attr_icon is None:
             self._attr_icon = new_state.attributes.get(ATTR_ICON, ICON)
 
@@ -293,9 +328,6 @@ class SensorFilter(SensorEntity):
                 ATTR_UNIT_OF_MEASUREMENT
             )
 
-        if update_ha:
-            self.async_write_ha_state()
-
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
 
@@ -356,9 +388,13 @@ class SensorFilter(SensorEntity):
             )
 
             # Replay history through the filter chain
-            for state in history_list:
-                if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]:
-                    self._update_filter_sensor_state(state, False)
+            self._update_filter_sensor_states(
+                [
+                    state
+                    for state in history_list
+                    if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]
+                ]
+            )
 
         self.async_on_remove(
             async_track_state_change_event(
@@ -415,6 +451,48 @@ class _State:
     state: str | float | int
 
 
+class _RingBuffer:
+    """Fixed size buffer of the latest values, backed by a numpy array."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize the buffer."""
+        self._data = np.zeros(max(size, 0), dtype=np.float64)
+        self._size = max(size, 0)
+        self._index = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the buffer."""
+        return self._count
+
+    def append(self, value: float) -> None:
+        """Append a value, dropping the oldest one if the buffer is full."""
+        if not self._size:
+            return
+        self._data[self._index] = value
+        self._index = (self._index + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+    def extend(self, values: np.ndarray) -> None:
+        """Append values, dropping the oldest ones if the buffer is full."""
+        if not self._size:
+            return
+        latest = np.concatenate((self.values(), values))[-self._size :]
+        self._count = len(latest)
+        self._data[: self._count] = latest
+        self._index = self._count % self._size
+
+    def values(self) -> np.ndarray:
+        """Return a copy of the values, oldest first."""
+        if self._count < self._size:
+            return self._data[: self._count].copy()
+        return np.concatenate((self._data[self._index :], self._data[: self._index]))
+
+    def median(self) -> float:
+        """Return the median of the values."""
+        return float(np.median(self._data[: self._count]))
+
+
 class Filter:
     """Filter skeleton."""
 
@@ -480,6 +558,75 @@ class Filter:
         new_state.state = filtered.state
         return new_state
 
+    def filter_states(
+        self, new_states: list[tuple[int, _State]]
+    ) -> list[tuple[int, _State]]:
+        """Filter a batch of states and return the ones not skipped.
+
+        The states are paired with the index of their source state, which
+        is kept for the filtered states. The result is the same as passing
+        the states one by one to filter_state, up to floating point rounding
+        of vectorized filters. States which are not a number are logged and
+        dropped.
+        """
+        if not self._only_numbers:
+            return self._filter_states_one_by_one(new_states)
+
+        numeric_states: list[tuple[int, _State]] = []
+        fstates: list[FilterState] = []
+        for idx, new_state in new_states:
+            fstate = FilterState(new_state)
+            if not isinstance(fstate.state, Number):
+                _LOGGER.error(
+                    "Could not convert state: %s (%s) to number",
+                    new_state.state,
+                    type(new_state.state),
+                )
+                continue
+            numeric_states.append((idx, new_state))
+            fstates.append(fstate)
+
+        values = np.fromiter(
+            (cast(float, fstate.state) for fstate in fstates), np.float64, len(fstates)
+        )
+        filtered_values = self._filter_values(values, fstates)
+        for (_, new_state), fstate, value in zip(
+            numeric_states, fstates, filtered_values.tolist()
+        ):
+            fstate.state = value
+            fstate.set_precision(self.filter_precision)
+            new_state.state = fstate.state
+        return numeric_states
+
+    def _filter_states_one_by_one(
+        self, new_states: list[tuple[int, _State]]
+    ) -> list[tuple[int, _State]]:
+        """Filter states with filter_state and return the ones not skipped."""
+        filtered_states: list[tuple[int, _State]] = []
+        for idx, new_state in new_states:
+            filtered_state = self.filter_state(new_state)
+            if not self.skip_processing:
+                filtered_states.append((idx, filtered_state))
+        return filtered_states
+
+    def _filter_values(
+        self, values: np.ndarray, new_states: list[FilterState]
+    ) -> np.ndarray:
+        """Implement the filter on a batch of numbers, before rounding.
+
+        Returns the filtered values and updates the window. Filters with a
+        vectorized implementation override this, the default filters the
+        states one by one.
+        """
+        filtered_values: list[float] = []
+        for fstate in new_states:
+            raw = copy(fstate)
+            filtered = self._filter_state(fstate)
+            filtered.set_precision(self.filter_precision)
+            self.states.append(copy(raw if self._store_raw else filtered))
+            filtered_values.append(cast(float, filtered.state))
+        return np.array(filtered_values, np.float64)
+
 
 @FILTERS.register(FILTER_NAME_RANGE)
 class RangeFilter(Filter, SensorEntity):
@@ -539,6 +686,29 @@ class RangeFilter(Filter, SensorEntity):
 
         return new_state
 
+    def _filter_values(
+        self, values: np.ndarray, new_states: list[FilterState]
+    ) -> np.ndarray:
+        """Implement the range filter on a batch of numbers."""
+        filtered = values.copy()
+        if self._upper_bound is not None:
+            above = values > self._upper_bound
+            self._stats_internal["erasures_up"] += int(np.count_nonzero(above))
+            filtered[above] = self._upper_bound
+        if self._lower_bound is not None:
+            below = values < self._lower_bound
+            if self._upper_bound is not None:
+                below &= ~above
+            self._stats_internal["erasures_low"] += int(np.count_nonzero(below))
+            filtered[below] = self._lower_bound
+
+        if len(new_states):
+            last = copy(new_states[-1])
+            last.state = float(filtered[-1])
+            last.set_precision(self.filter_precision)
+            self.states.append(last)
+        return filtered
+
 
 @FILTERS.register(FILTER_NAME_OUTLIER)
 class OutlierFilter(Filter, SensorEntity):
@@ -565,15 +735,16 @@ class OutlierFilter(Filter, SensorEntity):
         self._radius = radius
         self._stats_internal: Counter = Counter()
         self._store_raw = True
+        self._window = _RingBuffer(window_size)
 
     def _filter_state(self, new_state: FilterState) -> FilterState:
         """Implement the outlier filter."""
 
         # We can cast safely here thanks to self._only_numbers = True
-        previous_state_values = [cast(float, s.state) for s in self.states]
         new_state_value = cast(float, new_state.state)
 
-        median = statistics.median(previous_state_values) if self.states else 0
+        median = self._window.median() if self.states else 0
+        self._window.append(new_state_value)
         if (
             len(self.states) == self.states.maxlen
             and abs(new_state_value - median) > self._radius
@@ -589,6 +760,36 @@ class OutlierFilter(Filter, SensorEntity):
             new_state.state = median
         return new_state
 
+    def _filter_values(
+        self, values: np.ndarray, new_states: list[FilterState]
+    ) -> np.ndarray:
+        """Implement the outlier filter on a batch of numbers."""
+        window_size = cast(int, self.window_size)
+        if window_size < 1:
+            return super()._filter_values(values, new_states)
+
+        previous = self._window.values()
+        window = np.concatenate((previous, values))
+        filtered = values.copy()
+        # Values are only compared to the median once the window is full
+        first_full = max(window_size - len(previous), 0)
+        chunk_size = max(BATCH_WINDOW_VALUES // window_size, 1)
+        for start in range(first_full, len(values), chunk_size):
+            stop = min(start + chunk_size, len(values))
+            offset = len(previous) - window_size
+            windows = np.lib.stride_tricks.sliding_window_view(
+                window[offset + start : offset + stop + window_size - 1],
+                window_size,
+            )
+            medians = np.median(windows, axis=1)
+            outliers = np.abs(values[start:stop] - medians) > self._radius
+            self._stats_internal["erasures"] += int(np.count_nonzero(outliers))
+            filtered[start:stop] = np.where(outliers, medians, values[start:stop])
+
+        self._window.extend(values)
+        self.states.extend(copy(state) for state in new_states[-window_size:])
+        return filtered
+
 
 @FILTERS.register(FILTER_NAME_LOWPASS)
 class LowPassFilter(Filter, SensorEntity):
@@ -678,6 +879,60 @@ class TimeSMAFilter(Filter, SensorEntity):
 
         return new_state
 
+    def _filter_values(
+        self, values: np.ndarray, new_states: list[FilterState]
+    ) -> np.ndarray:
+        """Implement the Simple Moving Average filter on a batch of numbers."""
+        if not new_states:
+            return values
+        queue = [*self.queue, *(copy(state) for state in new_states)]
+        origin = queue[0].timestamp
+        one_us = timedelta(microseconds=1)
+        # Microseconds since the first sample keep the window boundaries exact
+        timestamps = np.fromiter(
+            ((state.timestamp - origin) // one_us for state in queue),
+            np.int64,
+            len(queue),
+        )
+        if np.any(np.diff(timestamps) < 0):
+            return super()._filter_values(values, new_states)
+        queue_values = np.concatenate(
+            (
+                np.fromiter(
+                    (cast(float, state.state) for state in self.queue),
+                    np.float64,
+                    len(self.queue),
+                ),
+                values,
+            )
+        )
+        window = self._time_window // one_us
+        new_indexes = np.arange(len(self.queue), len(queue))
+
+        # Index of the oldest sample which has not leaked for each new sample
+        lefts = np.searchsorted(
+            timestamps, timestamps[new_indexes] - window, side="right"
+        )
+        if self.last_leak is not None:
+            last_leak_value = cast(float, self.last_leak.state)
+        else:
+            last_leak_value = queue_values[0]
+        prev_values = np.where(
+            lefts > 0, queue_values[np.maximum(lefts - 1, 0)], last_leak_value
+        )
+        # The value of the oldest sample is counted from the window start
+        first = (timestamps[lefts] - (timestamps[new_indexes] - window)) * prev_values
+        # Each later sample counts the value of its predecessor
+        weighted = np.concatenate(
+            ([0.0], np.cumsum(np.diff(timestamps) * queue_values[:-1]))
+        )
+        moving_sums: np.ndarray = first + weighted[new_indexes] - weighted[lefts]
+
+        if (last_left := int(lefts[-1])) > 0:
+            self.last_leak = queue[last_left - 1]
+        self.queue = deque(queue[last_left:])
+        return moving_sums / window
+
 
 @FILTERS.register(FILTER_NAME_THROTTLE)
 class ThrottleFilter(Filter, SensorEntity):
@@ -41,6 +41,10 @@ from .helpers import entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
 
+# Kinds of the compressed states cached on states with State.json_fragment
+HISTORY_COMPRESSED_STATE_JSON = "history_compressed_state"
+HISTORY_COMPRESSED_STATE_NO_ATTRIBUTES_JSON = "history_compressed_state_no_attributes"
+
 
 @dataclass(slots=True)
 class HistoryLiveStream:
@@ -309,18 +313,40 @@ def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, An
     return comp_state
 
 
-def _events_to_compressed_states(
+def _history_compressed_state_json(state: State) -> str:
+    """Convert a state to the json of a compressed state."""
+    return JSON_DUMP(_history_compressed_state(state, False))
+
+
+def _history_compressed_state_no_attributes_json(state: State) -> str:
+    """Convert a state to the json of a compressed state without attributes."""
+    return JSON_DUMP(_history_compressed_state(state, True))
+
+
+def _events_to_compressed_states_json(
     events: Iterable[Event], no_attributes: bool
-) -> MutableMapping[str, list[dict[str, Any]]]:
-    """Convert events to a compressed states."""
-    states_by_entity_ids: dict[str, list[dict[str, Any]]] = {}
+) -> str:
+    """Convert events to the json of compressed states by entity_id.
+
+    The json of each compressed state is cached on the state, so it is
+    shared by all streams.
+    """
+    if no_attributes:
+        kind = HISTORY_COMPRESSED_STATE_NO_ATTRIBUTES_JSON
+        serialize = _history_compressed_state_no_attributes_json
+    else:
+        kind = HISTORY_COMPRESSED_STATE_JSON
+        serialize = _history_compressed_state_json
+    states_by_entity_ids: dict[str, list[str]] = {}
     for event in events:
         state: State = event.data["new_state"]
-        entity_id: str = state.entity_id
-        states_by_entity_ids.setdefault(entity_id, []).append(
-            _history_compressed_state(state, no_attributes)
+        states_by_entity_ids.setdefault(state.entity_id, []).append(
+            state.json_fragment(kind, serialize)
         )
-    return states_by_entity_ids
+    return ",".join(
+        f'{JSON_DUMP(entity_id)}:[{",".join(states)}]'
+        for entity_id, states in states_by_entity_ids.items()
+    )
 
 
 async def _async_events_consumer(
@@ -345,13 +371,10 @@ async def _async_events_consumer(
         while not stream_queue.empty():
             events.append(stream_queue.get_nowait())
 
-        if history_states := _events_to_compressed_states(events, no_attributes):
+        if history_states := _events_to_compressed_states_json(events, no_attributes):
             connection.send_message(
-                JSON_DUMP(
-                    messages.event_message(
-                        msg_id,
-                        {"states": history_states},
-                    )
+                messages.construct_event_message(
+                    msg_id, f'{{"states":{{{history_states}}}}}'
                 )
             )
 
@@ -1,6 +1,6 @@
 """Provide info to system health."""
 from homeassistant.components import system_health
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, callback, json_cache_stats
 from homeassistant.helpers import system_info
 
 
@@ -15,6 +15,7 @@ def async_register(
 async def system_health_info(hass):
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
+    json_cache = json_cache_stats()
 
     return {
         "version": f"core-{info.get('version')}",
@@ -30,4 +31,6 @@ async def system_health_info(hass):
         "arch": info.get("arch"),
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
+        "json_cache_hits": json_cache["hits"],
+        "json_cache_misses": json_cache["misses"],
     }
@@ -1,11 +1,14 @@
 """Support for sending data to an Influx database."""
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import timedelta
 import logging
 import math
+import os
 import queue
 import threading
 import time
@@ -39,10 +42,13 @@ from homeassistant.helpers.entityfilter import (
     convert_include_exclude_filter,
 )
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
 from .const import (
     API_VERSION_2,
+    BATCH_BUFFER_BYTES,
     BATCH_BUFFER_SIZE,
+    BATCH_MAX_LATENCY,
     BATCH_TIMEOUT,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
@@ -58,14 +64,18 @@ from .const import (
     CONF_DEFAULT_MEASUREMENT,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_LINE_PROTOCOL,
+    CONF_MAX_QUEUE_SIZE,
     CONF_MEASUREMENT_ATTR,
     CONF_ORG,
+    CONF_OVERFLOW_POLICY,
     CONF_OVERRIDE_MEASUREMENT,
     CONF_PASSWORD,
     CONF_PATH,
     CONF_PORT,
     CONF_PRECISION,
     CONF_RETRY_COUNT,
+    CONF_SPOOL_FILE,
     CONF_SSL,
     CONF_SSL_CA_CERT,
     CONF_TAGS,
@@ -77,8 +87,13 @@ from .const import (
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
+    DEFAULT_OVERFLOW_POLICY,
     DEFAULT_SSL_V2,
     DOMAIN,
+    DROP_REASON_INVALID,
+    DROP_REASON_OVERFLOW,
+    DROP_REASON_STALE,
+    DROP_REASON_UNREACHABLE,
     EVENT_NEW_STATE,
     INFLUX_CONF_FIELDS,
     INFLUX_CONF_MEASUREMENT,
@@ -87,14 +102,21 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    OVERFLOW_DROP_NEWEST,
+    OVERFLOW_DROP_OLDEST,
+    OVERFLOW_MESSAGE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAYED_MESSAGE,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_ERROR_MESSAGE,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_MAX_BYTES,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
@@ -104,6 +126,25 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_EPOCH = dt_util.utc_from_timestamp(0)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Multiplier and divisor turning microseconds since the epoch into the
+# configured write precision (nanoseconds when no precision is set).
+_LINE_PRECISION = {
+    None: (1000, 1),
+    "ns": (1000, 1),
+    "us": (1, 1),
+    "ms": (1, 1000),
+    "s": (1, 1_000_000),
+}
+
+# Characters escaped in line protocol measurements, tag keys, tag values
+# and field keys, matching the escaping done by the influxdb client.
+_LINE_ESCAPE = str.maketrans(
+    {"\\": "\\\\", " ": "\\ ", ",": "\\,", "=": "\\=", "\n": "\\n"}
+)
+
 
 def create_influx_url(conf: dict) -> dict:
     """Build URL used from config inputs and default when necessary."""
@@ -186,6 +227,12 @@ _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
         vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}): vol.Schema(
             {cv.string: _CUSTOMIZE_ENTITY_SCHEMA}
         ),
+        vol.Optional(CONF_LINE_PROTOCOL, default=False): cv.boolean,
+        vol.Optional(CONF_MAX_QUEUE_SIZE, default=0): cv.positive_int,
+        vol.Optional(CONF_OVERFLOW_POLICY, default=DEFAULT_OVERFLOW_POLICY): vol.In(
+            [OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST]
+        ),
+        vol.Optional(CONF_SPOOL_FILE): cv.string,
     }
 )
 
@@ -321,6 +368,44 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
     return event_to_json
 
 
+def _generate_json_to_line(
+    precision: str | None,
+) -> Callable[[dict[str, Any], bytearray], bool]:
+    """Build a converter appending an event json to a line protocol buffer."""
+    multiplier, divisor = _LINE_PRECISION[precision]
+
+    def json_to_line(json: dict[str, Any], buffer: bytearray) -> bool:
+        """Append the event as a line protocol line, return if it was added."""
+        fields = []
+        for key, value in json[INFLUX_CONF_FIELDS].items():
+            if isinstance(value, str):
+                value = value.replace("\\", "\\\\").replace('"', '\\"')
+                value = value.replace("\n", "\\n")
+                fields.append(f'{str(key).translate(_LINE_ESCAPE)}="{value}"')
+            elif math.isfinite(value := float(value)):
+                fields.append(f"{str(key).translate(_LINE_ESCAPE)}={value!r}")
+        if not fields:
+            return False
+
+        line = str(json[INFLUX_CONF_MEASUREMENT]).translate(_LINE_ESCAPE)
+        for key, value in sorted(json[INFLUX_CONF_TAGS].items()):
+            if key != "" and value not in (None, ""):
+                line += (
+                    f",{str(key).translate(_LINE_ESCAPE)}"
+                    f"={str(value).translate(_LINE_ESCAPE)}"
+                )
+
+        time_fired = json[INFLUX_CONF_TIME]
+        if not isinstance(time_fired, int):
+            micros = (time_fired - _EPOCH) // _ONE_MICROSECOND
+            time_fired = micros * multiplier // divisor
+
+        buffer += f"{line} {','.join(fields)} {time_fired}\n".encode()
+        return True
+
+    return json_to_line
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
@@ -351,7 +436,9 @@ def get_influx_connection(  # noqa: C901
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
+        # Spooling needs failed writes to raise in the writing thread
+        write_mode = SYNCHRONOUS if CONF_SPOOL_FILE in conf else ASYNCHRONOUS
+        initial_write_mode = SYNCHRONOUS if test_write else write_mode
         write_api = influx.write_api(write_options=initial_write_mode)
 
         def write_v2(json):
@@ -391,7 +478,7 @@ def get_influx_connection(  # noqa: C901
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
+            write_api = influx.write_api(write_options=write_mode)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -434,7 +521,14 @@ def get_influx_connection(  # noqa: C901
     def write_v1(json):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            if isinstance(json, bytes):
+                influx.write_points(
+                    json.decode().rstrip("\n"),
+                    time_precision=precision,
+                    protocol="line",
+                )
+            else:
+                influx.write_points(json, time_precision=precision)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -492,8 +586,22 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         return True
 
     event_to_json = _generate_event_to_json(conf)
+    json_to_line = _generate_json_to_line(conf.get(CONF_PRECISION))
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool_path = None
+    if CONF_SPOOL_FILE in conf:
+        spool_path = hass.config.path(conf[CONF_SPOOL_FILE])
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        json_to_line,
+        line_protocol=conf[CONF_LINE_PROTOCOL],
+        max_queue_size=conf[CONF_MAX_QUEUE_SIZE],
+        overflow_policy=conf[CONF_OVERFLOW_POLICY],
+        spool_path=spool_path,
+    )
     instance.start()
 
     def shutdown(event):
@@ -510,39 +618,91 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self,
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        json_to_line=None,
+        *,
+        line_protocol=False,
+        max_queue_size=0,
+        overflow_policy=DEFAULT_OVERFLOW_POLICY,
+        spool_path=None,
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
-        self.queue = queue.Queue()
+        self.queue = queue.Queue(max_queue_size)
         self.influx = influx
         self.event_to_json = event_to_json
+        self.json_to_line = json_to_line or _generate_json_to_line(None)
         self.max_tries = max_tries
         self.write_errors = 0
         self.shutdown = False
+        # Line protocol mode encodes straight into one reused buffer
+        self.buffer = bytearray() if line_protocol else None
+        self.overflow_policy = overflow_policy
+        self.dropped: Counter[str] = Counter()
+        self._reported_overflow = 0
+        self.spool_path = spool_path
+        self.spool_bytes = 0
+        self.spooled_events = 0
+        if spool_path is not None:
+            with suppress(OSError):
+                self.spool_bytes = os.path.getsize(spool_path)
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
     def _event_listener(self, event):
         """Listen for new messages on the bus and queue them for Influx."""
         item = (time.monotonic(), event)
-        self.queue.put(item)
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.dropped[DROP_REASON_OVERFLOW] += 1
+            if self.overflow_policy == OVERFLOW_DROP_NEWEST:
+                return
+            with suppress(queue.Empty):
+                oldest = self.queue.get_nowait()
+                self.queue.task_done()
+                if oldest is None:
+                    # Never lose the shutdown marker, drop the new event instead
+                    item = None
+            with suppress(queue.Full):
+                self.queue.put_nowait(item)
 
     @staticmethod
     def batch_timeout():
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
+    def _batch_full(self, events, deadline):
+        """Return if the current batch should be flushed."""
+        if self.buffer is None:
+            return events >= BATCH_BUFFER_SIZE
+        return len(self.buffer) >= BATCH_BUFFER_BYTES or (
+            deadline is not None and time.monotonic() >= deadline
+        )
+
     def get_events_json(self):
-        """Return a batch of events formatted for writing."""
+        """Return a batch of events formatted for writing.
+
+        In line protocol mode the batch is returned as encoded bytes,
+        otherwise as a list of json dicts.
+        """
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
+        events = 0
         json = []
+        buffer = self.buffer
+        deadline = None
 
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while not self._batch_full(events, deadline) and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -552,33 +712,55 @@ class InfluxThread(threading.Thread):
                 else:
                     timestamp, event = item
                     age = time.monotonic() - timestamp
+                    if deadline is None:
+                        deadline = timestamp + BATCH_MAX_LATENCY
 
                     if age < queue_seconds:
                         event_json = self.event_to_json(event)
-                        if event_json:
+                        if not event_json:
+                            continue
+                        if buffer is None:
                             json.append(event_json)
+                            events += 1
+                        elif self.json_to_line(event_json, buffer):
+                            events += 1
                     else:
                         dropped += 1
 
         if dropped:
+            self.dropped[DROP_REASON_STALE] += dropped
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
-        return count, json
+        if (overflow := self.dropped[DROP_REASON_OVERFLOW]) > self._reported_overflow:
+            _LOGGER.warning(OVERFLOW_MESSAGE, overflow - self._reported_overflow)
+            self._reported_overflow = overflow
+
+        if buffer is not None:
+            json = bytes(buffer)
+            buffer.clear()
 
-    def write_to_influxdb(self, json):
+        return count, events, json
+
+    def write_to_influxdb(self, json, events=None):
         """Write preprocessed events to influxdb, with retry."""
+        if events is None:
+            events = len(json)
         for retry in range(self.max_tries + 1):
             try:
                 self.influx.write(json)
 
                 if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
+                    if lost := self.write_errors - self.spooled_events:
+                        _LOGGER.error(RESUMED_MESSAGE, lost)
+                    self.write_errors = self.spooled_events = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                _LOGGER.debug(WROTE_MESSAGE, events)
+                if self.spool_bytes:
+                    self._replay_spool()
                 break
             except ValueError as err:
                 _LOGGER.error(err)
+                self.dropped[DROP_REASON_INVALID] += events
                 break
             except ConnectionError as err:
                 if retry < self.max_tries:
@@ -586,14 +768,85 @@ class InfluxThread(threading.Thread):
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    self.write_errors += events
+                    if self._spool(json):
+                        self.spooled_events += events
+                    else:
+                        self.dropped[DROP_REASON_UNREACHABLE] += events
+
+    def _spool(self, json):
+        """Append a batch that could not be written to the spool file."""
+        if self.spool_path is None:
+            return False
+
+        if isinstance(json, list):
+            buffer = bytearray()
+            for event_json in json:
+                self.json_to_line(event_json, buffer)
+            json = bytes(buffer)
+
+        if self.spool_bytes + len(json) > SPOOL_MAX_BYTES:
+            if self.spool_bytes <= SPOOL_MAX_BYTES:
+                _LOGGER.warning(SPOOL_FULL_MESSAGE, self.spool_path)
+                # Only warn once until the spool has been replayed
+                self.spool_bytes = SPOOL_MAX_BYTES + 1
+            return False
+
+        try:
+            with open(self.spool_path, "ab") as spool:
+                spool.write(json)
+        except OSError as err:
+            _LOGGER.error(SPOOL_ERROR_MESSAGE, self.spool_path, err)
+            return False
+
+        self.spool_bytes += len(json)
+        return True
+
+    def _replay_spool(self):
+        """Write spooled batches now that InfluxDB is reachable again."""
+        replayed = 0
+        try:
+            with open(self.spool_path, "rb") as spool:
+                while True:
+                    position = spool.tell()
+                    if not (chunk := spool.read(BATCH_BUFFER_BYTES)):
+                        break
+                    # Never split a line between two writes
+                    chunk += spool.readline()
+                    try:
+                        self.influx.write(chunk)
+                    except ValueError as err:
+                        _LOGGER.error(err)
+                    except ConnectionError:
+                        spool.seek(position)
+                        self._keep_spool_remainder(spool)
+                        return
+                    replayed += len(chunk)
+            os.remove(self.spool_path)
+        except OSError as err:
+            _LOGGER.error(SPOOL_ERROR_MESSAGE, self.spool_path, err)
+            return
+        finally:
+            if replayed:
+                _LOGGER.info(REPLAYED_MESSAGE, replayed)
+
+        self.spool_bytes = 0
+
+    def _keep_spool_remainder(self, spool):
+        """Replace the spool file with what was not replayed yet."""
+        remainder_path = f"{self.spool_path}.tmp"
+        with open(remainder_path, "wb") as remainder:
+            while chunk := spool.read(BATCH_BUFFER_BYTES):
+                remainder.write(chunk)
+            self.spool_bytes = remainder.tell()
+        os.replace(remainder_path, self.spool_path)
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
-            count, json = self.get_events_json()
+            count, events, json = self.get_events_json()
             if json:
-                self.write_to_influxdb(json)
+                self.write_to_influxdb(json, events)
             for _ in range(count):
                 self.queue.task_done()
 
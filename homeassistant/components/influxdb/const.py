@@ -32,6 +32,10 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_LINE_PROTOCOL = "line_protocol"
+CONF_MAX_QUEUE_SIZE = "max_queue_size"
+CONF_OVERFLOW_POLICY = "overflow_policy"
+CONF_SPOOL_FILE = "spool_file"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -59,6 +63,7 @@ DEFAULT_RANGE_START = "-15m"
 DEFAULT_RANGE_STOP = "now()"
 DEFAULT_FUNCTION_FLUX = "|> limit(n: 1)"
 DEFAULT_MEASUREMENT_ATTR = "unit_of_measurement"
+DEFAULT_OVERFLOW_POLICY = "drop_oldest"
 
 INFLUX_CONF_MEASUREMENT = "measurement"
 INFLUX_CONF_TAGS = "tags"
@@ -78,6 +83,15 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+BATCH_BUFFER_BYTES = 256 * 1024
+BATCH_MAX_LATENCY = 10  # seconds
+SPOOL_MAX_BYTES = 64 * 1024 * 1024
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+DROP_REASON_INVALID = "invalid"
+DROP_REASON_OVERFLOW = "overflow"
+DROP_REASON_STALE = "stale"
+DROP_REASON_UNREACHABLE = "unreachable"
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -120,6 +134,10 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+OVERFLOW_MESSAGE = "Queue is full, dropped %d events."
+SPOOL_FULL_MESSAGE = "Spool file %s is full, not spooling more events."
+SPOOL_ERROR_MESSAGE = "Could not access spool file %s: %s"
+REPLAYED_MESSAGE = "Replayed %d bytes of spooled events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
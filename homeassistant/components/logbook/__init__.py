@@ -11,7 +11,7 @@ from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN
 from homeassistant.components.recorder.filters import (
     extract_include_exclude_filter_conf,
     merge_include_exclude_filters,
-    sqlalchemy_filter_from_include_exclude_conf,
+    sqlalchemy_filter_from_entity_filter,
 )
 from homeassistant.const import (
     ATTR_DOMAIN,
@@ -126,7 +126,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     possible_merged_entities_filter = convert_include_exclude_filter(merged_filter)
     if not possible_merged_entities_filter.empty_filter:
-        filters = sqlalchemy_filter_from_include_exclude_conf(merged_filter)
+        filters = sqlalchemy_filter_from_entity_filter(possible_merged_entities_filter)
         entities_filter = possible_merged_entities_filter.get_filter()
     else:
         filters = None
@@ -182,8 +182,22 @@ def webhook_response(
     headers: Mapping[str, str] | None = None,
 ) -> Response:
     """Return a encrypted response if registration supports it."""
-    data = json.dumps(data, cls=JSONEncoder)
+    return webhook_json_response(
+        json.dumps(data, cls=JSONEncoder),
+        registration=registration,
+        status=status,
+        headers=headers,
+    )
 
+
+def webhook_json_response(
+    data: str,
+    *,
+    registration: Mapping[str, Any],
+    status: HTTPStatus = HTTPStatus.OK,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Return a encrypted response of serialized data if registration supports it."""
     if registration[ATTR_SUPPORTS_ENCRYPTION]:
         keylen, encrypt = setup_encrypt(
             HexEncoder if ATTR_NO_LEGACY_ENCRYPTION in registration else RawEncoder
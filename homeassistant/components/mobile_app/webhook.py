@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Coroutine
 from contextlib import suppress
-from functools import lru_cache, wraps
+from functools import wraps
 from http import HTTPStatus
 import logging
 import secrets
@@ -115,6 +115,7 @@ from .helpers import (
     registration_context,
     safe_registration,
     supports_encryption,
+    webhook_json_response,
     webhook_response,
 )
 
@@ -365,12 +366,6 @@ async def webhook_stream_camera(
     return webhook_response(resp, registration=config_entry.data)
 
 
-@lru_cache
-def _cached_template(template_str: str, hass: HomeAssistant) -> template.Template:
-    """Return a cached template."""
-    return template.Template(template_str, hass)
-
-
 @WEBHOOK_COMMANDS.register("render_template")
 @validate_schema(
     {
@@ -387,7 +382,7 @@ async def webhook_render_template(
     resp = {}
     for key, item in data.items():
         try:
-            tpl = _cached_template(item[ATTR_TEMPLATE], hass)
+            tpl = template.Template(item[ATTR_TEMPLATE], hass)
             resp[key] = tpl.async_render(item.get(ATTR_TEMPLATE_VARIABLES))
         except TemplateError as ex:
             resp[key] = {"error": str(ex)}
@@ -720,7 +715,10 @@ async def webhook_get_zones(
         hass.states.get(entity_id)
         for entity_id in sorted(hass.states.async_entity_ids(ZONE_DOMAIN))
     ]
-    return webhook_response(zones, registration=config_entry.data)
+    return webhook_json_response(
+        f'[{",".join(zone.as_dict_json() for zone in zones if zone)}]',
+        registration=config_entry.data,
+    )
 
 
 @WEBHOOK_COMMANDS.register("get_config")
@@ -79,6 +79,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -89,7 +90,7 @@ from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import PendingState, StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -216,6 +217,9 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._bulk_insert_rows = 0
+        self._bulk_insert_seconds = 0.0
+        self.purge_progress: PurgeProgress | None = None
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -1062,8 +1066,32 @@ class Recorder(threading.Thread):
 
         self._add_to_session(session, dbevent)
 
+    @property
+    def _bulk_insert_states(self) -> bool:
+        """Return if states are written with bulk inserts instead of the ORM.
+
+        Bulk inserts need the current schema and a dialect that can return
+        the ids of the rows written by an executemany in parameter order.
+        """
+        return bool(
+            self.schema_version == SCHEMA_VERSION
+            and self.engine is not None
+            and self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
+
+    @property
+    def state_rows_per_second(self) -> float | None:
+        """Return the throughput of the bulk state inserts."""
+        if not self._bulk_insert_seconds:
+            return None
+        return self._bulk_insert_rows / self._bulk_insert_seconds
+
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
+        if self._bulk_insert_states:
+            self._process_state_changed_event_into_bulk_insert(event)
+            return
+
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
         entity_removed = not event.data.get("new_state")
@@ -1073,7 +1101,7 @@ class Recorder(threading.Thread):
 
         states_manager = self.states_manager
         if old_state := states_manager.pop_pending(entity_id):
-            dbstate.old_state = old_state
+            dbstate.old_state = cast(States, old_state)
         elif old_state_id := states_manager.pop_committed(entity_id):
             dbstate.old_state_id = old_state_id
         if entity_removed:
@@ -1135,6 +1163,80 @@ class Recorder(threading.Thread):
 
         self._add_to_session(session, dbstate)
 
+    def _process_state_changed_event_into_bulk_insert(self, event: Event) -> None:
+        """Process a state_changed event into the next bulk insert.
+
+        The StatesMeta and StateAttributes rows are still added to the
+        session, but the state itself is queued in the states manager and
+        written with an executemany when the session is committed.
+        """
+        state_attributes_manager = self.state_attributes_manager
+        states_meta_manager = self.states_meta_manager
+        states_manager = self.states_manager
+        entity_removed = not event.data.get("new_state")
+        entity_id = event.data["entity_id"]
+
+        pending_state = PendingState.from_event(event)
+        row = pending_state.row
+        if old_state := states_manager.pop_pending(entity_id):
+            pending_state.old_state = old_state
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            row["old_state_id"] = old_state_id
+
+        if not states_meta_manager.active:
+            row["entity_id"] = entity_id
+
+        if entity_id is None or not (
+            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
+        ):
+            return
+
+        assert self.event_session is not None
+        session = self.event_session
+        # Map the entity_id to the StatesMeta table
+        if pending_states_meta := states_meta_manager.get_pending(entity_id):
+            pending_state.states_meta = pending_states_meta
+        elif metadata_id := states_meta_manager.get(entity_id, session, True):
+            row["metadata_id"] = metadata_id
+        elif states_meta_manager.active and entity_removed:
+            # If the entity was removed and does not have a metadata_id
+            # allocated to it, it either never existed or was just renamed.
+            return
+        else:
+            states_meta = StatesMeta(entity_id=entity_id)
+            states_meta_manager.add_pending(states_meta)
+            self._add_to_session(session, states_meta)
+            pending_state.states_meta = states_meta
+
+        # Map the event data to the StateAttributes table
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
+        # Matching attributes found in the pending commit
+        if pending_attributes := state_attributes_manager.get_pending(shared_attrs):
+            pending_state.state_attributes = pending_attributes
+        # Matching attributes id found in the cache
+        elif (
+            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
+        ) or (
+            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+            and (
+                attributes_id := state_attributes_manager.get(
+                    shared_attrs, hash_, session
+                )
+            )
+        ):
+            row["attributes_id"] = attributes_id
+        else:
+            # No matching attributes found, save them in the DB
+            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+            state_attributes_manager.add_pending(dbstate_attributes)
+            self._add_to_session(session, dbstate_attributes)
+            pending_state.state_attributes = dbstate_attributes
+
+        if not entity_removed:
+            states_manager.add_pending(entity_id, pending_state)
+        states_manager.queue_insert(pending_state)
+        self._event_session_has_pending_writes = True
+
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -1172,7 +1274,17 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
-        session.commit()
+        if self.states_manager.has_queued:
+            start = time.monotonic()
+            # Flush first so the pending StatesMeta and
+            # StateAttributes rows are assigned their ids
+            session.flush()
+            rows = self.states_manager.insert_queued(session)
+            session.commit()
+            self._bulk_insert_rows += rows
+            self._bulk_insert_seconds += time.monotonic() - start
+        else:
+            session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -8,7 +8,16 @@ from sqlalchemy import Column, Text, cast, not_, or_
 from sqlalchemy.sql.elements import ColumnElement
 
 from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
-from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
+from homeassistant.helpers.entityfilter import (
+    CONF_ENTITY_GLOBS,
+    CONF_EXCLUDE_DOMAINS,
+    CONF_EXCLUDE_ENTITIES,
+    CONF_EXCLUDE_ENTITY_GLOBS,
+    CONF_INCLUDE_DOMAINS,
+    CONF_INCLUDE_ENTITIES,
+    CONF_INCLUDE_ENTITY_GLOBS,
+    EntityFilter,
+)
 from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.typing import ConfigType
 
@@ -76,6 +85,25 @@ def sqlalchemy_filter_from_include_exclude_conf(conf: ConfigType) -> Filters | N
     return filters if filters.has_config else None
 
 
+def sqlalchemy_filter_from_entity_filter(entity_filter: EntityFilter) -> Filters | None:
+    """Build a sql filter which matches the same entities as an entity filter.
+
+    This pushes the filter down to the database, so rows which the entity
+    filter would discard are never fetched.
+    """
+    if entity_filter.empty_filter:
+        return None
+    config = entity_filter.config
+    return Filters(
+        excluded_entities=config[CONF_EXCLUDE_ENTITIES],
+        excluded_domains=config[CONF_EXCLUDE_DOMAINS],
+        excluded_entity_globs=config[CONF_EXCLUDE_ENTITY_GLOBS],
+        included_entities=config[CONF_INCLUDE_ENTITIES],
+        included_domains=config[CONF_INCLUDE_DOMAINS],
+        included_entity_globs=config[CONF_INCLUDE_ENTITY_GLOBS],
+    )
+
+
 class Filters:
     """Container for the configured include and exclude filters.
 
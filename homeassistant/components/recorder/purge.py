@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
-from itertools import zip_longest
 import logging
 import time
 from typing import TYPE_CHECKING
@@ -16,9 +16,7 @@ from .const import SQLITE_MAX_BIND_VARS
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
-    attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
-    data_ids_exist_in_events,
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
@@ -32,14 +30,18 @@ from .queries import (
     disconnect_states_rows,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
+    find_events_id_range_to_purge,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
     find_short_term_statistics_to_purge,
+    find_states_id_range_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_unused_attributes_ids,
+    find_unused_data_ids,
 )
 from .repack import repack_database
 from .util import chunked, retryable_database_job, session_scope
@@ -53,6 +55,28 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Stop starting new batches once a purge task ran this long, so the
+# recorder queue is processed in between
+PURGE_SLICE_SECONDS = 5
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of purging the states and events before purge_before."""
+
+    purge_before: datetime
+    purged_rows: int = 0
+    purge_seconds: float = 0.0
+    estimated_remaining_rows: int | None = None
+    completed: bool = False
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the number of rows deleted per second of purging."""
+        if not self.purge_seconds:
+            return None
+        return self.purged_rows / self.purge_seconds
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -71,6 +95,39 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    if (
+        progress := instance.purge_progress
+    ) is None or progress.purge_before != purge_before:
+        progress = instance.purge_progress = PurgeProgress(purge_before)
+    slice_start = time.monotonic()
+    try:
+        return _purge_old_data_slice(
+            instance,
+            progress,
+            slice_start + PURGE_SLICE_SECONDS,
+            repack,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+        )
+    finally:
+        progress.purge_seconds += time.monotonic() - slice_start
+
+
+def _purge_old_data_slice(
+    instance: Recorder,
+    progress: PurgeProgress,
+    slice_end: float,
+    repack: bool,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+) -> bool:
+    """Purge a slice of the events and states older than purge_before.
+
+    No new batches of states or events are started after slice_end.
+    """
+    purge_before = progress.purge_before
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of SQLITE_MAX_BIND_VARS, based on the oldest states or events record
         has_more_to_purge = False
@@ -86,11 +143,14 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
+            progress.estimated_remaining_rows = _estimate_rows_to_purge(
+                session, purge_before
+            )
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, progress, states_batch_size, slice_end
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, progress, events_batch_size, slice_end
             )
 
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
@@ -121,11 +181,27 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
+    progress.estimated_remaining_rows = 0
+    progress.completed = True
     if repack:
         repack_database(instance)
     return True
 
 
+def _estimate_rows_to_purge(session: Session, purge_before: datetime) -> int:
+    """Estimate the number of states and events to purge from their id ranges."""
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    estimate = 0
+    for query in (
+        find_states_id_range_to_purge(purge_before_ts),
+        find_events_id_range_to_purge(purge_before_ts),
+    ):
+        oldest_id, newest_id = session.execute(query).one()
+        if oldest_id is not None and newest_id is not None:
+            estimate += newest_id - oldest_id + 1
+    return estimate
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -174,8 +250,9 @@ def _purge_legacy_format(
 def _purge_states_and_attributes_ids(
     instance: Recorder,
     session: Session,
+    progress: PurgeProgress,
     states_batch_size: int,
-    purge_before: datetime,
+    slice_end: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -191,15 +268,20 @@ def _purge_states_and_attributes_ids(
     attributes_ids_batch: set[int] = set()
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before
+            session, progress.purge_before
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.purged_rows += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if time.monotonic() > slice_end:
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    progress.purged_rows += _purge_unused_attributes_ids(
+        instance, session, attributes_ids_batch
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -210,8 +292,9 @@ def _purge_states_and_attributes_ids(
 def _purge_events_and_data_ids(
     instance: Recorder,
     session: Session,
+    progress: PurgeProgress,
     events_batch_size: int,
-    purge_before: datetime,
+    slice_end: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -224,14 +307,19 @@ def _purge_events_and_data_ids(
     # SQLITE_MAX_BIND_VARS
     data_ids_batch: set[int] = set()
     for _ in range(events_batch_size):
-        event_ids, data_ids = _select_event_data_ids_to_purge(session, purge_before)
+        event_ids, data_ids = _select_event_data_ids_to_purge(
+            session, progress.purge_before
+        )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.purged_rows += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if time.monotonic() > slice_end:
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    progress.purged_rows += _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -304,42 +392,28 @@ def _select_unused_attributes_ids(
                 attributes_ids_exist_in_states_with_fast_in_distinct(attributes_ids)
             ).all()
         }
+        to_remove = attributes_ids - seen_ids
     else:
         #
         # This branch is for DBMS that cannot optimize the distinct query well and has
         # to examine all the rows that match.
         #
-        # This branch uses a union of simple queries, as each query is optimized away
-        # as the answer to the query can be found in the index.
-        #
-        # The below query works for SQLite as long as there are no more than 500
-        # attributes_id to be selected. We currently do not have MySQL or PostgreSQL
-        # servers running in the test suite; we test this path using SQLite when there
-        # are less than 500 attributes_id.
-        #
-        # How MariaDB's query optimizer handles this query:
-        # > explain select min(attributes_id) from states where attributes_id = 136723;
-        # ...Select tables optimized away
-        #
-        # We used to generate a query based on how many attribute_ids to find but
-        # that meant sqlalchemy Transparent SQL Compilation Caching was working against
-        # us by cached up to SQLITE_MAX_BIND_VARS different statements which could be
-        # up to 500MB for large database due to the complexity of the ORM objects.
+        # An anti-join of the candidate state_attributes rows against the states
+        # returns the unused ids directly. The database only has to find the first
+        # state using each id in the index, and the ids are checked in batches of
+        # SQLITE_MAX_BIND_VARS instead of a subquery per id.
         #
-        # We now break the query into groups of 100 and use a lambda_stmt to ensure
-        # that the query is only cached once.
+        # The in clause is an expanding bind parameter in a lambda_stmt, so the
+        # statement is only cached once no matter how many ids are checked.
         #
-        seen_ids = set()
-        groups = [iter(attributes_ids)] * 100
-        for attr_ids in zip_longest(*groups, fillvalue=None):
-            seen_ids |= {
-                attrs_id[0]
-                for attrs_id in session.execute(
-                    attributes_ids_exist_in_states(*attr_ids)  # type: ignore[arg-type]
+        to_remove = set()
+        for attrs_ids_chunk in chunked(attributes_ids, SQLITE_MAX_BIND_VARS):
+            to_remove.update(
+                attrs_id
+                for (attrs_id,) in session.execute(
+                    find_unused_attributes_ids(attrs_ids_chunk)
                 ).all()
-                if attrs_id[0] is not None
-            }
-    to_remove = attributes_ids - seen_ids
+            )
     _LOGGER.debug(
         "Selected %s shared attributes to remove",
         len(to_remove),
@@ -351,14 +425,15 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
+) -> int:
+    """Purge unused attributes ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         session, attributes_ids_batch, database_engine
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return len(unused_attribute_ids_set)
 
 
 def _select_unused_event_data_ids(
@@ -377,31 +452,31 @@ def _select_unused_event_data_ids(
                 data_ids_exist_in_events_with_fast_in_distinct(data_ids)
             ).all()
         }
+        to_remove = data_ids - seen_ids
     else:
-        seen_ids = set()
-        groups = [iter(data_ids)] * 100
-        for data_ids_group in zip_longest(*groups, fillvalue=None):
-            seen_ids |= {
-                data_id[0]
-                for data_id in session.execute(
-                    data_ids_exist_in_events(*data_ids_group)  # type: ignore[arg-type]
+        to_remove = set()
+        for data_ids_chunk in chunked(data_ids, SQLITE_MAX_BIND_VARS):
+            to_remove.update(
+                data_id
+                for (data_id,) in session.execute(
+                    find_unused_data_ids(data_ids_chunk)
                 ).all()
-                if data_id[0] is not None
-            }
-    to_remove = data_ids - seen_ids
+            )
     _LOGGER.debug("Selected %s shared event data to remove", len(to_remove))
     return to_remove
 
 
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
-) -> None:
+) -> int:
+    """Purge unused event data ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_data_ids_set := _select_unused_event_data_ids(
         session, data_ids_batch, database_engine
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    return len(unused_data_ids_set)
 
 
 def _select_statistics_runs_to_purge(
@@ -51,6 +51,13 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
         db_engine_info["database_engine"] = dialect_name.value
     if database_engine := instance.database_engine:
         db_engine_info["database_version"] = str(database_engine.version)
+    if (state_rows_per_second := instance.state_rows_per_second) is not None:
+        db_engine_info["state_rows_per_second"] = f"{state_rows_per_second:.1f}"
+    if purge_progress := instance.purge_progress:
+        if (purge_rows_per_second := purge_progress.rows_per_second) is not None:
+            db_engine_info["purge_rows_per_second"] = f"{purge_rows_per_second:.1f}"
+        if (remaining_rows := purge_progress.estimated_remaining_rows) is not None:
+            db_engine_info["purge_estimated_remaining_rows"] = remaining_rows
     return db_engine_info
 
 
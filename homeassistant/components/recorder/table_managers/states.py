@@ -1,7 +1,68 @@
 """Support managing States."""
 from __future__ import annotations
 
-from ..db_schema import States
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, State
+import homeassistant.util.dt as dt_util
+
+from ..db_schema import EVENT_ORIGIN_TO_IDX, StateAttributes, States, StatesMeta
+from ..models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+
+class PendingState:
+    """A state that is waiting to be written with a bulk insert.
+
+    The ids of the related rows are not known until the pending
+    StatesMeta, StateAttributes and old state have been written, so
+    they are resolved when the row is inserted.
+    """
+
+    __slots__ = ("row", "old_state", "states_meta", "state_attributes", "state_id")
+
+    def __init__(self, row: dict[str, Any]) -> None:
+        """Initialize the pending state."""
+        self.row = row
+        self.old_state: PendingState | States | None = None
+        self.states_meta: StatesMeta | None = None
+        self.state_attributes: StateAttributes | None = None
+        self.state_id: int | None = None
+
+    @staticmethod
+    def from_event(event: Event) -> PendingState:
+        """Create a pending state from a state_changed event.
+
+        Every row has the same keys so all the rows of a
+        commit can be written with a single executemany.
+        """
+        state: State | None = event.data.get("new_state")
+        context = event.context
+        row: dict[str, Any] = {
+            "entity_id": None,
+            "state": None,
+            "last_updated_ts": None,
+            "last_changed_ts": None,
+            "old_state_id": None,
+            "attributes_id": None,
+            "metadata_id": None,
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+        }
+        # None state means the state was removed from the state machine
+        if state is None:
+            row["last_updated_ts"] = dt_util.utc_to_timestamp(event.time_fired)
+            return PendingState(row)
+
+        row["state"] = state.state
+        row["last_updated_ts"] = dt_util.utc_to_timestamp(state.last_updated)
+        if state.last_updated != state.last_changed:
+            row["last_changed_ts"] = dt_util.utc_to_timestamp(state.last_changed)
+        return PendingState(row)
 
 
 class StatesManager:
@@ -9,10 +70,16 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, States | PendingState] = {}
         self._last_committed_id: dict[str, int] = {}
+        self._queued: list[PendingState] = []
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    @property
+    def has_queued(self) -> bool:
+        """Return if there are states waiting for a bulk insert."""
+        return bool(self._queued)
+
+    def pop_pending(self, entity_id: str) -> States | PendingState | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -33,7 +100,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: States | PendingState) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -43,6 +110,61 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def queue_insert(self, pending_state: PendingState) -> None:
+        """Queue a state to be written by the next bulk insert.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._queued.append(pending_state)
+
+    def insert_queued(self, session: Session) -> int:
+        """Write the queued states with one executemany insert per generation.
+
+        The session must be flushed before calling this so the
+        pending StatesMeta and StateAttributes rows have ids.
+
+        A state can only be written once the state it replaces has
+        a state_id, so when an entity changed more than once since the
+        last commit its later states are written in a following
+        generation. Returns the number of rows written.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        stmt = insert(States.__table__).returning(  # type: ignore[arg-type]
+            States.state_id, sort_by_parameter_order=True
+        )
+        # If a previous attempt to commit failed the ids were rolled back
+        for pending_state in self._queued:
+            pending_state.state_id = None
+        generation = self._queued
+        while generation:
+            rows: list[dict[str, Any]] = []
+            inserting: list[PendingState] = []
+            deferred: list[PendingState] = []
+            for pending_state in generation:
+                row = pending_state.row
+                if (old_state := pending_state.old_state) is not None:
+                    if old_state.state_id is None and isinstance(
+                        old_state, PendingState
+                    ):
+                        deferred.append(pending_state)
+                        continue
+                    row["old_state_id"] = old_state.state_id
+                if (states_meta := pending_state.states_meta) is not None:
+                    row["metadata_id"] = states_meta.metadata_id
+                if (state_attributes := pending_state.state_attributes) is not None:
+                    row["attributes_id"] = state_attributes.attributes_id
+                rows.append(row)
+                inserting.append(pending_state)
+            for pending_state, state_id in zip(
+                inserting, session.execute(stmt, rows).scalars()
+            ):
+                pending_state.state_id = state_id
+            generation = deferred
+        return len(self._queued)
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the state_id of the new States into committed.
 
@@ -50,8 +172,10 @@ class StatesManager:
         recorder thread.
         """
         for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+            if (state_id := db_states.state_id) is not None:
+                self._last_committed_id[entity_id] = state_id
         self._pending.clear()
+        self._queued.clear()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -61,6 +185,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._queued.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
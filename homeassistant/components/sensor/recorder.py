@@ -7,6 +7,7 @@ import datetime
 import itertools
 import logging
 import math
+import threading
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -25,12 +26,13 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import Event, HomeAssistant, State, callback, split_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.util import dt as dt_util
@@ -71,6 +73,15 @@ WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+DATA_STATISTICS_ACCUMULATOR = "sensor_statistics_accumulator"
+STATISTICS_PERIOD = datetime.timedelta(minutes=5)
+# Number of completed periods kept in memory if they are never compiled
+MAX_ACCUMULATED_PERIODS = 12
+
+# A numeric sensor state and if it is a significant change (not only an
+# attribute change)
+_AccumulatedState = tuple[float, State, bool]
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -84,6 +95,134 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
+def _period_start(time: datetime.datetime) -> datetime.datetime:
+    """Return the start of the 5-minute statistics period time falls in."""
+    return time.replace(minute=time.minute - time.minute % 5, second=0, microsecond=0)
+
+
+def _accumulated_state(state: State, significant: bool) -> _AccumulatedState | None:
+    """Return the state as an accumulated state, or None if it's not numeric."""
+    if (fstate := _float_or_none(state.state)) is None:
+        return None
+    return (fstate, state, significant)
+
+
+class SensorStatisticsAccumulator:
+    """Collect numeric sensor states per 5-minute period as they change.
+
+    When a period has been followed from its start, compiling its statistics
+    uses the collected states instead of reading the history back from the
+    database. Periods before the accumulator started, for example the ones
+    missed while Home Assistant was not running, still read the database.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator."""
+        self.hass = hass
+        # States are added in the event loop and read in the recorder thread
+        self._lock = threading.Lock()
+        self._period_start: datetime.datetime | None = None
+        self._covered_from: datetime.datetime | None = None
+        self._period: dict[str, list[_AccumulatedState]] = {}
+        self._last_states: dict[str, _AccumulatedState | None] = {}
+        self._completed: dict[
+            datetime.datetime, dict[str, list[_AccumulatedState]]
+        ] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Start collecting sensor states."""
+        period_start = _period_start(dt_util.utcnow())
+        with self._lock:
+            self._period_start = period_start
+            # The current period has been partly missed
+            self._covered_from = period_start + STATISTICS_PERIOD
+            for state in self.hass.states.async_all(DOMAIN):
+                self._last_states[state.entity_id] = _accumulated_state(state, True)
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_sensor_filter,
+            run_immediately=True,
+        )
+
+    @callback
+    def _async_sensor_filter(self, event: Event) -> bool:
+        """Only collect sensor states."""
+        return split_entity_id(event.data["entity_id"])[0] == DOMAIN
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Add a changed sensor state to the current period."""
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data["new_state"]
+        with self._lock:
+            if new_state is None:
+                self._last_states.pop(entity_id, None)
+                return
+            assert self._period_start is not None
+            assert self._covered_from is not None
+            last_updated = new_state.last_updated
+            if last_updated < self._period_start:
+                # A state from a period which was already closed, don't trust
+                # the collected states before the next period
+                self._covered_from = max(
+                    self._covered_from, self._period_start + STATISTICS_PERIOD
+                )
+            else:
+                self._roll(_period_start(last_updated))
+            accumulated = _accumulated_state(
+                new_state, new_state.last_changed == last_updated
+            )
+            self._last_states[entity_id] = accumulated
+            period_states = self._period.setdefault(entity_id, [])
+            if accumulated is not None:
+                period_states.append(accumulated)
+
+    def _roll(self, period_start: datetime.datetime) -> None:
+        """Close periods until period_start is the current period."""
+        assert self._period_start is not None
+        if period_start - self._period_start > STATISTICS_PERIOD * (
+            MAX_ACCUMULATED_PERIODS + 1
+        ):
+            # Skip over periods which would be pruned anyway
+            self._period_start = period_start - STATISTICS_PERIOD
+        while self._period_start < period_start:
+            self._completed[self._period_start] = self._period
+            self._period_start += STATISTICS_PERIOD
+            # Each period starts with the last state before it
+            self._period = {
+                entity_id: [] if last is None else [(last[0], last[1], True)]
+                for entity_id, last in self._last_states.items()
+            }
+        while len(self._completed) > MAX_ACCUMULATED_PERIODS:
+            del self._completed[next(iter(self._completed))]
+
+    def get_period(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> dict[str, list[_AccumulatedState]] | None:
+        """Return the states collected during a completed period.
+
+        Returns None if the period was not followed from its start.
+        """
+        with self._lock:
+            if self._covered_from is None or start < self._covered_from:
+                return None
+            if self._period_start == start and end <= dt_util.utcnow():
+                # No sensor changed since the period ended
+                self._roll(end)
+            return self._completed.get(start)
+
+
+def _get_accumulator(hass: HomeAssistant) -> SensorStatisticsAccumulator:
+    """Return the statistics accumulator, starting it on first use."""
+    if (accumulator := hass.data.get(DATA_STATISTICS_ACCUMULATOR)) is None:
+        accumulator = SensorStatisticsAccumulator(hass)
+        hass.data[DATA_STATISTICS_ACCUMULATOR] = accumulator
+        hass.add_job(accumulator.async_start)
+    return accumulator
+
+
 def _time_weighted_average(
     fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
 ) -> float:
@@ -386,37 +525,15 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
-def compile_statistics(
-    hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
-) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end.
-
-    Note: This will query the database and must not be run in the event loop
-    """
-    # There is already an active session when this code is called since
-    # it is called from the recorder statistics. We need to make sure
-    # this session never gets committed since it would be out of sync
-    # with the recorder statistics session so we mark it as read only.
-    #
-    # If we ever need to write to the database from this function we
-    # will need to refactor the recorder statistics to use a single
-    # session.
-    with recorder_util.session_scope(hass=hass, read_only=True) as session:
-        compiled = _compile_statistics(hass, session, start, end)
-    return compiled
-
-
-def _compile_statistics(  # noqa: C901
+def _history_float_states(
     hass: HomeAssistant,
     session: Session,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
     start: datetime.datetime,
     end: datetime.datetime,
-) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
-
-    sensor_states = _get_sensor_states(hass)
-    wanted_statistics = _wanted_statistics(sensor_states)
+) -> dict[str, list[tuple[float, State]]]:
+    """Read the numeric states of the sensors during start-end from the database."""
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
@@ -456,6 +573,82 @@ def _compile_statistics(  # noqa: C901
         if not (float_states := _entity_history_to_float_and_state(entity_history)):
             continue
         entities_with_float_states[entity_id] = float_states
+    return entities_with_float_states
+
+
+def _accumulated_float_states(
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    accumulated: dict[str, list[_AccumulatedState]],
+    end: datetime.datetime,
+) -> dict[str, list[tuple[float, State]]]:
+    """Return the numeric states of the sensors collected by the accumulator.
+
+    This matches what _history_float_states reads from the database: sensors
+    with a sum get all states, others only the significant ones.
+    """
+    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    for _state in sensor_states:
+        entity_id = _state.entity_id
+        if (entity_states := accumulated.get(entity_id)) is None:
+            if _state.last_updated >= end:
+                # The sensor was added after the period ended
+                continue
+            # The sensor was not seen during the period, use the state machine
+            float_states = _entity_history_to_float_and_state([_state])
+        elif "sum" in wanted_statistics[entity_id]:
+            float_states = [(fstate, state) for fstate, state, _ in entity_states]
+        else:
+            float_states = [
+                (fstate, state)
+                for fstate, state, significant in entity_states
+                if significant
+            ]
+        if float_states:
+            entities_with_float_states[entity_id] = float_states
+    return entities_with_float_states
+
+
+def compile_statistics(
+    hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end.
+
+    Note: This will query the database and must not be run in the event loop
+    """
+    # There is already an active session when this code is called since
+    # it is called from the recorder statistics. We need to make sure
+    # this session never gets committed since it would be out of sync
+    # with the recorder statistics session so we mark it as read only.
+    #
+    # If we ever need to write to the database from this function we
+    # will need to refactor the recorder statistics to use a single
+    # session.
+    with recorder_util.session_scope(hass=hass, read_only=True) as session:
+        compiled = _compile_statistics(hass, session, start, end)
+    return compiled
+
+
+def _compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end."""
+    result: list[StatisticResult] = []
+
+    sensor_states = _get_sensor_states(hass)
+    wanted_statistics = _wanted_statistics(sensor_states)
+    accumulated = _get_accumulator(hass).get_period(start, end)
+    if accumulated is not None:
+        entities_with_float_states = _accumulated_float_states(
+            sensor_states, wanted_statistics, accumulated, end
+        )
+    else:
+        entities_with_float_states = _history_float_states(
+            hass, session, sensor_states, wanted_statistics, start, end
+        )
 
     # Only lookup metadata for entities that have valid float states
     # since it will result in cache misses for statistic_ids
@@ -1,12 +1,13 @@
 """Support for statistics for sensor values."""
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
 import logging
-import statistics
+import math
 from typing import Any, cast
 
 import voluptuous as vol
@@ -174,6 +175,35 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Statistics calculated from the running sums of the values
+STATS_ROLLING_SUMS = {
+    STAT_AVERAGE_TIMELESS,
+    STAT_COUNT_BINARY_OFF,
+    STAT_COUNT_BINARY_ON,
+    STAT_DISTANCE_95P,
+    STAT_DISTANCE_99P,
+    STAT_MEAN,
+    STAT_STANDARD_DEVIATION,
+    STAT_SUM,
+    STAT_TOTAL,
+    STAT_VARIANCE,
+}
+
+# Statistics calculated from the sorted values
+STATS_ROLLING_SORTED = {
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+}
+
+# Statistics calculated from the running minimum and maximum
+STATS_ROLLING_EXTREMES = {
+    STAT_DATETIME_VALUE_MAX,
+    STAT_DATETIME_VALUE_MIN,
+    STAT_DISTANCE_ABSOLUTE,
+    STAT_VALUE_MAX,
+    STAT_VALUE_MIN,
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -262,6 +292,126 @@ async def async_setup_platform(
     )
 
 
+class RollingStatistics:
+    """Aggregates of a window of samples, updated as samples enter and leave.
+
+    Samples are always added as the newest and removed as the oldest sample,
+    which holds for both the sampling_size and the max_age limits. Only the
+    aggregates needed by the configured characteristic are maintained:
+
+    - a running sum, and a running mean and sum of squared deviations
+      updated with Welford's method for the mean and variance
+    - a sorted list of the values for the median and percentiles
+    - monotonic queues of the samples for the minimum and maximum
+    """
+
+    def __init__(self, sums: bool, ordered: bool, extremes: bool) -> None:
+        """Initialize the rolling statistics."""
+        self._track_sums = sums
+        self._track_sorted = ordered
+        self._track_extremes = extremes
+        self.sum = 0.0
+        self._mean = 0.0
+        self._squared_deviations = 0.0
+        self.sorted_values: list[float] = []
+        # Queues of (sequence, value, age) with the oldest minimum and
+        # maximum of the window at the front
+        self._min_queue: deque[tuple[int, float, datetime]] = deque()
+        self._max_queue: deque[tuple[int, float, datetime]] = deque()
+        self._added = 0
+        self._removed = 0
+
+    @property
+    def count(self) -> int:
+        """Return the number of samples in the window."""
+        return self._added - self._removed
+
+    @property
+    def min(self) -> tuple[float, datetime]:
+        """Return the smallest value and the age of its oldest sample."""
+        _, value, age = self._min_queue[0]
+        return value, age
+
+    @property
+    def max(self) -> tuple[float, datetime]:
+        """Return the largest value and the age of its oldest sample."""
+        _, value, age = self._max_queue[0]
+        return value, age
+
+    def add(self, value: float, age: datetime) -> None:
+        """Add a sample as the newest of the window."""
+        if self._track_sums:
+            count = self.count + 1
+            delta = value - self._mean
+            self._mean += delta / count
+            self._squared_deviations += delta * (value - self._mean)
+            self.sum += value
+        if self._track_sorted:
+            insort(self.sorted_values, value)
+        if self._track_extremes:
+            sample = (self._added, value, age)
+            min_queue = self._min_queue
+            while min_queue and min_queue[-1][1] > value:
+                min_queue.pop()
+            min_queue.append(sample)
+            max_queue = self._max_queue
+            while max_queue and max_queue[-1][1] < value:
+                max_queue.pop()
+            max_queue.append(sample)
+        self._added += 1
+
+    def remove_oldest(self, value: float) -> None:
+        """Remove the oldest sample of the window, which has the given value."""
+        if self._track_sums:
+            if (count := self.count - 1) == 0:
+                # Start over from an empty window, dropping rounding errors
+                self.sum = self._mean = self._squared_deviations = 0.0
+            else:
+                delta = value - self._mean
+                self._mean -= delta / count
+                self._squared_deviations -= delta * (value - self._mean)
+                self.sum -= value
+        if self._track_sorted:
+            del self.sorted_values[bisect_left(self.sorted_values, value)]
+        if self._track_extremes:
+            if self._min_queue[0][0] == self._removed:
+                self._min_queue.popleft()
+            if self._max_queue[0][0] == self._removed:
+                self._max_queue.popleft()
+        self._removed += 1
+
+    def mean(self) -> float:
+        """Return the mean of the values."""
+        return self._mean
+
+    def variance(self) -> float:
+        """Return the sample variance of the values."""
+        # Removing samples can leave a tiny negative rounding error
+        return max(self._squared_deviations, 0.0) / (self.count - 1)
+
+    def median(self) -> float:
+        """Return the median of the values."""
+        data = self.sorted_values
+        count = len(data)
+        middle = count // 2
+        if count % 2 == 1:
+            return data[middle]
+        return (data[middle - 1] + data[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile of the values.
+
+        This is the same interpolation as statistics.quantiles with
+        n=100 and the exclusive method and needs at least two values.
+        """
+        data = self.sorted_values
+        count = len(data)
+        position = percentile * (count + 1)
+        idx = min(max(position // 100, 1), count - 1)
+        delta = position - idx * 100
+        return (data[idx - 1] * (100 - delta) + data[idx] * delta) / 100
+
+
 class StatisticsSensor(SensorEntity):
     """Representation of a Statistics sensor."""
 
@@ -296,6 +446,11 @@ class StatisticsSensor(SensorEntity):
 
         self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
         self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self.rolling = RollingStatistics(
+            sums=state_characteristic in STATS_ROLLING_SUMS,
+            ordered=state_characteristic in STATS_ROLLING_SORTED,
+            extremes=state_characteristic in STATS_ROLLING_EXTREMES,
+        )
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[
@@ -345,10 +500,12 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._append_sample(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
+                if not math.isfinite(value):
+                    raise ValueError
+                self._append_sample(value, new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -361,6 +518,19 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _append_sample(self, value: float | bool, age: datetime) -> None:
+        """Append a sample, dropping the oldest one if the buffer is full."""
+        if len(self.states) == self._samples_max_buffer_size:
+            self._popleft_sample()
+        self.rolling.add(value, age)
+        self.states.append(value)
+        self.ages.append(age)
+
+    def _popleft_sample(self) -> None:
+        """Remove the oldest sample."""
+        self.ages.popleft()
+        self.rolling.remove_oldest(self.states.popleft())
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -456,8 +626,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._popleft_sample()
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
@@ -646,12 +815,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return self.rolling.max[1]
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return self.rolling.min[1]
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -666,17 +835,17 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            return self.rolling.max[0] - self.rolling.min[0]
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self.rolling.mean()
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return self.rolling.median()
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -686,18 +855,17 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return self.rolling.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(self.rolling.variance())
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return float(self.rolling.sum)
         return None
 
     def _stat_sum_differences(self) -> StateType:
@@ -722,17 +890,17 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self.rolling.max[0]
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self.rolling.min[0]
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self.rolling.variance()
         return None
 
     # Statistics for binary sensor
@@ -754,10 +922,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return int(self.rolling.sum)
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - int(self.rolling.sum)
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -767,5 +935,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * int(self.rolling.sum)
         return None
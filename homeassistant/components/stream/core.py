@@ -77,8 +77,8 @@ class Part:
 
     duration: float = attr.ib()
     has_keyframe: bool = attr.ib()
-    # video data (moof+mdat)
-    data: bytes = attr.ib()
+    # video data (moof+mdat), a view on the segment data once it is complete
+    data: bytes | memoryview = attr.ib()
 
 
 @attr.s(slots=True)
@@ -102,6 +102,8 @@ class Segment:
     hls_num_parts_rendered: int = attr.ib(default=0)
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = attr.ib(default=False)
+    # The init and data of all parts once the segment is complete
+    _data: bytes | None = attr.ib(default=None)
 
     def __attrs_post_init__(self) -> None:
         """Run after init."""
@@ -128,20 +130,52 @@ class Segment:
         self,
         part: Part,
         duration: float,
+        segment_data: bytes | None = None,
     ) -> None:
         """Add a part to the Segment.
 
-        Duration is non zero only for the last part.
+        Duration is non zero only for the last part. The last part also passes
+        the data of the whole segment, which replaces the data of the parts.
         """
         self.parts.append(part)
         self.duration = duration
+        if segment_data is not None:
+            self._async_set_data(segment_data)
         for output in self._stream_outputs:
             output.part_put()
 
-    def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
+    @callback
+    def _async_set_data(self, segment_data: bytes) -> None:
+        """Store the data of the complete segment and make the parts views on it.
+
+        The parts were written to the segment data one after the other, right after
+        the init, so their copies can be released.
+        """
+        if len(segment_data) != self.data_size_with_init:
+            return
+        self._data = segment_data
+        view = memoryview(segment_data)
+        offset = len(self.init)
+        for part in self.parts:
+            end = offset + len(part.data)
+            part.data = view[offset:end]
+            offset = end
+
+    def get_data(self) -> bytes | memoryview:
+        """Return reconstructed data for all parts, without init.
+
+        This is a view without copying the data when the segment is complete.
+        """
+        if self._data is not None:
+            return memoryview(self._data)[len(self.init) :]
         return b"".join([part.data for part in self.parts])
 
+    def get_data_with_init(self) -> bytes:
+        """Return the init and the data of all parts as bytes."""
+        if self._data is not None:
+            return self._data
+        return b"".join([self.init, *(part.data for part in self.parts)])
+
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
 
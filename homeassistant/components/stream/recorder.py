@@ -88,7 +88,7 @@ class RecorderOutput(StreamOutput):
 
             # Open segment
             source = av.open(
-                BytesIO(segment.init + segment.get_data()),
+                BytesIO(segment.get_data_with_init()),
                 "r",
                 format=SEGMENT_CONTAINER_FORMAT,
             )
@@ -23,6 +23,7 @@ from .const import (
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
     DEFAULT_STORED_TRACES,
+    TRACES_MAX_MEMORY,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -147,6 +148,35 @@ def async_store_trace(
         else:
             traces[key].size_limit = stored_traces
         traces[key][trace.run_id] = trace
+        _async_enforce_memory_limit(traces)
+
+
+def _async_enforce_memory_limit(traces: TraceData) -> None:
+    """Evict the oldest finished traces when they use too much memory.
+
+    Only compacted traces count against TRACES_MAX_MEMORY, traces of runs
+    which are still in progress are never evicted.
+    """
+    total = sum(
+        trace.size
+        for traces_for_key in traces.values()
+        for trace in traces_for_key.values()
+    )
+    if total <= TRACES_MAX_MEMORY:
+        return
+    finished = sorted(
+        (
+            (trace.as_short_dict()["timestamp"]["finish"], key, run_id, trace.size)
+            for key, traces_for_key in traces.items()
+            for run_id, trace in traces_for_key.items()
+            if trace.size
+        ),
+    )
+    for _, key, run_id, size in finished:
+        del traces[key][run_id]
+        total -= size
+        if total <= TRACES_MAX_MEMORY:
+            break
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
@@ -5,3 +5,5 @@ DATA_TRACE = "trace"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+TRACE_MAX_BYTES = 256 * 1024  # Budget of a serialized trace
+TRACES_MAX_MEMORY = 16 * 1024 * 1024  # Compressed bytes of all finished traces
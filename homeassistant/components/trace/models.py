@@ -4,9 +4,13 @@ from __future__ import annotations
 import abc
 from collections import deque
 import datetime as dt
+import json
+import logging
 from typing import Any
+import zlib
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -17,6 +21,10 @@ from homeassistant.helpers.trace import (
 import homeassistant.util.dt as dt_util
 import homeassistant.util.uuid as uuid_util
 
+from .const import TRACE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
 
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
@@ -24,6 +32,7 @@ class BaseTrace(abc.ABC):
     context: Context
     key: str
     run_id: str
+    size: int = 0
 
     def as_dict(self) -> dict[str, Any]:
         """Return an dictionary version of this ActionTrace for saving."""
@@ -67,6 +76,7 @@ class ActionTrace(BaseTrace):
         self.key = f"{self._domain}.{item_id}"
         self._dict: dict[str, Any] | None = None
         self._short_dict: dict[str, Any] | None = None
+        self._compressed: bytes | None = None
         if trace_id_get():
             trace_set_child_id(self.key, self.run_id)
         trace_id_set((self.key, self.run_id))
@@ -80,13 +90,45 @@ class ActionTrace(BaseTrace):
         self._error = ex
 
     def finished(self) -> None:
-        """Set finish time."""
+        """Set finish time and compact the trace."""
         self._timestamp_finish = dt_util.utcnow()
         self._state = "stopped"
         self._script_execution = script_execution_get()
+        self._compact()
+
+    def _compact(self) -> None:
+        """Serialize and compress the finished trace.
+
+        This releases the trace elements and the variables they reference.
+        When the serialized trace exceeds TRACE_MAX_BYTES, the changed
+        variables of the steps are left out.
+        """
+        self.as_short_dict()
+        extended_dict = self.as_extended_dict()
+        try:
+            data = json.dumps(extended_dict, cls=ExtendedJSONEncoder).encode()
+            if len(data) > TRACE_MAX_BYTES:
+                for trace_list in extended_dict["trace"].values():
+                    for item in trace_list:
+                        item.pop("changed_variables", None)
+                extended_dict["changed_variables_truncated"] = True
+                data = json.dumps(extended_dict, cls=ExtendedJSONEncoder).encode()
+        except (TypeError, ValueError):
+            # Keep the trace as is, it fails when it is requested or stored
+            _LOGGER.debug("Unable to serialize trace %s %s", self.key, self.run_id)
+            return
+        self._compressed = zlib.compress(data, 1)
+        self.size = len(self._compressed)
+        self._dict = None
+        self._trace = None
+        self._config = None
+        self._blueprint_inputs = None
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
+        if self._compressed is not None:
+            # The stdlib decoder accepts NaN like the encoder produced it
+            return json.loads(zlib.decompress(self._compressed))
         if self._dict:
             return self._dict
 
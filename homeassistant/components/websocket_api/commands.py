@@ -1,9 +1,9 @@
 """Commands part of Websocket API."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 import datetime as dt
-from functools import lru_cache
 import json
 from typing import Any, cast
 
@@ -15,7 +15,14 @@ from homeassistant.const import (
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
-from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -43,7 +50,11 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_SETUP_PHASE_TIME,
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -53,6 +64,9 @@ from .messages import construct_event_message, construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
+# Longest window subscribe_entities can coalesce state changes in
+MAX_SUBSCRIBE_ENTITIES_THROTTLE_MS = 60000
+
 
 @callback
 def async_register_commands(
@@ -285,6 +299,9 @@ def _send_handle_get_states_response(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("throttle_ms"): vol.All(
+            cv.positive_int, vol.Range(max=MAX_SUBSCRIBE_ENTITIES_THROTTLE_MS)
+        ),
     }
 )
 def handle_subscribe_entities(
@@ -293,6 +310,19 @@ def handle_subscribe_entities(
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
     user = connection.user
+    cancel_pending: CALLBACK_TYPE | None = None
+    if throttle_ms := msg.get("throttle_ms"):
+        send_entity_change, cancel_pending = _async_coalesce_entity_changes(
+            hass, connection, msg["id"], throttle_ms / 1000
+        )
+    else:
+
+        @callback
+        def send_entity_change(event: Event) -> None:
+            """Send the state diff of the event."""
+            connection.send_message(
+                messages.cached_state_diff_message(msg["id"], event)
+            )
 
     @callback
     def forward_entity_changes(event: Event) -> None:
@@ -307,15 +337,27 @@ def handle_subscribe_entities(
             POLICY_READ
         ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
             return
-        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+        send_entity_change(event)
 
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+    unsub = hass.bus.async_listen(
         EVENT_STATE_CHANGED, forward_entity_changes, run_immediately=True
     )
+    if cancel_pending is None:
+        connection.subscriptions[msg["id"]] = unsub
+    else:
+        cancel = cancel_pending
+
+        @callback
+        def unsub_and_cancel_pending() -> None:
+            """Unsubscribe and drop the changes that were not sent yet."""
+            unsub()
+            cancel()
+
+        connection.subscriptions[msg["id"]] = unsub_and_cancel_pending
     connection.send_result(msg["id"])
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -348,6 +390,62 @@ def handle_subscribe_entities(
     _send_handle_entities_init_response(connection, msg["id"], serialized_states)
 
 
+@callback
+def _async_coalesce_entity_changes(
+    hass: HomeAssistant, connection: ActiveConnection, msg_id: int, delay: float
+) -> tuple[Callable[[Event], None], CALLBACK_TYPE]:
+    """Coalesce the state changes of entities and send them every delay seconds.
+
+    Only the first and last state_changed event of each entity in the window
+    are kept, and all entities are sent as a single message. Returns the
+    callback to send an event and a callback to cancel pending changes.
+    """
+    pending: dict[str, tuple[Event, Event]] = {}
+    flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def send_pending() -> None:
+        """Send the pending changes."""
+        nonlocal flush_handle
+        flush_handle = None
+        if len(pending) == 1:
+            first_event, last_event = next(iter(pending.values()))
+            if first_event is last_event:
+                # Share the message with subscriptions that are not throttled
+                connection.send_message(
+                    messages.cached_state_diff_message(msg_id, last_event)
+                )
+                pending.clear()
+                return
+        message = messages.coalesced_state_diff_message(msg_id, pending.values())
+        pending.clear()
+        if message is not None:
+            connection.send_message(message)
+
+    @callback
+    def send_entity_change(event: Event) -> None:
+        """Add the event to the pending changes."""
+        nonlocal flush_handle
+        entity_id: str = event.data["entity_id"]
+        if (change := pending.get(entity_id)) is None:
+            pending[entity_id] = (event, event)
+        else:
+            pending[entity_id] = (change[0], event)
+        if flush_handle is None:
+            flush_handle = hass.loop.call_later(delay, send_pending)
+
+    @callback
+    def cancel_pending() -> None:
+        """Cancel sending the pending changes."""
+        nonlocal flush_handle
+        if flush_handle is not None:
+            flush_handle.cancel()
+            flush_handle = None
+        pending.clear()
+
+    return send_entity_change, cancel_pending
+
+
 def _send_handle_entities_init_response(
     connection: ActiveConnection, msg_id: int, serialized_states: list[str]
 ) -> None:
@@ -436,10 +534,15 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    phase_time: dict[str, dict[str, float]] = hass.data.get(DATA_SETUP_PHASE_TIME, {})
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
+            {
+                "domain": integration,
+                "seconds": timedelta.total_seconds(),
+                "phases": phase_time.get(integration, {}),
+            }
             for integration, timedelta in cast(
                 dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
             ).items()
@@ -456,12 +559,6 @@ def handle_ping(
     connection.send_message(pong_message(msg["id"]))
 
 
-@lru_cache
-def _cached_template(template_str: str, hass: HomeAssistant) -> template.Template:
-    """Return a cached template."""
-    return template.Template(template_str, hass)
-
-
 @decorators.websocket_command(
     {
         vol.Required("type"): "render_template",
@@ -478,7 +575,7 @@ async def handle_render_template(
 ) -> None:
     """Handle render_template command."""
     template_str = msg["template"]
-    template_obj = _cached_template(template_str, hass)
+    template_obj = template.Template(template_str, hass)
     variables = msg.get("variables")
     timeout = msg.get("timeout")
     info = None
@@ -1,7 +1,7 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
-from functools import lru_cache
+from collections.abc import Iterable
 import logging
 from typing import TYPE_CHECKING, Any, Final, cast
 
@@ -42,6 +42,10 @@ ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
 
+# Kinds of the messages cached on events with Event.json_fragment
+EVENT_MESSAGE_JSON = "websocket_event_message"
+STATE_DIFF_MESSAGE_JSON = "websocket_state_diff_message"
+
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
@@ -84,12 +88,13 @@ def cached_event_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return _cached_event_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+    return event.json_fragment(EVENT_MESSAGE_JSON, _event_message_json).replace(
+        IDEN_JSON_TEMPLATE, str(iden), 1
+    )
 
 
-@lru_cache(maxsize=128)
-def _cached_event_message(event: Event) -> str:
-    """Cache and serialize the event to json.
+def _event_message_json(event: Event) -> str:
+    """Serialize the event message to json.
 
     The IDEN_TEMPLATE is used which will be replaced
     with the actual iden in cached_event_message
@@ -106,21 +111,57 @@ def cached_state_diff_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return _cached_state_diff_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+    return event.json_fragment(
+        STATE_DIFF_MESSAGE_JSON, _state_diff_message_json
+    ).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
 
 
-@lru_cache(maxsize=128)
-def _cached_state_diff_message(event: Event) -> str:
-    """Cache and serialize the event to json.
+def _state_diff_message_json(event: Event) -> str:
+    """Serialize the state diff message to json.
 
     The IDEN_TEMPLATE is used which will be replaced
-    with the actual iden in cached_event_message
+    with the actual iden in cached_state_diff_message
     """
     return message_to_json(
         {"id": IDEN_TEMPLATE, "type": "event", "event": _state_diff_event(event)}
     )
 
 
+def coalesced_state_diff_message(
+    iden: int, changes: Iterable[tuple[Event, Event]]
+) -> str | None:
+    """Return an event message combining state changes of many entities.
+
+    Each change is the first and last state_changed event of an entity.
+    The diff is taken between the old state of the first and the new state
+    of the last event, so changes made in between are not lost. Returns None
+    when the changes cancel out, like an entity that was added and removed.
+    """
+    additions: dict[str, dict[str, Any]] = {}
+    changed: dict[str, Any] = {}
+    removals: list[str] = []
+    for first_event, last_event in changes:
+        old_state: State | None = first_event.data["old_state"]
+        new_state: State | None = last_event.data["new_state"]
+        if new_state is None:
+            if old_state is not None:
+                removals.append(last_event.data["entity_id"])
+        elif old_state is None:
+            additions[new_state.entity_id] = new_state.as_compressed_state()
+        else:
+            changed.update(_state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE])
+    event: dict[str, Any] = {}
+    if additions:
+        event[ENTITY_EVENT_ADD] = additions
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removals:
+        event[ENTITY_EVENT_REMOVE] = removals
+    if not event:
+        return None
+    return message_to_json(event_message(iden, event))
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
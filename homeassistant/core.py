@@ -6,6 +6,7 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 from collections.abc import (
     Awaitable,
     Callable,
@@ -40,6 +41,7 @@ from typing import (
 from urllib.parse import urlparse
 
 import async_timeout
+from lru import LRU  # pylint: disable=no-name-in-module
 from typing_extensions import Self
 import voluptuous as vol
 import yarl
@@ -153,6 +155,12 @@ TIMEOUT_EVENT_START = 15
 
 MAX_EXPECTED_ENTITY_IDS = 16384
 
+# Number of distinct attribute dicts shared between states
+MAX_INTERNED_STATE_ATTRIBUTES = 8192
+
+# Attribute dicts are only interned when all values are of these types
+_INTERNABLE_ATTRIBUTE_TYPES = frozenset({str, int, float, bool, type(None)})
+
 _LOGGER = logging.getLogger(__name__)
 
 _cv_hass: ContextVar[HomeAssistant] = ContextVar("hass")
@@ -167,6 +175,75 @@ def split_entity_id(entity_id: str) -> tuple[str, str]:
     return domain, object_id
 
 
+class _JsonCacheStats:
+    """Hits and misses of the JSON cached on states and events."""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.hits = 0
+        self.misses = 0
+
+
+_JSON_CACHE_STATS = _JsonCacheStats()
+
+_EMPTY_STATE_ATTRIBUTES: ReadOnlyDict[str, Any] = ReadOnlyDict()
+_INTERNED_STATE_ATTRIBUTES: LRU = LRU(MAX_INTERNED_STATE_ATTRIBUTES)
+
+
+def _intern_state_attributes(
+    attributes: Mapping[str, Any] | None
+) -> ReadOnlyDict[str, Any]:
+    """Return read only attributes, shared between states with equal attributes.
+
+    Attributes that are already read only are immutable and used as is. Other
+    attributes are interned when all values are immutable scalars, so states
+    of entities that alternate between a few attribute sets share them. The
+    value types are part of the key to keep 1, 1.0 and True apart.
+    """
+    if not attributes:
+        return _EMPTY_STATE_ATTRIBUTES
+    if type(attributes) is ReadOnlyDict:  # pylint: disable=unidiomatic-typecheck
+        return attributes
+    value_types = tuple(map(type, attributes.values()))
+    if not _INTERNABLE_ATTRIBUTE_TYPES.issuperset(value_types):
+        return ReadOnlyDict(attributes)
+    key = (tuple(attributes.items()), value_types)
+    interned: ReadOnlyDict[str, Any] | None = _INTERNED_STATE_ATTRIBUTES.get(key)
+    if interned is None:
+        interned = _INTERNED_STATE_ATTRIBUTES[key] = ReadOnlyDict(attributes)
+    return interned
+
+
+def json_cache_stats() -> dict[str, int]:
+    """Return the hits and misses of the JSON cached on states and events."""
+    return {"hits": _JSON_CACHE_STATS.hits, "misses": _JSON_CACHE_STATS.misses}
+
+
+class _JsonFragmentCache:
+    """Cache the JSON representations of an object that does not change."""
+
+    __slots__ = ("_json_fragments",)
+
+    _json_fragments: dict[str, str] | None
+
+    def json_fragment(self, kind: str, serialize: Callable[[Self], str]) -> str:
+        """Return the JSON of kind, serialize is only called the first time.
+
+        Consumers with their own representation, like websocket messages,
+        use this so all connections share a single serialization.
+        """
+        if (fragments := self._json_fragments) is None:
+            fragments = self._json_fragments = {}
+        elif (fragment := fragments.get(kind)) is not None:
+            _JSON_CACHE_STATS.hits += 1
+            return fragment
+        _JSON_CACHE_STATS.misses += 1
+        fragment = fragments[kind] = serialize(self)
+        return fragment
+
+
 _OBJECT_ID = r"(?!_)[\da-z_]+(?<!_)"
 _DOMAIN = r"(?!.+__)" + _OBJECT_ID
 VALID_DOMAIN = re.compile(r"^" + _DOMAIN + r"$")
@@ -908,10 +985,18 @@ class EventOrigin(enum.Enum):
         return self.value
 
 
-class Event:
+class Event(_JsonFragmentCache):
     """Representation of an event within the bus."""
 
-    __slots__ = ("event_type", "data", "origin", "time_fired", "context", "_as_dict")
+    __slots__ = (
+        "event_type",
+        "data",
+        "origin",
+        "time_fired",
+        "context",
+        "_as_dict",
+        "_as_dict_json",
+    )
 
     def __init__(
         self,
@@ -930,6 +1015,8 @@ class Event:
             id=ulid_util.ulid_at_time(dt_util.utc_to_timestamp(self.time_fired))
         )
         self._as_dict: ReadOnlyDict[str, Any] | None = None
+        self._as_dict_json: str | None = None
+        self._json_fragments = None
 
     def as_dict(self) -> ReadOnlyDict[str, Any]:
         """Create a dict representation of this Event.
@@ -948,6 +1035,15 @@ class Event:
             )
         return self._as_dict
 
+    def as_dict_json(self) -> str:
+        """Return a JSON string of the Event."""
+        if not self._as_dict_json:
+            _JSON_CACHE_STATS.misses += 1
+            self._as_dict_json = json_dumps(self.as_dict())
+        else:
+            _JSON_CACHE_STATS.hits += 1
+        return self._as_dict_json
+
     def __repr__(self) -> str:
         """Return the representation."""
         if self.data:
@@ -1104,6 +1200,67 @@ class EventBus:
             ),
         )
 
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: str,
+        listener: Callable[[list[Event]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[Event], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type and receive them in batches.
+
+        Every event of event_type that is fired during one iteration of the
+        event loop is collected and passed to the listener as a single list,
+        in the order the events were fired. This avoids scheduling a job per
+        event for listeners that can process many events at once.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if an event
+        should be added to the batch.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        batch_job = HassJob(listener, f"listen batch {event_type}")
+        pending: list[Event] = []
+        removed = False
+
+        @callback
+        def _async_flush_batch() -> None:
+            """Deliver the collected events to the listener."""
+            nonlocal pending
+            if removed:
+                return
+            events, pending = pending, []
+            self._hass.async_run_hass_job(batch_job, events)
+
+        @callback
+        def _async_collect_event(event: Event) -> None:
+            """Add an event to the pending batch."""
+            if not pending:
+                self._hass.loop.call_soon(_async_flush_batch)
+            pending.append(event)
+
+        remove_listener = self._async_listen_filterable_job(
+            event_type,
+            _FilterableJob(
+                HassJob(_async_collect_event, f"listen batch {event_type}"),
+                event_filter,
+                True,
+            ),
+        )
+
+        @callback
+        def remove_batch_listener() -> None:
+            """Remove the listener and drop events which were not delivered."""
+            nonlocal removed
+            removed = True
+            pending.clear()
+            remove_listener()
+
+        return remove_batch_listener
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJob
@@ -1205,7 +1362,7 @@ class EventBus:
             )
 
 
-class State:
+class State(_JsonFragmentCache):
     """Object to represent a state within the state machine.
 
     entity_id: the entity that is represented.
@@ -1259,7 +1416,7 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        self.attributes = _intern_state_attributes(attributes)
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1267,6 +1424,7 @@ class State:
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
         self._as_dict_json: str | None = None
         self._as_compressed_state_json: str | None = None
+        self._json_fragments = None
 
     @property
     def name(self) -> str:
@@ -1304,7 +1462,10 @@ class State:
     def as_dict_json(self) -> str:
         """Return a JSON string of the State."""
         if not self._as_dict_json:
+            _JSON_CACHE_STATS.misses += 1
             self._as_dict_json = json_dumps(self.as_dict())
+        else:
+            _JSON_CACHE_STATS.hits += 1
         return self._as_dict_json
 
     def as_compressed_state(self) -> dict[str, Any]:
@@ -1339,9 +1500,12 @@ class State:
         It is used for sending multiple states in a single message.
         """
         if not self._as_compressed_state_json:
+            _JSON_CACHE_STATS.misses += 1
             self._as_compressed_state_json = json_dumps(
                 {self.entity_id: self.as_compressed_state()}
             )[1:-1]
+        else:
+            _JSON_CACHE_STATS.hits += 1
         return self._as_compressed_state_json
 
     @classmethod
@@ -1411,6 +1575,7 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1428,19 +1593,22 @@ class StateMachine:
     ) -> list[str]:
         """List of entity ids that are being tracked.
 
+        With an iterable domain filter the entity ids are grouped by domain in
+        the order of the filter, not in the order they were added.
+
         This method must be run in the event loop.
         """
         if domain_filter is None:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
-        ]
+        states: list[str] = []
+        for domain in dict.fromkeys(domain_filter):
+            if domain_index := self._domain_index.get(domain):
+                states.extend(domain_index)
+        return states
 
     @callback
     def async_entity_ids_count(
@@ -1454,10 +1622,11 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._domain_index.get(domain, ()))
+            for domain in dict.fromkeys(domain_filter)
         )
 
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
@@ -1472,17 +1641,22 @@ class StateMachine:
     ) -> list[State]:
         """Create a list of all states matching the filter.
 
+        With an iterable domain filter the states are grouped by domain in the
+        order of the filter, not in the order they were added.
+
         This method must be run in the event loop.
         """
         if domain_filter is None:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
-        return [
-            state for state in self._states.values() if state.domain in domain_filter
-        ]
+        states: list[State] = []
+        for domain in dict.fromkeys(domain_filter):
+            if domain_index := self._domain_index.get(domain):
+                states.extend(domain_index.values())
+        return states
 
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
@@ -1526,6 +1700,7 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._async_remove_from_domain_index(old_state)
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1559,6 +1734,14 @@ class StateMachine:
             context,
         ).result()
 
+    @callback
+    def _async_remove_from_domain_index(self, state: State) -> None:
+        """Remove a state from the per-domain index."""
+        domain_index = self._domain_index[state.domain]
+        del domain_index[state.entity_id]
+        if not domain_index:
+            del self._domain_index[state.domain]
+
     @callback
     def async_reserve(self, entity_id: str) -> None:
         """Reserve a state in the state machine for an entity being added.
@@ -1616,6 +1799,10 @@ class StateMachine:
         if same_state and same_attr:
             return
 
+        if old_state is not None and same_attr:
+            # Share the attributes of the old state
+            attributes = old_state.attributes
+
         if context is None:
             # It is much faster to convert a timestamp to a utc datetime object
             # than converting a utc datetime object to a timestamp since cpython
@@ -1646,6 +1833,7 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        self._domain_index[state.domain][entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 from collections import UserDict
-from collections.abc import Coroutine, ValuesView
+from collections.abc import Callable, Coroutine, ValuesView
+from functools import partial
 import logging
 import time
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 import attr
 
@@ -249,26 +250,29 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
     def __setitem__(self, key: str, entry: _EntryTypeT) -> None:
         """Add an item."""
         if key in self:
-            old_entry = self[key]
-            for connection in old_entry.connections:
-                del self._connections[connection]
-            for identifier in old_entry.identifiers:
-                del self._identifiers[identifier]
+            self._unindex_entry(key, self[key])
         # type ignore linked to mypy issue: https://github.com/python/mypy/issues/13596
         super().__setitem__(key, entry)  # type: ignore[assignment]
+        self._index_entry(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        self._unindex_entry(key, self[key])
+        super().__delitem__(key)
+
+    def _index_entry(self, key: str, entry: _EntryTypeT) -> None:
+        """Add an entry to the indexes."""
         for connection in entry.connections:
             self._connections[connection] = entry
         for identifier in entry.identifiers:
             self._identifiers[identifier] = entry
 
-    def __delitem__(self, key: str) -> None:
-        """Remove an item."""
-        entry = self[key]
+    def _unindex_entry(self, key: str, entry: _EntryTypeT) -> None:
+        """Remove an entry from the indexes."""
         for connection in entry.connections:
             del self._connections[connection]
         for identifier in entry.identifiers:
             del self._identifiers[identifier]
-        super().__delitem__(key)
 
     def get_entry(
         self,
@@ -287,10 +291,63 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry entries.
+
+    Also maintains area_id -> dict[device id, True] and
+    config_entry_id -> dict[device id, True] indexes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
+
+    def _index_entry(self, key: str, entry: DeviceEntry) -> None:
+        """Add an entry to the indexes."""
+        super()._index_entry(key, entry)
+        if (area_id := entry.area_id) is not None:
+            self._area_id_index.setdefault(area_id, {})[key] = True
+        for config_entry_id in entry.config_entries:
+            self._config_entry_id_index.setdefault(config_entry_id, {})[key] = True
+
+    def _unindex_entry(self, key: str, entry: DeviceEntry) -> None:
+        """Remove an entry from the indexes."""
+        super()._unindex_entry(key, entry)
+        if (area_id := entry.area_id) is not None:
+            _remove_from_index(self._area_id_index, area_id, key)
+        for config_entry_id in entry.config_entries:
+            _remove_from_index(self._config_entry_id_index, config_entry_id, key)
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        return [self.data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        return [
+            self.data[key]
+            for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
+def _remove_from_index(
+    index: dict[str, dict[str, Literal[True]]], index_key: str, key: str
+) -> None:
+    """Remove a key from a multi-index, dropping the bucket when empty."""
+    keys = index[index_key]
+    del keys[key]
+    if not keys:
+        del index[index_key]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
 
     def __init__(self, hass: HomeAssistant) -> None:
@@ -302,6 +359,7 @@ class DeviceRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_collections={"devices": "id", "deleted_devices": "id"},
         )
 
     @callback
@@ -589,7 +647,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -645,10 +703,21 @@ class DeviceRegistry:
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the device registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        self._store.async_delay_save_snapshot(self._snapshot_to_save, SAVE_DELAY)
 
     @callback
-    def _data_to_save(self) -> dict[str, list[dict[str, Any]]]:
+    def _snapshot_to_save(self) -> Callable[[], dict[str, list[dict[str, Any]]]]:
+        """Snapshot the entries, the data is built from it in the executor."""
+        return partial(
+            self._data_to_save,
+            list(self.devices.values()),
+            list(self.deleted_devices.values()),
+        )
+
+    @staticmethod
+    def _data_to_save(
+        devices: list[DeviceEntry], deleted_devices: list[DeletedDeviceEntry]
+    ) -> dict[str, list[dict[str, Any]]]:
         """Return data of device registry to store in a file."""
         data: dict[str, list[dict[str, Any]]] = {}
 
@@ -670,7 +739,7 @@ class DeviceRegistry:
                 "sw_version": entry.sw_version,
                 "via_device_id": entry.via_device_id,
             }
-            for entry in self.devices.values()
+            for entry in devices
         ]
         data["deleted_devices"] = [
             {
@@ -680,7 +749,7 @@ class DeviceRegistry:
                 "id": entry.id,
                 "orphaned_timestamp": entry.orphaned_timestamp,
             }
-            for entry in self.deleted_devices.values()
+            for entry in deleted_devices
         ]
 
         return data
@@ -689,7 +758,7 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
+        for device in self.devices.get_devices_for_config_entry_id(config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
@@ -730,9 +799,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in self.devices.get_devices_for_area_id(area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -751,7 +819,7 @@ async def async_load(hass: HomeAssistant) -> None:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -759,11 +827,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -33,15 +33,25 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     EntityCategory,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, Event, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
 
 from . import device_registry as dr, entity_registry as er
 from .device_registry import DeviceEntryType
-from .event import async_track_entity_registry_updated_event
-from .typing import StateType
+from .event import (
+    async_track_device_registry_updated_event,
+    async_track_entity_registry_updated_event,
+)
+from .typing import UNDEFINED, StateType
 
 if TYPE_CHECKING:
     from .entity_platform import EntityPlatform
@@ -205,6 +215,82 @@ class EntityPlatformState(Enum):
     REMOVED = auto()
 
 
+@dataclass(frozen=True, slots=True)
+class _RegistryAttributes:
+    """Attributes derived from the registries and customization.
+
+    These only change when the registry entry, the device or the
+    customization changes, and are cached on the entity until then.
+    """
+
+    entry: er.RegistryEntry | None
+    customize: Any
+    device_entry: dr.DeviceEntry | None
+    device_class: str | None
+    icon: str | None
+    name: str | None
+    overrides: Mapping[str, Any] | None
+
+
+@dataclass(frozen=True, slots=True)
+class _WriteSnapshot:
+    """The last state write of an entity.
+
+    The attribute mappings of the entity are not copied, they are compared
+    with the attributes of the written state instead.
+    """
+
+    state: State
+    registry_attributes: _RegistryAttributes
+    unit_of_measurement: str | None
+    assumed_state: bool
+    attribution: str | None
+    device_class: str | None
+    entity_picture: str | None
+    icon: str | None
+    name: str | None
+    supported_features: int | None
+    # Attributes set from the properties above and from the config
+    property_attributes: dict[str, Any]
+    # Number of the other attributes, which come from the attribute mappings
+    mapping_attributes: int
+
+
+def _attribute_mappings_unchanged(
+    last_write: _WriteSnapshot,
+    capability_attr: Mapping[str, Any] | None,
+    state_attr: Mapping[str, Any] | None,
+    extra_state_attr: Mapping[str, Any] | None,
+) -> bool:
+    """Return if merging the attribute mappings gives the written attributes.
+
+    The mappings are compared key by key with the written state, without
+    merging them in a new dict.
+    """
+    written = last_write.state.attributes
+    property_attr = last_write.property_attributes
+    count = 0
+    for mapping, later, last in (
+        (capability_attr, state_attr, extra_state_attr),
+        (state_attr, extra_state_attr, None),
+        (extra_state_attr, None, None),
+    ):
+        if not mapping:
+            continue
+        for key, value in mapping.items():
+            if (
+                key in property_attr
+                or (later and key in later)
+                or (last and key in last)
+            ):
+                # Overwritten when merging
+                continue
+            if written.get(key, UNDEFINED) != value:
+                return False
+            count += 1
+    return count == last_write.mapping_attributes
+
+
 @dataclass(slots=True)
 class EntityDescription:
     """A class that describes Home Assistant entities."""
@@ -265,6 +351,15 @@ class Entity(ABC):
     # Hold list for functions to call on remove.
     _on_remove: list[CALLBACK_TYPE] | None = None
 
+    # Attributes derived from the registries, see _async_registry_attributes
+    _registry_attributes: _RegistryAttributes | None = None
+
+    # Snapshot of the last write, used to skip writes that change nothing
+    _last_write: _WriteSnapshot | None = None
+
+    # Unsubscribe from device registry updates of the entity's device
+    _unsub_device_updates: CALLBACK_TYPE | None = None
+
     # Context
     _context: Context | None = None
     _context_set: datetime | None = None
@@ -602,13 +697,22 @@ class Entity(ABC):
         If has_entity_name is False, this returns self.name
         If has_entity_name is True, this returns device.name + self.name
         """
+        return self._friendly_name_for_device(self._name_device_entry())
+
+    def _name_device_entry(self) -> dr.DeviceEntry | None:
+        """Return the device entry used in the friendly name, if any."""
         if not self.has_entity_name or not self.registry_entry:
-            return self.name
+            return None
 
-        device_registry = dr.async_get(self.hass)
-        if not (device_id := self.registry_entry.device_id) or not (
-            device_entry := device_registry.async_get(device_id)
-        ):
+        if not (device_id := self.registry_entry.device_id):
+            return None
+        return dr.async_get(self.hass).async_get(device_id)
+
+    def _friendly_name_for_device(
+        self, device_entry: dr.DeviceEntry | None
+    ) -> str | None:
+        """Return the friendly name, prefixed with the name of device_entry."""
+        if device_entry is None:
             return self.name
 
         if not (name := self.name):
@@ -642,42 +746,34 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        registry_attr = self._registry_attributes
+        customize = hass.data.get(DATA_CUSTOMIZE)
+        if (
+            registry_attr is None
+            or registry_attr.entry is not entry
+            or registry_attr.customize is not customize
+        ):
+            registry_attr = self._async_registry_attributes(customize)
 
+        capability_attr = self.capability_attributes
         available = self.available  # only call self.available once per update cycle
         state = self._stringify_state(available)
         if available:
-            attr.update(self.state_attributes or {})
-            attr.update(self.extra_state_attributes or {})
-
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        if assumed_state := self.assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        if (attribution := self.attribution) is not None:
-            attr[ATTR_ATTRIBUTION] = attribution
-
-        if (
-            device_class := (entry and entry.device_class) or self.device_class
-        ) is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
-
-        if (entity_picture := self.entity_picture) is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        if (icon := (entry and entry.icon) or self.icon) is not None:
-            attr[ATTR_ICON] = icon
-
-        if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        if (supported_features := self.supported_features) is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+            state_attr = self.state_attributes
+            extra_state_attr = self.extra_state_attributes
+        else:
+            state_attr = extra_state_attr = None
+
+        unit_of_measurement = self.unit_of_measurement
+        assumed_state = self.assumed_state
+        attribution = self.attribution
+        device_class = registry_attr.device_class or self.device_class
+        entity_picture = self.entity_picture
+        icon = registry_attr.icon or self.icon
+        name = registry_attr.name or self._friendly_name_for_device(
+            registry_attr.device_entry
+        )
+        supported_features = self.supported_features
 
         end = timer()
 
@@ -692,10 +788,6 @@ class Entity(ABC):
                 report_issue,
             )
 
-        # Overwrite properties that have been set in the config file.
-        if customize := hass.data.get(DATA_CUSTOMIZE):
-            attr.update(customize.get(entity_id))
-
         if (
             self._context_set is not None
             and dt_util.utcnow() - self._context_set > self.context_recent_time
@@ -703,7 +795,89 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
-        hass.states.async_set(entity_id, state, attr, self.force_update, self._context)
+        force_update = self.force_update
+        last_write = self._last_write
+        if (
+            not force_update
+            and last_write is not None
+            and last_write.state is hass.states.get(entity_id)
+            and last_write.state.state == state
+            and last_write.registry_attributes is registry_attr
+            and last_write.unit_of_measurement == unit_of_measurement
+            and last_write.assumed_state == assumed_state
+            and last_write.attribution == attribution
+            and last_write.device_class == device_class
+            and last_write.entity_picture == entity_picture
+            and last_write.icon == icon
+            and last_write.name == name
+            and last_write.supported_features == supported_features
+            and _attribute_mappings_unchanged(
+                last_write, capability_attr, state_attr, extra_state_attr
+            )
+        ):
+            # The state machine still holds the state we wrote and nothing
+            # changed since, so async_set would be a no-op
+            if self.platform is not None:
+                self.platform.suppressed_state_writes += 1
+            return
+
+        attr = dict(capability_attr) if capability_attr else {}
+        if state_attr:
+            attr.update(state_attr)
+        if extra_state_attr:
+            attr.update(extra_state_attr)
+
+        property_attr: dict[str, Any] = {}
+
+        if unit_of_measurement is not None:
+            property_attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        if assumed_state:
+            property_attr[ATTR_ASSUMED_STATE] = assumed_state
+
+        if attribution is not None:
+            property_attr[ATTR_ATTRIBUTION] = attribution
+
+        if device_class is not None:
+            property_attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        if entity_picture is not None:
+            property_attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+        if icon is not None:
+            property_attr[ATTR_ICON] = icon
+
+        if name is not None:
+            property_attr[ATTR_FRIENDLY_NAME] = name
+
+        if supported_features is not None:
+            property_attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        # Overwrite properties that have been set in the config file.
+        if registry_attr.overrides:
+            property_attr.update(registry_attr.overrides)
+
+        attr.update(property_attr)
+
+        hass.states.async_set(entity_id, state, attr, force_update, self._context)
+
+        if (written_state := hass.states.get(entity_id)) is None:
+            self._last_write = None
+            return
+        self._last_write = _WriteSnapshot(
+            written_state,
+            registry_attr,
+            unit_of_measurement,
+            assumed_state,
+            attribution,
+            device_class,
+            entity_picture,
+            icon,
+            name,
+            supported_features,
+            property_attr,
+            len(attr) - len(property_attr),
+        )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -801,6 +975,43 @@ class Entity(ABC):
         To be extended by integrations.
         """
 
+    @callback
+    def _async_registry_attributes(self, customize: Any) -> _RegistryAttributes:
+        """Look up and cache the attributes derived from the registries."""
+        entry = self.registry_entry
+        self._registry_attributes = registry_attr = _RegistryAttributes(
+            entry,
+            customize,
+            self._name_device_entry(),
+            entry.device_class if entry else None,
+            entry.icon if entry else None,
+            entry.name if entry else None,
+            customize.get(self.entity_id) if customize else None,
+        )
+        return registry_attr
+
+    @callback
+    def _async_subscribe_device_updates(self) -> None:
+        """Invalidate the registry attributes when the entity's device changes."""
+        self._async_unsubscribe_device_updates()
+        if (entry := self.registry_entry) is None or entry.device_id is None:
+            return
+        self._unsub_device_updates = async_track_device_registry_updated_event(
+            self.hass, entry.device_id, self._async_device_registry_updated
+        )
+
+    @callback
+    def _async_unsubscribe_device_updates(self) -> None:
+        """Unsubscribe from device registry updates."""
+        if self._unsub_device_updates is not None:
+            self._unsub_device_updates()
+            self._unsub_device_updates = None
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Handle device registry update."""
+        self._registry_attributes = None
+
     @callback
     def add_to_platform_start(
         self,
@@ -926,6 +1137,8 @@ class Entity(ABC):
                     self.hass, self.entity_id, self._async_registry_updated
                 )
             )
+            self._async_subscribe_device_updates()
+            self.async_on_remove(self._async_unsubscribe_device_updates)
 
     async def async_internal_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass.
@@ -949,7 +1162,10 @@ class Entity(ABC):
         ent_reg = er.async_get(self.hass)
         old = self.registry_entry
         self.registry_entry = ent_reg.async_get(data["entity_id"])
+        self._registry_attributes = None
         assert self.registry_entry is not None
+        if old is not None and self.registry_entry.device_id != old.device_id:
+            self._async_subscribe_device_updates()
 
         if self.registry_entry.disabled:
             await self.async_remove()
@@ -135,6 +135,8 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Number of entity state writes skipped because nothing changed
+        self.suppressed_state_writes = 0
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -11,9 +11,10 @@ from __future__ import annotations
 
 from collections import UserDict
 from collections.abc import Callable, Iterable, Mapping, ValuesView
+from functools import partial
 import logging
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 import attr
 import voluptuous as vol
@@ -391,9 +392,12 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - device_id -> dict[entity_id, True]
+    - area_id -> dict[entity_id, True]
+    - config_entry_id -> dict[entity_id, True]
     """
 
     def __init__(self) -> None:
@@ -401,6 +405,9 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._area_id_index: dict[str, dict[str, Literal[True]]] = {}
+        self._config_entry_id_index: dict[str, dict[str, Literal[True]]] = {}
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -409,19 +416,41 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
         if key in self:
-            old_entry = self[key]
-            del self._entry_ids[old_entry.id]
-            del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            self._unindex_entry(self[key])
         super().__setitem__(key, entry)
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        entity_id = entry.entity_id
+        if (device_id := entry.device_id) is not None:
+            self._device_id_index.setdefault(device_id, {})[entity_id] = True
+        if (area_id := entry.area_id) is not None:
+            self._area_id_index.setdefault(area_id, {})[entity_id] = True
+        if (config_entry_id := entry.config_entry_id) is not None:
+            self._config_entry_id_index.setdefault(config_entry_id, {})[
+                entity_id
+            ] = True
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
-        entry = self[key]
+        self._unindex_entry(self[key])
+        super().__delitem__(key)
+
+    def _unindex_entry(self, entry: RegistryEntry) -> None:
+        """Remove an entry from the indexes."""
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
-        super().__delitem__(key)
+        entity_id = entry.entity_id
+        for index, index_key in (
+            (self._device_id_index, entry.device_id),
+            (self._area_id_index, entry.area_id),
+            (self._config_entry_id_index, entry.config_entry_id),
+        ):
+            if index_key is None:
+                continue
+            entity_ids = index[index_key]
+            del entity_ids[entity_id]
+            if not entity_ids:
+                del index[index_key]
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
@@ -431,6 +460,23 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(self, device_id: str) -> list[RegistryEntry]:
+        """Get entries for device."""
+        return [self.data[key] for key in self._device_id_index.get(device_id, ())]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        return [self.data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        return [
+            self.data[key]
+            for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -446,6 +492,7 @@ class EntityRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_collections={"entities": "id"},
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -1006,10 +1053,15 @@ class EntityRegistry:
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the entity registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        self._store.async_delay_save_snapshot(self._snapshot_to_save, SAVE_DELAY)
 
     @callback
-    def _data_to_save(self) -> dict[str, Any]:
+    def _snapshot_to_save(self) -> Callable[[], dict[str, Any]]:
+        """Snapshot the entries, the data is built from it in the executor."""
+        return partial(self._data_to_save, list(self.entities.values()))
+
+    @staticmethod
+    def _data_to_save(entries: list[RegistryEntry]) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
         data: dict[str, Any] = {}
 
@@ -1039,7 +1091,7 @@ class EntityRegistry:
                 "unique_id": entry.unique_id,
                 "unit_of_measurement": entry.unit_of_measurement,
             }
-            for entry in self.entities.values()
+            for entry in entries
         ]
 
         return data
@@ -1047,19 +1099,14 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry):
+            self.async_remove(entry.entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self.async_update_entity(entity_id, area_id=None)
+        for entry in self.entities.get_entries_for_area_id(area_id):
+            self.async_update_entity(entry.entity_id, area_id=None)
 
 
 @callback
@@ -1080,12 +1127,10 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    entries = registry.entities.get_entries_for_device_id(device_id)
+    if include_disabled_entities:
+        return entries
+    return [entry for entry in entries if not entry.disabled_by]
 
 
 @callback
@@ -1093,7 +1138,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -1101,11 +1146,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 import fnmatch
+from functools import lru_cache
 import re
 
 import voluptuous as vol
@@ -21,6 +22,11 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
 CONF_ENTITY_GLOBS = "entity_globs"
 
+# Filters are called with the same entity_ids over and over, for example
+# for every state_changed event, so their results are memoized. The cache
+# only goes away with the filter, when its configuration is reloaded.
+FILTER_CACHE_SIZE = 16384
+
 
 class EntityFilter:
     """A entity filter."""
@@ -35,13 +41,15 @@ class EntityFilter:
         self._exclude_d = set(config[CONF_EXCLUDE_DOMAINS])
         self._include_eg = _convert_globs_to_pattern(config[CONF_INCLUDE_ENTITY_GLOBS])
         self._exclude_eg = _convert_globs_to_pattern(config[CONF_EXCLUDE_ENTITY_GLOBS])
-        self._filter = _generate_filter_from_sets_and_pattern_lists(
-            self._include_d,
-            self._include_e,
-            self._exclude_d,
-            self._exclude_e,
-            self._include_eg,
-            self._exclude_eg,
+        self._filter = _memoize_filter(
+            _generate_filter_from_sets_and_pattern_lists(
+                self._include_d,
+                self._include_e,
+                self._exclude_d,
+                self._exclude_e,
+                self._include_eg,
+                self._exclude_eg,
+            )
         )
 
     def explicitly_included(self, entity_id: str) -> bool:
@@ -163,16 +171,23 @@ def generate_filter(
     exclude_entity_globs: list[str] | None = None,
 ) -> Callable[[str], bool]:
     """Return a function that will filter entities based on the args."""
-    return _generate_filter_from_sets_and_pattern_lists(
-        set(include_domains),
-        set(include_entities),
-        set(exclude_domains),
-        set(exclude_entities),
-        _convert_globs_to_pattern(include_entity_globs),
-        _convert_globs_to_pattern(exclude_entity_globs),
+    return _memoize_filter(
+        _generate_filter_from_sets_and_pattern_lists(
+            set(include_domains),
+            set(include_entities),
+            set(exclude_domains),
+            set(exclude_entities),
+            _convert_globs_to_pattern(include_entity_globs),
+            _convert_globs_to_pattern(exclude_entity_globs),
+        )
     )
 
 
+def _memoize_filter(entity_filter: Callable[[str], bool]) -> Callable[[str], bool]:
+    """Cache the results of a filter by entity_id."""
+    return lru_cache(maxsize=FILTER_CACHE_SIZE)(entity_filter)
+
+
 def _generate_filter_from_sets_and_pattern_lists(
     include_d: set[str],
     include_e: set[str],
@@ -10,7 +10,7 @@ import functools as ft
 import logging
 from random import randint
 import time
-from typing import Any, Concatenate, ParamSpec, cast
+from typing import Any, Concatenate, ParamSpec, TypeVar, cast
 
 import attr
 
@@ -46,6 +46,9 @@ from .typing import TemplateVarsType
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
 TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
 
+TRACK_STATE_CHANGE_DOMAIN_CALLBACKS = "track_state_change_domain_callbacks"
+TRACK_STATE_CHANGE_DOMAIN_LISTENER = "track_state_change_domain_listener"
+
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 
@@ -68,6 +71,7 @@ RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
 _P = ParamSpec("_P")
+_IndexT = TypeVar("_IndexT", bound=dict[str, list[HassJob[[Event], Any]]])
 
 
 @dataclass(slots=True)
@@ -260,15 +264,30 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action)
 
 
+class _StateChangeIndex(dict[str, list[HassJob[[Event], Any]]]):
+    """Listeners of state changes by entity_id or domain, with debug counters."""
+
+    __slots__ = ("events", "jobs", "templates")
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        super().__init__()
+        self.events = 0
+        self.jobs = 0
+        self.templates = 0
+
+
 @callback
 def _async_dispatch_entity_id_event(
     hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event], Any]]],
+    callbacks: _StateChangeIndex,
     event: Event,
 ) -> None:
     """Dispatch to listeners."""
     if not (callbacks_list := callbacks.get(event.data["entity_id"])):
         return
+    callbacks.events += 1
+    callbacks.jobs += len(callbacks_list)
     for job in callbacks_list[:]:
         try:
             hass.async_run_hass_job(job, event)
@@ -280,6 +299,37 @@ def _async_dispatch_entity_id_event(
             )
 
 
+@callback
+def _async_state_change_index(
+    hass: HomeAssistant, callbacks_key: str
+) -> _StateChangeIndex:
+    """Return the state change index stored under callbacks_key."""
+    if (index := hass.data.get(callbacks_key)) is None:
+        index = hass.data[callbacks_key] = _StateChangeIndex()
+    return cast(_StateChangeIndex, index)
+
+
+@callback
+def async_track_state_change_index_stats(hass: HomeAssistant) -> dict[str, int]:
+    """Return debug counters of the indexes used to dispatch state changes.
+
+    entities and domains are the number of entity_ids and domains in the
+    indexes, events the number of state changes dispatched through them,
+    jobs the number of listeners those state changes were dispatched to,
+    and templates the number of tracked templates considered for a
+    re-render because of them.
+    """
+    entity_index = _async_state_change_index(hass, TRACK_STATE_CHANGE_CALLBACKS)
+    domain_index = _async_state_change_index(hass, TRACK_STATE_CHANGE_DOMAIN_CALLBACKS)
+    return {
+        "entities": len(entity_index),
+        "domains": len(domain_index),
+        "events": entity_index.events + domain_index.events,
+        "jobs": entity_index.jobs + domain_index.jobs,
+        "templates": entity_index.templates,
+    }
+
+
 @callback
 def _async_state_change_filter(
     hass: HomeAssistant, callbacks: dict[str, list[HassJob[[Event], Any]]], event: Event
@@ -295,6 +345,7 @@ def _async_track_state_change_event(
     action: Callable[[Event], Any],
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
+    _async_state_change_index(hass, TRACK_STATE_CHANGE_CALLBACKS)
     return _async_track_event(
         hass,
         entity_ids,
@@ -307,6 +358,55 @@ def _async_track_state_change_event(
     )
 
 
+@callback
+def _async_dispatch_domain_state_change_event(
+    hass: HomeAssistant,
+    callbacks: _StateChangeIndex,
+    event: Event,
+) -> None:
+    """Dispatch to listeners of the domain of the entity."""
+    domain = split_entity_id(event.data["entity_id"])[0]
+    if not (callbacks_list := callbacks.get(domain)):
+        return
+    callbacks.events += 1
+    callbacks.jobs += len(callbacks_list)
+    for job in callbacks_list[:]:
+        try:
+            hass.async_run_hass_job(job, event)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "Error while processing event %s for domain %s", event, domain
+            )
+
+
+@callback
+def _async_domain_state_change_filter(
+    hass: HomeAssistant, callbacks: dict[str, list[HassJob[[Event], Any]]], event: Event
+) -> bool:
+    """Filter state changes by domain."""
+    return split_entity_id(event.data["entity_id"])[0] in callbacks
+
+
+@bind_hass
+def _async_track_state_change_domain_event(
+    hass: HomeAssistant,
+    domains: str | Iterable[str],
+    action: Callable[[Event], Any],
+) -> CALLBACK_TYPE:
+    """Track state change events of all entities in lowercased domains."""
+    _async_state_change_index(hass, TRACK_STATE_CHANGE_DOMAIN_CALLBACKS)
+    return _async_track_event(
+        hass,
+        domains,
+        TRACK_STATE_CHANGE_DOMAIN_CALLBACKS,
+        TRACK_STATE_CHANGE_DOMAIN_LISTENER,
+        EVENT_STATE_CHANGED,
+        _async_dispatch_domain_state_change_event,
+        _async_domain_state_change_filter,
+        action,
+    )
+
+
 @callback
 def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
@@ -318,9 +418,7 @@ def _async_track_event(
     callbacks_key: str,
     listeners_key: str,
     event_type: str,
-    dispatcher_callable: Callable[
-        [HomeAssistant, dict[str, list[HassJob[[Event], Any]]], Event], None
-    ],
+    dispatcher_callable: Callable[[HomeAssistant, _IndexT, Event], None],
     filter_callable: Callable[
         [HomeAssistant, dict[str, list[HassJob[[Event], Any]]], Event], bool
     ],
@@ -333,9 +431,7 @@ def _async_track_event(
     if isinstance(keys, str):
         keys = [keys]
 
-    callbacks: dict[str, list[HassJob[[Event], Any]]] = hass.data.setdefault(
-        callbacks_key, {}
-    )
+    callbacks: _IndexT = hass.data.setdefault(callbacks_key, {})
 
     if listeners_key not in hass.data:
         hass.data[listeners_key] = hass.bus.async_listen(
@@ -576,9 +672,6 @@ class _TrackStateChangeFiltered:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
         self._action = action
-        self._action_as_hassjob = HassJob(
-            action, f"track state change filtered {track_states}"
-        )
         self._listeners: dict[str, Callable[[], None]] = {}
         self._last_track_states: TrackStates = track_states
 
@@ -662,9 +755,14 @@ class _TrackStateChangeFiltered:
 
     @callback
     def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
+        # State changes of entities in the domains are
+        # already dispatched by the domains listener
         if domains:
-            entities = entities.copy()
-            entities.update(self.hass.states.async_entity_ids(domains))
+            entities = {
+                entity_id
+                for entity_id in entities
+                if split_entity_id(entity_id)[0] not in domains
+            }
 
         # Entities has changed to none
         if not entities:
@@ -674,21 +772,13 @@ class _TrackStateChangeFiltered:
             self.hass, entities, self._action
         )
 
-    @callback
-    def _state_added(self, event: Event) -> None:
-        self._cancel_listener(_ENTITIES_LISTENER)
-        self._setup_entities_listener(
-            self._last_track_states.domains, self._last_track_states.entities
-        )
-        self.hass.async_run_hass_job(self._action_as_hassjob, event)
-
     @callback
     def _setup_domains_listener(self, domains: set[str]) -> None:
         if not domains:
             return
 
-        self._listeners[_DOMAINS_LISTENER] = _async_track_state_added_domain(
-            self.hass, domains, self._state_added
+        self._listeners[_DOMAINS_LISTENER] = _async_track_state_change_domain_event(
+            self.hass, domains, self._action
         )
 
     @callback
@@ -844,6 +934,18 @@ class TrackTemplateResultInfo:
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
+        # Positions in _track_templates of the templates which may re-render
+        # on a state change, by the entity_id and domain they depend on
+        self._entity_index: dict[str, set[int]] = {}
+        self._domain_index: dict[str, set[int]] = {}
+        self._domain_lifecycle_index: dict[str, set[int]] = {}
+        self._all_states_index: set[int] = set()
+        self._all_states_lifecycle_index: set[int] = set()
+        # Counts the templates considered for a re-render in the debug stats
+        self._state_change_index = _async_state_change_index(
+            hass, TRACK_STATE_CHANGE_CALLBACKS
+        )
+
     def __repr__(self) -> str:
         """Return the representation."""
         return f"<TrackTemplateResultInfo {self._info}>"
@@ -894,6 +996,7 @@ class TrackTemplateResultInfo:
         self._track_state_changes = async_track_state_change_filtered(
             self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
         )
+        self._update_template_index()
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -939,6 +1042,56 @@ class TrackTemplateResultInfo:
             self.hass, _refresh_from_time, second=0
         )
 
+    @callback
+    def _update_template_index(self) -> None:
+        """Index the tracked templates by the states their render depends on."""
+        entity_index: dict[str, set[int]] = {}
+        domain_index: dict[str, set[int]] = {}
+        domain_lifecycle_index: dict[str, set[int]] = {}
+        all_states_index: set[int] = set()
+        all_states_lifecycle_index: set[int] = set()
+
+        for idx, track_template_ in enumerate(self._track_templates):
+            if (info := self._info.get(track_template_.template)) is None:
+                continue
+            # Templates which failed to render re-render on any state change
+            if info.all_states or info.exception:
+                all_states_index.add(idx)
+            else:
+                for entity_id in info.entities:
+                    entity_index.setdefault(entity_id, set()).add(idx)
+                for domain in info.domains:
+                    domain_index.setdefault(domain, set()).add(idx)
+            if info.all_states_lifecycle or info.exception:
+                all_states_lifecycle_index.add(idx)
+            else:
+                for domain in info.domains_lifecycle:
+                    domain_lifecycle_index.setdefault(domain, set()).add(idx)
+
+        self._entity_index = entity_index
+        self._domain_index = domain_index
+        self._domain_lifecycle_index = domain_lifecycle_index
+        self._all_states_index = all_states_index
+        self._all_states_lifecycle_index = all_states_lifecycle_index
+
+    @callback
+    def _templates_for_event(self, event: Event) -> list[TrackTemplate]:
+        """Return the tracked templates which may re-render because of an event."""
+        entity_id: str = event.data[ATTR_ENTITY_ID]
+        domain = split_entity_id(entity_id)[0]
+        indexes = self._all_states_index.union(
+            self._entity_index.get(entity_id, ()), self._domain_index.get(domain, ())
+        )
+        if event.data.get("new_state") is None or event.data.get("old_state") is None:
+            indexes.update(
+                self._all_states_lifecycle_index,
+                self._domain_lifecycle_index.get(domain, ()),
+            )
+
+        self._state_change_index.templates += len(indexes)
+        track_templates = self._track_templates
+        return [track_templates[idx] for idx in sorted(indexes)]
+
     @callback
     def _update_time_listeners(self) -> None:
         for template, info in self._info.items():
@@ -1043,8 +1196,9 @@ class TrackTemplateResultInfo:
         to be considered.
 
         track_templates is an optional list of TrackTemplate objects
-        to refresh.  If not provided, all tracked templates will be
-        considered.
+        to refresh.  If not provided, the tracked templates which depend
+        on the state changed by the event, or all tracked templates
+        without an event, will be considered.
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
@@ -1070,7 +1224,11 @@ class TrackTemplateResultInfo:
         block_updates = False
         super_template = self._track_templates[0] if self._has_super_template else None
 
-        track_templates = track_templates or self._track_templates
+        if track_templates is None:
+            if event is None:
+                track_templates = self._track_templates
+            else:
+                track_templates = self._templates_for_event(event)
 
         # Update the super template first
         if super_template is not None:
@@ -1109,6 +1267,7 @@ class TrackTemplateResultInfo:
                 info_changed |= _apply_update(update, track_template_.template)
 
         if info_changed:
+            self._update_template_index()
             assert self._track_state_changes
             self._track_state_changes.async_update_listeners(
                 _render_infos_to_track_states(
@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager, suppress
 from contextvars import ContextVar
 from copy import copy
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial
 import itertools
@@ -75,7 +76,11 @@ from homeassistant.util import slugify
 from homeassistant.util.dt import utcnow
 
 from . import condition, config_validation as cv, service, template
-from .condition import ConditionCheckerType, trace_condition_function
+from .condition import (
+    ConditionCheckerType,
+    condition_trace_update_result,
+    trace_condition,
+)
 from .dispatcher import async_dispatcher_connect, async_dispatcher_send
 from .event import async_call_later, async_track_template
 from .script_variables import ScriptVariables
@@ -350,6 +355,25 @@ class _StopScript(_HaltScript):
     """Throw if script needs to stop."""
 
 
+@dataclass(slots=True, frozen=True)
+class _ScriptStep:
+    """A step of a script, compiled when the script is created.
+
+    Holds everything about the step which does not depend on a run, so runs
+    only have to interpret the compiled sequence.
+    """
+
+    index: int
+    action: dict[str, Any]
+    action_type: str
+    handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]]
+    trace_path: str
+    enabled: bool
+    continue_on_error: bool
+    # Values of the action which contain no templates, rendered at compile time
+    rendered: Mapping[str, Any]
+
+
 class _ScriptRun:
     """Manage Script sequence run."""
 
@@ -368,6 +392,7 @@ class _ScriptRun:
         self._log_exceptions = log_exceptions
         self._step = -1
         self._action: dict[str, Any] | None = None
+        self._script_step: _ScriptStep | None = None
         self._stop = asyncio.Event()
         self._stopped = asyncio.Event()
 
@@ -403,7 +428,10 @@ class _ScriptRun:
 
         try:
             self._log("Running %s", self._script.running_description)
-            for self._step, self._action in enumerate(self._script.sequence):
+            # pylint: disable-next=protected-access
+            for self._script_step in self._script._compiled_sequence:
+                self._step = self._script_step.index
+                self._action = self._script_step.action
                 if self._stop.is_set():
                     script_execution_set("cancelled")
                     break
@@ -431,28 +459,28 @@ class _ScriptRun:
             self._finish()
 
     async def _async_step(self, log_exceptions):
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        script_step = self._script_step
 
-        with trace_path(str(self._step)):
+        with trace_path(script_step.trace_path):
             async with trace_action(self._hass, self, self._stop, self._variables):
                 if self._stop.is_set():
                     return
 
-                action = cv.determine_script_action(self._action)
-
-                if not self._action.get(CONF_ENABLED, True):
+                if not script_step.enabled:
                     self._log(
-                        "Skipped disabled step %s", self._action.get(CONF_ALIAS, action)
+                        "Skipped disabled step %s",
+                        self._action.get(CONF_ALIAS, script_step.action_type),
                     )
                     trace_set_result(enabled=False)
                     return
 
                 try:
-                    handler = f"_async_{action}_step"
-                    await getattr(self, handler)()
+                    await script_step.handler(self)
                 except Exception as ex:  # pylint: disable=broad-except
                     self._handle_exception(
-                        ex, continue_on_error, self._log_exceptions or log_exceptions
+                        ex,
+                        script_step.continue_on_error,
+                        self._log_exceptions or log_exceptions,
                     )
 
     def _finish(self) -> None:
@@ -500,7 +528,7 @@ class _ScriptRun:
             raise exception
 
     def _log_exception(self, exception):
-        action_type = cv.determine_script_action(self._action)
+        action_type = self._script_step.action_type
 
         error = str(exception)
         level = logging.ERROR
@@ -534,6 +562,8 @@ class _ScriptRun:
         )
 
     def _get_pos_time_period_template(self, key):
+        if (period := self._script_step.rendered.get(key)) is not None:
+            return period
         try:
             return cv.positive_time_period(
                 template.render_complex(self._action[key], self._variables)
@@ -714,6 +744,10 @@ class _ScriptRun:
             if conf not in self._action:
                 continue
 
+            if (rendered := self._script_step.rendered.get(conf)) is not None:
+                event_data.update(rendered)
+                continue
+
             try:
                 event_data.update(
                     template.render_complex(self._action[conf], self._variables)
@@ -733,7 +767,10 @@ class _ScriptRun:
         self._script.last_action = self._action.get(
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
-        cond = await self._async_get_condition(self._action)
+        # pylint: disable-next=protected-access
+        (cond,) = await self._script._async_get_step_conditions(
+            self._step, CONF_CONDITION, [self._action]
+        )
         try:
             trace_element = trace_stack_top(trace_stack_cv)
             if trace_element:
@@ -752,21 +789,11 @@ class _ScriptRun:
         if condition_path is None:
             condition_path = name
 
-        @trace_condition_function
-        def traced_test_conditions(hass, variables):
-            try:
-                with trace_path(condition_path):
-                    for idx, cond in enumerate(conditions):
-                        with trace_path(str(idx)):
-                            if cond(hass, variables) is False:
-                                return False
-            except exceptions.ConditionError as ex:
-                _LOGGER.warning("Error in '%s[%s]' evaluation: %s", name, idx, ex)
-                return None
-
-            return True
-
-        result = traced_test_conditions(self._hass, self._variables)
+        with trace_condition(self._variables):
+            result = _test_condition_list(
+                self._hass, self._variables, conditions, name, condition_path
+            )
+            condition_trace_update_result(result=result)
         return result
 
     @async_trace_path("repeat")
@@ -845,9 +872,10 @@ class _ScriptRun:
                 await async_run_sequence(iteration, extra_msg)
 
         elif CONF_WHILE in repeat:
-            conditions = [
-                await self._async_get_condition(config) for config in repeat[CONF_WHILE]
-            ]
+            # pylint: disable-next=protected-access
+            conditions = await self._script._async_get_step_conditions(
+                self._step, CONF_WHILE, repeat[CONF_WHILE]
+            )
             for iteration in itertools.count(1):
                 set_repeat_var(iteration)
                 try:
@@ -862,9 +890,10 @@ class _ScriptRun:
                 await async_run_sequence(iteration)
 
         elif CONF_UNTIL in repeat:
-            conditions = [
-                await self._async_get_condition(config) for config in repeat[CONF_UNTIL]
-            ]
+            # pylint: disable-next=protected-access
+            conditions = await self._script._async_get_step_conditions(
+                self._step, CONF_UNTIL, repeat[CONF_UNTIL]
+            )
             for iteration in itertools.count(1):
                 set_repeat_var(iteration)
                 await async_run_sequence(iteration)
@@ -1076,6 +1105,69 @@ class _QueuedScriptRun(_ScriptRun):
 
 
 @callback
+def _test_condition_list(
+    hass: HomeAssistant,
+    variables: dict[str, Any],
+    conditions: list[ConditionCheckerType],
+    name: str,
+    condition_path: str,
+) -> bool | None:
+    """Test a list of conditions, stop at the first one which fails."""
+    try:
+        with trace_path(condition_path):
+            for idx, cond in enumerate(conditions):
+                with trace_path(str(idx)):
+                    if cond(hass, variables) is False:
+                        return False
+    except exceptions.ConditionError as ex:
+        _LOGGER.warning("Error in '%s[%s]' evaluation: %s", name, idx, ex)
+        return None
+
+    return True
+
+
+async def _async_raise_step_error(err: Exception, script_run: _ScriptRun) -> None:
+    """Raise the error of a step which could not be compiled."""
+    raise err
+
+
+def _compile_step(index: int, action: dict[str, Any]) -> _ScriptStep:
+    """Compile a validated action into a script step."""
+    handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]]
+    try:
+        action_type = cv.determine_script_action(action)
+    except ValueError as err:
+        # Fail when the step is run, not when the script is created
+        action_type = "unknown"
+        handler = partial(_async_raise_step_error, err)
+    else:
+        handler = getattr(_ScriptRun, f"_async_{action_type}_step")
+    rendered: dict[str, Any] = {}
+    for key in (CONF_DELAY, CONF_TIMEOUT):
+        if key in action and not template.is_complex(action[key]):
+            with suppress(vol.Invalid):
+                rendered[key] = cv.positive_time_period(action[key])
+    if action_type == cv.SCRIPT_ACTION_FIRE_EVENT:
+        # Event data is merged into a new dict for every event, only values
+        # that can't be changed by listeners of the event are shared
+        for key in (CONF_EVENT_DATA, CONF_EVENT_DATA_TEMPLATE):
+            if key in action and all(
+                value is None or isinstance(value, (str, int, float))
+                for value in action[key].values()
+            ):
+                rendered[key] = action[key]
+    return _ScriptStep(
+        index=index,
+        action=action,
+        action_type=action_type,
+        handler=handler,
+        trace_path=str(index),
+        enabled=action.get(CONF_ENABLED, True),
+        continue_on_error=action.get(CONF_CONTINUE_ON_ERROR, False),
+        rendered=MappingProxyType(rendered),
+    )
+
+
 def _schedule_stop_scripts_after_shutdown(hass: HomeAssistant) -> None:
     """Stop running Script objects started after shutdown."""
     async_call_later(
@@ -1190,6 +1282,9 @@ class Script:
         self._hass = hass
         self.sequence = sequence
         template.attach(hass, self.sequence)
+        self._compiled_sequence = [
+            _compile_step(index, action) for index, action in enumerate(sequence)
+        ]
         self.name = name
         self.domain = domain
         self.running_description = running_description or f"{domain} script"
@@ -1211,6 +1306,7 @@ class Script:
         if script_mode == SCRIPT_MODE_QUEUED:
             self._queue_lck = asyncio.Lock()
         self._config_cache: dict[set[tuple], Callable[..., bool]] = {}
+        self._step_conditions: dict[tuple[int, str], list[ConditionCheckerType]] = {}
         self._repeat_script: dict[int, Script] = {}
         self._choose_data: dict[int, _ChooseData] = {}
         self._if_data: dict[int, _IfData] = {}
@@ -1567,6 +1663,15 @@ class Script:
             self._config_cache[config_cache_key] = cond
         return cond
 
+    async def _async_get_step_conditions(
+        self, step: int, key: str, configs: list[ConfigType]
+    ) -> list[ConditionCheckerType]:
+        """Return the conditions of a step, created at its first run."""
+        if (conditions := self._step_conditions.get((step, key))) is None:
+            conditions = [await self._async_get_condition(config) for config in configs]
+            self._step_conditions[(step, key)] = conditions
+        return conditions
+
     def _prep_repeat_script(self, step: int) -> Script:
         action = self.sequence[step]
         step_name = action.get(CONF_ALIAS, f"Repeat at step {step+1}")
@@ -5,17 +5,19 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 import inspect
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TypeVar, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 from homeassistant.util.file import WriteError
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
 
@@ -27,9 +29,27 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+JOURNAL_SUFFIX = ".journal"
+# Number of journal records after which the next save rewrites the whole file
+JOURNAL_MAX_RECORDS = 1000
+
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
 
+@dataclass(slots=True)
+class _JournalState:
+    """What the store file plus its journal currently hold.
+
+    The header and the entries are kept serialized, the data that was written
+    may be changed in place by its owner afterwards.
+    """
+
+    journal_id: str
+    header: bytes
+    entries: dict[str, dict[Any, bytes]]
+    records: int = 0
+
+
 @bind_hass
 async def async_migrator(
     hass: HomeAssistant,
@@ -84,8 +104,16 @@ class Store(Generic[_T]):
         atomic_writes: bool = False,
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
+        journal_collections: Mapping[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        journal_collections maps keys of the stored data holding lists of
+        entries to the key identifying each entry. When given, delayed saves
+        append the changed entries to a journal next to the file and only
+        rewrite the whole file every JOURNAL_MAX_RECORDS changes, and when
+        Home Assistant stops.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -98,12 +126,20 @@ class Store(Generic[_T]):
         self._load_task: asyncio.Future[_T | None] | None = None
         self._encoder = encoder
         self._atomic_writes = atomic_writes
+        self._journal_collections = journal_collections
+        # Only accessed while holding the write lock
+        self._journal_state: _JournalState | None = None
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def _journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -141,14 +177,17 @@ class Store(Generic[_T]):
             # If we didn't generate data yet, do it now.
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
+            elif "snapshot_func" in data:
+                data["data"] = data.pop("snapshot_func")()()
+            elif "serialize_func" in data:
+                # The pending write is building the data in the executor
+                data["data"] = data["serialize_func"]()
 
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data)
 
             if data == {}:
                 return None
@@ -209,6 +248,25 @@ class Store(Generic[_T]):
         delay: float = 0,
     ) -> None:
         """Save data with an optional delay."""
+        self._async_delay_save("data_func", data_func, delay)
+
+    @callback
+    def async_delay_save_snapshot(
+        self,
+        snapshot_func: Callable[[], Callable[[], _T]],
+        delay: float = 0,
+    ) -> None:
+        """Save data with an optional delay, building the data in the executor.
+
+        snapshot_func is called in the event loop and returns a function which
+        builds the data from an immutable snapshot. That function is called in
+        the executor, so it must not access anything the event loop mutates.
+        """
+        self._async_delay_save("snapshot_func", snapshot_func, delay)
+
+    @callback
+    def _async_delay_save(self, func_key: str, func: Callable, delay: float) -> None:
+        """Schedule saving the data produced by func."""
         # pylint: disable-next=import-outside-toplevel
         from .event import async_call_later
 
@@ -216,7 +274,7 @@ class Store(Generic[_T]):
             "version": self.version,
             "minor_version": self.minor_version,
             "key": self.key,
-            "data_func": data_func,
+            func_key: func,
         }
 
         self._async_cleanup_delay_listener()
@@ -262,37 +320,86 @@ class Store(Generic[_T]):
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
-        await self._async_handle_write_data()
+        await self._async_handle_write_data(compact_journal=True)
 
-    async def _async_handle_write_data(self, *_args):
-        """Handle writing the config."""
+    async def _async_handle_write_data(
+        self, *_args: Any, compact_journal: bool = False
+    ) -> None:
+        """Handle writing the config.
+
+        If compact_journal is set, the journal is merged into the file.
+        """
         async with self._write_lock:
             self._async_cleanup_delay_listener()
             self._async_cleanup_final_write_listener()
 
+            journal_state = None
+            if compact_journal:
+                # Without a journal state the next write rewrites the whole file
+                journal_state, self._journal_state = self._journal_state, None
+
             if self._data is None:
                 # Another write already consumed the data
+                if journal_state is not None and journal_state.records:
+                    await self._async_write_journal_state(journal_state)
                 return
 
             data = self._data
 
-            if "data_func" in data:
-                data["data"] = data.pop("data_func")()
-
-            self._data = None
+            try:
+                if "data_func" in data:
+                    data["data"] = data.pop("data_func")()
+                elif "snapshot_func" in data:
+                    data["serialize_func"] = data.pop("snapshot_func")()
+                    data["data"] = await self.hass.async_add_executor_job(
+                        data["serialize_func"]
+                    )
+                    del data["serialize_func"]
+            finally:
+                self._data = None
 
             try:
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal_state is not None and self._journal_state.records:
+                # Merge the journal into the file when Home Assistant stops
+                self._async_ensure_final_write_listener()
+
+    async def _async_write_journal_state(self, journal_state: _JournalState) -> None:
+        """Write the data held by the file and its journal to the file."""
+        data = json_util.json_loads_object(journal_state.header)
+        stored = cast(dict[str, Any], data["data"])
+        for collection, entries in journal_state.entries.items():
+            stored[collection] = [
+                json_util.json_loads(entry) for entry in entries.values()
+            ]
+        try:
+            await self._async_write_data(self.path, data)
+        except (json_util.SerializationError, WriteError) as err:
+            _LOGGER.error("Error writing config for %s: %s", self.key, err)
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
+    def _load_data(self) -> Any:
+        """Load the data and apply the journal, if any."""
+        data = json_util.load_json(self.path)
+        if self._journal_collections and isinstance(data, dict) and data:
+            self._replay_journal(data)
+        return data
+
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if self._journal_collections is not None:
+            if self._write_journal(data):
+                return
+            journal_id = random_uuid_hex()
+            data = {**data, "journal_id": journal_id}
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -302,6 +409,166 @@ class Store(Generic[_T]):
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal_collections is not None:
+            # The journal_id no longer matches, remove the outdated journal
+            with suppress(FileNotFoundError):
+                os.unlink(self._journal_path)
+            self._journal_state = None
+            if split := self._split_journal_data(data):
+                header, entries = split
+                self._journal_state = _JournalState(
+                    journal_id,
+                    self._encode_journal(header),
+                    {
+                        collection: {
+                            entry_id: self._encode_journal(entry)
+                            for entry_id, entry in collection_entries.items()
+                        }
+                        for collection, collection_entries in entries.items()
+                    },
+                )
+
+    def _split_journal_data(
+        self, data: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, dict[Any, Any]]] | None:
+        """Split data in the journaled entries and everything else.
+
+        Returns None if the data can't be journaled.
+        """
+        assert self._journal_collections is not None
+        stored = data.get("data")
+        if not isinstance(stored, dict):
+            return None
+        header = {key: value for key, value in data.items() if key != "journal_id"}
+        header["data"] = {
+            key: value
+            for key, value in stored.items()
+            if key not in self._journal_collections
+        }
+        entries: dict[str, dict[Any, Any]] = {}
+        try:
+            for collection, id_key in self._journal_collections.items():
+                entries[collection] = {
+                    entry[id_key]: entry for entry in stored.get(collection, [])
+                }
+        except (KeyError, TypeError):
+            return None
+        return header, entries
+
+    def _write_journal(self, data: dict[str, Any]) -> bool:
+        """Append the entries changed since the last write to the journal.
+
+        Returns False if the whole file needs to be written instead.
+        """
+        if (state := self._journal_state) is None or not (
+            split := self._split_journal_data(data)
+        ):
+            return False
+        header, entries = split
+        encoded: dict[str, dict[Any, bytes]] = {}
+        records: list[dict[str, Any]] = []
+        try:
+            if self._encode_journal(header) != state.header:
+                return False
+            for collection, new_entries in entries.items():
+                old_entries = state.entries[collection]
+                encoded[collection] = new_encoded = {
+                    entry_id: self._encode_journal(entry)
+                    for entry_id, entry in new_entries.items()
+                }
+                records.extend(
+                    {"collection": collection, "id": entry_id, "entry": entry}
+                    for entry_id, entry in new_entries.items()
+                    if old_entries.get(entry_id) != new_encoded[entry_id]
+                )
+                records.extend(
+                    {"collection": collection, "id": entry_id}
+                    for entry_id in old_entries
+                    if entry_id not in new_entries
+                )
+        except (TypeError, ValueError):
+            # Let the full write report the data that can't be serialized
+            return False
+        if state.records + len(records) > JOURNAL_MAX_RECORDS:
+            return False
+
+        if records:
+            lines = []
+            if not state.records:
+                lines.append(self._journal_line({"journal_id": state.journal_id}))
+            lines.extend(self._journal_line(record) for record in records)
+            try:
+                self._append_journal(b"".join(lines), truncate=not state.records)
+            except (OSError, TypeError, ValueError) as err:
+                _LOGGER.debug("Rewriting %s after journal error: %s", self.key, err)
+                return False
+
+        _LOGGER.debug("Journaled %d changes for %s", len(records), self.key)
+        state.entries = encoded
+        state.records += len(records)
+        return True
+
+    def _journal_line(self, record: dict[str, Any]) -> bytes:
+        """Encode a journal record as a single line."""
+        return self._encode_journal(record) + b"\n"
+
+    def _encode_journal(self, obj: Any) -> bytes:
+        """Serialize obj like the journal lines are serialized."""
+        if self._encoder and self._encoder is not JSONEncoder:
+            return self._encoder().encode(obj).encode("utf-8")
+        return json_helper.json_bytes(obj)
+
+    def _append_journal(self, lines: bytes, truncate: bool) -> None:
+        """Append lines to the journal, starting a new one if truncate is set."""
+        flags = os.O_WRONLY | os.O_CREAT
+        flags |= os.O_TRUNC if truncate else os.O_APPEND
+        journal_fd = os.open(
+            self._journal_path, flags, 0o600 if self._private else 0o644
+        )
+        with open(journal_fd, "wb") as journal:
+            journal.write(lines)
+            if self._atomic_writes:
+                journal.flush()
+                os.fsync(journal.fileno())
+
+    def _replay_journal(self, data: dict[str, Any]) -> None:
+        """Apply the journal written since the last full write to data."""
+        assert self._journal_collections is not None
+        try:
+            with open(self._journal_path, "rb") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return
+        if not lines or not isinstance(stored := data.get("data"), dict):
+            return
+        try:
+            header = json_util.json_loads_object(lines[0])
+        except ValueError:
+            header = {}
+        if not data.get("journal_id") or header.get("journal_id") != data["journal_id"]:
+            # Written for an older version of the file
+            return
+
+        collections = {
+            collection: {entry[id_key]: entry for entry in stored.get(collection, [])}
+            for collection, id_key in self._journal_collections.items()
+        }
+        for line in lines[1:]:
+            try:
+                record = json_util.json_loads_object(line)
+                entries = collections[cast(str, record["collection"])]
+                if "entry" in record:
+                    entries[record["id"]] = record["entry"]
+                else:
+                    entries.pop(record["id"], None)
+            except (KeyError, TypeError, ValueError):
+                # An interrupted write can leave an incomplete last line
+                _LOGGER.warning("Ignoring invalid journal record for %s", self.key)
+                break
+        for collection, entries in collections.items():
+            if collection in stored or entries:
+                stored[collection] = list(entries.values())
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -313,3 +580,6 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal_collections is not None:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self._journal_path)
@@ -5,6 +5,7 @@ from ast import literal_eval
 import asyncio
 import base64
 import collections.abc
+from collections import Counter
 from collections.abc import Callable, Collection, Generator, Iterable, MutableMapping
 from contextlib import contextmanager, suppress
 from contextvars import ContextVar
@@ -32,7 +33,6 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import async_timeout
 from awesomeversion import AwesomeVersion
@@ -154,6 +154,19 @@ CACHED_TEMPLATE_NO_COLLECT_LRU: MutableMapping[State, TemplateState] = LRU(
 )
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+#
+# The same template source is often used by many Template instances,
+# for example in blueprints or the value_template of discovered MQTT
+# entities. Compiled code is shared between them and the most recently
+# used sources of each render mode are kept, so templates created again
+# later do not need to be compiled again.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+COMPILED_TEMPLATE_LRU: MutableMapping[tuple[str, str], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
+_COMPILED_TEMPLATE_STATS: Counter[str] = Counter()
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -177,6 +190,15 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
     return template_state
 
 
+def compiled_template_cache_stats() -> dict[str, int]:
+    """Return the size, hits and misses of the compiled template cache."""
+    return {
+        "size": len(COMPILED_TEMPLATE_LRU),
+        "hits": _COMPILED_TEMPLATE_STATS["hits"],
+        "misses": _COMPILED_TEMPLATE_STATS["misses"],
+    }
+
+
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
 
@@ -763,9 +785,11 @@ class Template:
         self._strict = strict
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        if (compiled := env.bound_templates.get(self.template)) is None:
+            compiled = env.bound_templates[self.template] = jinja2.Template.from_code(
+                env, self._compiled_code, env.globals, None
+            )
+        self._compiled = compiled
 
         return self._compiled
 
@@ -2286,9 +2310,19 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | str | None
-        ] = weakref.WeakValueDictionary()
+        if hass is None:
+            self.render_mode = "no_hass"
+        elif limited:
+            self.render_mode = "limited"
+        elif strict:
+            self.render_mode = "strict"
+        else:
+            self.render_mode = "default"
+        # Templates bound to this environment, shared by the Template
+        # instances with the same source
+        self.bound_templates: MutableMapping[str, jinja2.Template] = LRU(
+            COMPILED_TEMPLATE_CACHE_SIZE
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2558,10 +2592,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             or filename is not None
             or raw is not False
             or defer_init is not False
+            or not isinstance(source, str)
         ):
-            # If there are any non-default keywords args, we do
-            # not cache.  In prodution we currently do not have
-            # any instance of this.
+            # If there are any non-default keywords args, or the
+            # source is already parsed, we do not cache.  In
+            # production we currently do not have any instance of this.
             return super().compile(  # type: ignore[no-any-return,call-overload]
                 source,
                 name,
@@ -2570,9 +2605,13 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        key = (source, self.render_mode)
+        if (cached := COMPILED_TEMPLATE_LRU.get(key)) is not None:
+            _COMPILED_TEMPLATE_STATS["hits"] += 1
+            return cached
 
+        _COMPILED_TEMPLATE_STATS["misses"] += 1
+        cached = COMPILED_TEMPLATE_LRU[key] = super().compile(source)
         return cached
 
 
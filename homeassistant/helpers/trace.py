@@ -12,6 +12,8 @@ import homeassistant.util.dt as dt_util
 
 from .typing import TemplateVarsType
 
+_MISSING = object()
+
 
 class TraceElement:
     """Container for trace data."""
@@ -29,12 +31,18 @@ class TraceElement:
         if variables is None:
             variables = {}
         last_variables = variables_cv.get() or {}
-        variables_cv.set(dict(variables))
+        # Values are shared with the previous snapshot, an identity check
+        # avoids deep comparisons of unchanged payloads like the trigger
         changed_variables = {
             key: value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
+            if (last_value := last_variables.get(key, _MISSING)) is not value
+            and (last_value is _MISSING or last_value != value)
         }
+        # Only take a new snapshot when the variables changed, the script
+        # mutates its variables in place so it can't be shared itself
+        if changed_variables or len(variables) != len(last_variables):
+            variables_cv.set(dict(variables))
         self._variables = changed_variables
 
     def __repr__(self) -> str:
@@ -12,8 +12,11 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
+import stat
 import sys
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,6 +28,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -48,6 +52,9 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_CACHE = "integration_manifest_cache"
+# Dict of module name to seconds it took to import it
+DATA_IMPORT_TIME = "integration_import_time"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -61,6 +68,10 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_CACHE_STORAGE_KEY = "core.integration_manifests"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 60
+
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
 
@@ -153,6 +164,7 @@ class Manifest(TypedDict, total=False):
     issue_tracker: str
     quality_scale: str
     iot_class: str
+    import_executor: bool
     bluetooth: list[dict[str, int | str]]
     mqtt: list[str]
     ssdp: list[dict[str, str]]
@@ -177,6 +189,204 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class _ManifestCacheEntry(TypedDict, total=False):
+    """A parsed manifest and the dependencies resolved from it."""
+
+    mtime_ns: int
+    size: int
+    manifest: Manifest
+    # Domain and integration directory of all (sub)dependencies
+    dependencies: dict[str, str]
+
+
+class _ManifestCache:
+    """Persist parsed manifests and resolved dependencies between restarts.
+
+    Entries are keyed by the integration directory and are only reused when the
+    modification time and size of the manifest.json and the Home Assistant
+    version did not change.
+
+    Manifests are looked up from the executor while resolving integrations.
+    That only reads the entries, which are replaced and never changed, and
+    hands the result back to the event loop, where all state is updated.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            MANIFEST_CACHE_STORAGE_VERSION,
+            MANIFEST_CACHE_STORAGE_KEY,
+            private=True,
+        )
+        self._entries: dict[str, _ManifestCacheEntry] = {}
+        # Directories of the entries used since start, only those are saved
+        self._used: set[str] = set()
+        # Directories of the manifests that did not change since the last save
+        self._unchanged: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    async def async_load(self) -> None:
+        """Load the cache from disk."""
+        try:
+            data = await self._store.async_load()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error loading the integration manifest cache")
+            return
+        if data is not None and data.get("ha_version") == __version__:
+            self._entries = data["manifests"]
+
+    def get_manifest(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the manifest at manifest_path or None if it does not exist.
+
+        Raises the JSON decode exceptions when the manifest is invalid.
+        """
+        try:
+            manifest_stat = os.stat(manifest_path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(manifest_stat.st_mode):
+            return None
+        key = str(manifest_path.parent)
+        if (
+            (entry := self._entries.get(key))
+            and entry["mtime_ns"] == manifest_stat.st_mtime_ns
+            and entry["size"] == manifest_stat.st_size
+        ):
+            self.hass.loop.call_soon_threadsafe(self._async_manifest_read, key, None)
+            # Integration adds keys to its manifest
+            return cast(Manifest, dict(entry["manifest"]))
+
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        self.hass.loop.call_soon_threadsafe(
+            self._async_manifest_read,
+            key,
+            {
+                "mtime_ns": manifest_stat.st_mtime_ns,
+                "size": manifest_stat.st_size,
+                "manifest": cast(Manifest, dict(manifest)),
+            },
+        )
+        return manifest
+
+    def _async_manifest_read(self, key: str, entry: _ManifestCacheEntry | None) -> None:
+        """Record a manifest read by get_manifest, entry is None for a hit.
+
+        Scheduled from the executor before the job that resolves the
+        integration returns, so it runs before the loop continues with it.
+        """
+        self._used.add(key)
+        if entry is None:
+            self.hits += 1
+            self._unchanged.add(key)
+            return
+        self.misses += 1
+        self._entries[key] = entry
+        self._async_schedule_save()
+
+    def _async_is_unchanged(self, integration: Integration) -> bool:
+        """Return if the manifest of the integration was loaded from the cache."""
+        return str(integration.file_path) in self._unchanged
+
+    async def async_get_dependencies(self, integration: Integration) -> set[str] | None:
+        """Return the cached dependencies of an integration.
+
+        The dependencies are only valid when none of the manifests of the
+        integration and its (sub)dependencies changed and all of them still
+        resolve to the same integration directories.
+        """
+        if not self._async_is_unchanged(integration) or (
+            (
+                dependencies := self._entries[str(integration.file_path)].get(
+                    "dependencies"
+                )
+            )
+            is None
+        ):
+            return None
+        integrations = await async_get_integrations(self.hass, dependencies)
+        for domain, file_path in dependencies.items():
+            dep_integration = integrations[domain]
+            if (
+                not isinstance(dep_integration, Integration)
+                or str(dep_integration.file_path) != file_path
+                or not self._async_is_unchanged(dep_integration)
+            ):
+                return None
+        return set(dependencies)
+
+    def async_set_dependencies(
+        self, integration: Integration, dependencies: set[str]
+    ) -> None:
+        """Store the resolved dependencies of an integration."""
+        key = str(integration.file_path)
+        if (entry := self._entries.get(key)) is None:
+            return
+        integrations: dict[str, Integration | asyncio.Future[None]] = self.hass.data[
+            DATA_INTEGRATIONS
+        ]
+        file_paths: dict[str, str] = {}
+        for domain in dependencies:
+            dep_integration = integrations.get(domain)
+            if not isinstance(dep_integration, Integration):
+                return
+            file_paths[domain] = str(dep_integration.file_path)
+        if entry.get("dependencies") == file_paths:
+            return
+        self._entries[key] = {
+            "mtime_ns": entry["mtime_ns"],
+            "size": entry["size"],
+            "manifest": entry["manifest"],
+            "dependencies": file_paths,
+        }
+        self._async_schedule_save()
+
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the entries used since start to store in the file."""
+        entries = self._entries
+        return {
+            "ha_version": __version__,
+            "manifests": {key: entries[key] for key in self._used if key in entries},
+        }
+
+
+async def _async_get_manifest_cache(hass: HomeAssistant) -> _ManifestCache:
+    """Return the loaded manifest cache."""
+    if (cache_or_evt := hass.data.get(DATA_MANIFEST_CACHE)) is None:
+        evt = hass.data[DATA_MANIFEST_CACHE] = asyncio.Event()
+
+        manifest_cache = _ManifestCache(hass)
+        await manifest_cache.async_load()
+
+        hass.data[DATA_MANIFEST_CACHE] = manifest_cache
+        evt.set()
+        return manifest_cache
+
+    if isinstance(cache_or_evt, asyncio.Event):
+        await cache_or_evt.wait()
+        return cast(_ManifestCache, hass.data[DATA_MANIFEST_CACHE])
+
+    return cast(_ManifestCache, cache_or_evt)
+
+
+def _read_manifest(hass: HomeAssistant, manifest_path: pathlib.Path) -> Manifest | None:
+    """Return the manifest at manifest_path or None if it does not exist."""
+    if isinstance(manifest_cache := hass.data.get(DATA_MANIFEST_CACHE), _ManifestCache):
+        return manifest_cache.get_manifest(manifest_path)
+    if not manifest_path.is_file():
+        return None
+    return cast(Manifest, json_loads(manifest_path.read_text()))
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -201,6 +411,7 @@ async def _async_get_custom_components(
     dirs = await hass.async_add_executor_job(
         get_sub_directories, custom_components.__path__
     )
+    await _async_get_manifest_cache(hass)
 
     integrations = await hass.async_add_executor_job(
         _resolve_integrations_from_root,
@@ -552,17 +763,17 @@ class Integration:
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                manifest = _read_manifest(hass, manifest_path)
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
                 )
                 continue
 
+            if manifest is None:
+                continue
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
@@ -627,6 +838,10 @@ class Integration:
         self.file_path = file_path
         self.manifest = manifest
         manifest["is_built_in"] = self.is_built_in
+        # Seconds spent finding and parsing the manifest
+        self.load_seconds = 0.0
+        # Futures of the modules being imported in the executor
+        self._import_futures: dict[str, asyncio.Future[None]] = {}
 
         if self.dependencies:
             self._all_dependencies_resolved: bool | None = None
@@ -697,6 +912,15 @@ class Integration:
         """Return the integration IoT Class."""
         return self.manifest.get("iot_class")
 
+    @property
+    def import_executor(self) -> bool:
+        """Return if the integration can be imported in the executor.
+
+        Integrations opt in with their manifest, as importing them must not
+        depend on running in the event loop.
+        """
+        return self.manifest.get("import_executor", False)
+
     @property
     def integration_type(
         self,
@@ -769,11 +993,23 @@ class Integration:
         if self._all_dependencies_resolved is not None:
             return self._all_dependencies_resolved
 
+        manifest_cache: _ManifestCache | None = None
+        if isinstance(
+            cache_or_evt := self.hass.data.get(DATA_MANIFEST_CACHE), _ManifestCache
+        ):
+            manifest_cache = cache_or_evt
+
         try:
-            dependencies = await _async_component_dependencies(
-                self.hass, self.domain, self, set(), set()
-            )
-            dependencies.discard(self.domain)
+            if manifest_cache is None or (
+                (dependencies := await manifest_cache.async_get_dependencies(self))
+                is None
+            ):
+                dependencies = await _async_component_dependencies(
+                    self.hass, self.domain, self, set(), set()
+                )
+                dependencies.discard(self.domain)
+                if manifest_cache is not None:
+                    manifest_cache.async_set_dependencies(self, dependencies)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
         except IntegrationNotFound as err:
@@ -800,6 +1036,21 @@ class Integration:
 
         return self._all_dependencies_resolved
 
+    async def async_get_component(self) -> ComponentProtocol:
+        """Return the component.
+
+        The component is imported in the executor if the integration allows
+        it, otherwise in the event loop.
+        """
+        cache: dict[str, ComponentProtocol] = self.hass.data.setdefault(
+            DATA_COMPONENTS, {}
+        )
+        if self.domain not in cache:
+            if not self.import_executor:
+                return self.get_component()
+            await self._async_import(self.domain, self.pkg_path, self._import_component)
+        return cache[self.domain]
+
     def get_component(self) -> ComponentProtocol:
         """Return the component."""
         cache: dict[str, ComponentProtocol] = self.hass.data.setdefault(
@@ -808,10 +1059,18 @@ class Integration:
         if self.domain in cache:
             return cache[self.domain]
 
+        start = time.monotonic()
+        cache[self.domain] = self._import_component()
+        _record_import_time(self.hass, self.pkg_path, time.monotonic() - start)
+        return cache[self.domain]
+
+    def _import_component(self) -> ComponentProtocol:
+        """Import the component.
+
+        Does not touch hass.data, so it can run in the executor.
+        """
         try:
-            cache[self.domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
-            )
+            return cast(ComponentProtocol, importlib.import_module(self.pkg_path))
         except ImportError:
             raise
         except Exception as err:
@@ -820,7 +1079,23 @@ class Integration:
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
-        return cache[self.domain]
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform for an integration.
+
+        The platform is imported in the executor if the integration allows
+        it, otherwise in the event loop.
+        """
+        cache: dict[str, ModuleType] = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        full_name = f"{self.domain}.{platform_name}"
+        if full_name not in cache:
+            if not self.import_executor:
+                return self.get_platform(platform_name)
+            await self._async_import(
+                full_name,
+                f"{self.pkg_path}.{platform_name}",
+                ft.partial(self._import_platform_module, platform_name),
+            )
+        return cache[full_name]
 
     def get_platform(self, platform_name: str) -> ModuleType:
         """Return a platform for an integration."""
@@ -829,8 +1104,22 @@ class Integration:
         if full_name in cache:
             return cache[full_name]
 
+        start = time.monotonic()
+        cache[full_name] = self._import_platform_module(platform_name)
+        _record_import_time(
+            self.hass,
+            f"{self.pkg_path}.{platform_name}",
+            time.monotonic() - start,
+        )
+        return cache[full_name]
+
+    def _import_platform_module(self, platform_name: str) -> ModuleType:
+        """Import a platform.
+
+        Does not touch hass.data, so it can run in the executor.
+        """
         try:
-            cache[full_name] = self._import_platform(platform_name)
+            return self._import_platform(platform_name)
         except ImportError:
             raise
         except Exception as err:
@@ -843,29 +1132,92 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
-        return cache[full_name]
-
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    async def _async_import(
+        self, name: str, module_name: str, import_func: Callable[[], Any]
+    ) -> None:
+        """Import a module of the integration in the executor.
+
+        Callers that want a module that is already being imported wait for
+        that import and only retry it in the executor if it failed. The
+        imported module and its import time are stored from the event loop.
+
+        Modules imported here may also be imported with get_component or
+        get_platform from the event loop at the same time. That is safe, the
+        import lock of the module makes the loop wait for the import in the
+        executor to finish and both get the same module.
+        """
+        cache: dict[str, Any] = self.hass.data[DATA_COMPONENTS]
+        while future := self._import_futures.get(name):
+            await future
+            if name in cache:
+                return
+
+        future = self._import_futures[name] = self.hass.loop.create_future()
+        try:
+            module, seconds = await self.hass.async_add_executor_job(
+                _import_timed, import_func
+            )
+            cache[name] = module
+            _record_import_time(self.hass, module_name, seconds)
+        finally:
+            if self._import_futures.get(name) is future:
+                del self._import_futures[name]
+            future.set_result(None)
+
+    def platforms_exist(self, platform_names: Iterable[str]) -> list[str]:
+        """Return the platforms that exist on disk.
+
+        This method does I/O and must be run in the executor.
+        """
+        # Mocked integrations in tests have no file path
+        if not self.file_path:
+            return []
+        return [
+            platform_name
+            for platform_name in platform_names
+            if (self.file_path / f"{platform_name}.py").is_file()
+            or (self.file_path / platform_name).is_dir()
+        ]
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+def _import_timed(import_func: Callable[[], Any]) -> tuple[Any, float]:
+    """Import a module and return it with the seconds the import took."""
+    start = time.monotonic()
+    module = import_func()
+    return module, time.monotonic() - start
+
+
+def _record_import_time(hass: HomeAssistant, name: str, seconds: float) -> None:
+    """Record how long it took to import a module.
+
+    Async friendly.
+    """
+    import_time: dict[str, float] = hass.data.setdefault(DATA_IMPORT_TIME, {})
+    import_time[name] = seconds
+
+
 def _resolve_integrations_from_root(
     hass: HomeAssistant, root_module: ModuleType, domains: list[str]
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
+        start = time.monotonic()
         try:
             integration = Integration.resolve_from_root(hass, root_module, domain)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
             if integration:
+                integration.load_seconds = time.monotonic() - start
                 integrations[domain] = integration
     return integrations
 
@@ -919,6 +1271,8 @@ async def async_get_integrations(
     if not needed:
         return results
 
+    await _async_get_manifest_cache(hass)
+
     # First we look for custom components
     # Instead of using resolve_from_root we use the cache of custom
     # components to find the integration.
@@ -8,6 +8,11 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import resource
+import statistics
+import tempfile
+import time
+import tracemalloc
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -227,6 +232,23 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_machine_domain_filter(hass):
+    """Run 100k domain filtered lookups against 10k states in 50 domains."""
+    for domain_idx in range(50):
+        for idx in range(200):
+            hass.states.async_set(f"domain{domain_idx}.entity{idx}", "on")
+
+    start = timer()
+
+    for _ in range(10**5):
+        hass.states.async_entity_ids("domain0")
+        hass.states.async_entity_ids_count("domain1")
+        hass.states.async_all(("domain2", "domain3"))
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -314,6 +336,273 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def state_memory(hass):
+    """Keep 10 states of each of 10k entities and measure bytes per state.
+
+    The states are kept alive like in the history and logbook caches. Most
+    entities are sensors with static attributes, every fifth entity is a
+    light that alternates between an on and an off attribute set.
+    """
+    entities = 10**4
+    updates = 10
+    states = []
+
+    tracemalloc.start()
+    start_bytes = tracemalloc.get_traced_memory()[0]
+    start = timer()
+    for update in range(updates):
+        for idx in range(entities):
+            if idx % 5:
+                entity_id = f"sensor.sensor_{idx}"
+                hass.states.async_set(
+                    entity_id,
+                    str(update),
+                    {
+                        "state_class": "measurement",
+                        "unit_of_measurement": "°C",
+                        "device_class": "temperature",
+                        "friendly_name": f"Sensor {idx}",
+                    },
+                )
+            else:
+                entity_id = f"light.light_{idx}"
+                attributes = {
+                    "supported_color_modes": ["brightness"],
+                    "friendly_name": f"Light {idx}",
+                    "supported_features": 0,
+                }
+                if update % 2:
+                    attributes["color_mode"] = "brightness"
+                    attributes["brightness"] = 255
+                hass.states.async_set(
+                    entity_id, "on" if update % 2 else "off", attributes
+                )
+            states.append(hass.states.get(entity_id))
+    runtime = timer() - start
+    used_bytes = tracemalloc.get_traced_memory()[0] - start_bytes
+    tracemalloc.stop()
+
+    print(f"Bytes per state: {used_bytes / len(states):.0f}")
+    return runtime
+
+
+@benchmark
+async def area_targeted_service_calls(hass):
+    """Resolve 10k area targeted service calls on a 10k entity install.
+
+    The install has 100 areas with 10 devices each, every device has 10
+    entities and every tenth entity is assigned to an area of its own.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+    )
+    from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+    # pylint: enable=import-outside-toplevel
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await ar.async_load(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        area_reg = ar.async_get(hass)
+        dev_reg = dr.async_get(hass)
+        ent_reg = er.async_get(hass)
+
+        areas = [area_reg.async_create(f"Area {idx}").id for idx in range(100)]
+        for device_idx in range(1000):
+            device = dev_reg.async_get_or_create(
+                config_entry_id=f"config_entry_{device_idx % 10}",
+                identifiers={("benchmark", str(device_idx))},
+            )
+            dev_reg.async_update_device(device.id, area_id=areas[device_idx % 100])
+            for idx in range(10):
+                entry = ent_reg.async_get_or_create(
+                    "light", "benchmark", f"{device_idx}_{idx}", device_id=device.id
+                )
+                if not idx:
+                    ent_reg.async_update_entity(
+                        entry.entity_id, area_id=areas[(device_idx + 1) % 100]
+                    )
+
+        calls = [
+            core.ServiceCall("light", "turn_on", {"area_id": areas[idx % 100]})
+            for idx in range(10**4)
+        ]
+
+        start = timer()
+        for call in calls:
+            async_extract_referenced_entity_ids(hass, call)
+        runtime = timer() - start
+
+        # Stop before the registries are written to the removed directory
+        await hass.async_stop(force=True)
+
+    return runtime
+
+
+@benchmark
+async def script_step_overhead(hass):
+    """Run a script of 6 event and 4 condition steps 10k times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+    from homeassistant.helpers.script import Script
+
+    # pylint: enable=import-outside-toplevel
+
+    # Don't measure logging the steps
+    logging.getLogger("homeassistant.helpers.script").setLevel(logging.CRITICAL)
+    hass.states.async_set("binary_sensor.motion", "on")
+    event_step = {"event": "benchmark_event", "event_data": {"brightness": 255}}
+    condition_step = {
+        "condition": "state",
+        "entity_id": "binary_sensor.motion",
+        "state": "on",
+    }
+    sequence = cv.SCRIPT_SCHEMA(
+        [event_step, condition_step, event_step, condition_step, event_step] * 2
+    )
+    script = Script(hass, sequence, "Benchmark", "benchmark", script_mode="parallel")
+    context = core.Context()
+    runs = 10**4
+
+    # The first run creates the conditions
+    await script.async_run(context=context)
+    start = timer()
+    for _ in range(runs):
+        await script.async_run(context=context)
+    runtime = timer() - start
+
+    print(f"Step overhead: {runtime / (runs * len(sequence)) * 10**6:.2f} µs")
+    return runtime
+
+
+async def _async_benchmark_recorder(hass, fire_batch, batches):
+    """Feed events to a recorder with a temp file SQLite database.
+
+    fire_batch is called with the batch number and must fire the events
+    of the batch. The runtime from the first event until all events are
+    committed is returned, and events/sec, the latency of commits, the
+    hit ratios of the table manager LRUs and the peak RSS are printed.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import bootstrap, config_entries
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.helpers.recorder import async_initialize_recorder
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+        await bootstrap.load_registries(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {"recorder": {"db_url": f"sqlite:///{config_dir}/benchmark.db"}},
+        )
+        await hass.async_start()
+        await hass.async_block_till_done()
+        instance = get_instance(hass)
+        await instance.async_block_till_done()
+
+        commit_seconds = []
+        # The recorder has no hook to time its commits, wrap the private method
+        # pylint: disable-next=protected-access
+        commit_event_session = instance._commit_event_session
+
+        def _timed_commit_event_session():
+            """Time a commit of the event session."""
+            commit_start = time.monotonic()
+            commit_event_session()
+            commit_seconds.append(time.monotonic() - commit_start)
+
+        # pylint: disable-next=protected-access
+        instance._commit_event_session = _timed_commit_event_session
+
+        events = 0
+        start = timer()
+        for batch in range(batches):
+            events += fire_batch(batch)
+            # Keep the queue of the recorder below its maximum backlog
+            await hass.async_block_till_done()
+            await instance.async_block_till_done()
+        runtime = timer() - start
+
+        print(f"Events/sec: {events / runtime:.0f}")
+        if len(commit_seconds) >= 2:
+            percentiles = statistics.quantiles(commit_seconds, n=100)
+            print(
+                f"Commit latency ms: p50 {percentiles[49] * 1000:.2f}"
+                f" p95 {percentiles[94] * 1000:.2f}"
+                f" p99 {percentiles[98] * 1000:.2f}"
+                f" ({len(commit_seconds)} commits)"
+            )
+        for name, manager in (
+            ("event_data", instance.event_data_manager),
+            ("event_types", instance.event_type_manager),
+            ("state_attributes", instance.state_attributes_manager),
+            ("states_meta", instance.states_meta_manager),
+        ):
+            # The table managers don't expose the stats of their LRU
+            # pylint: disable-next=protected-access
+            hits, misses = manager._id_map.get_stats()
+            if lookups := hits + misses:
+                print(f"LRU hit ratio {name}: {hits / lookups:.3f}")
+        # ru_maxrss is in kilobytes on Linux
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"Peak RSS: {peak_rss / 1024:.1f} MiB")
+
+        await hass.async_stop()
+
+    return runtime
+
+
+@benchmark
+async def recorder_state_changes(hass):
+    """Record 100k state changes of 1k entities with deduplicated attributes."""
+    entities = 1000
+    batch_size = 10**4
+
+    def fire_batch(batch):
+        for idx in range(batch_size):
+            entity_idx = (batch * batch_size + idx) % entities
+            hass.states.async_set(
+                f"sensor.benchmark_{entity_idx}",
+                str(batch * batch_size + idx),
+                {
+                    "unit_of_measurement": "°C",
+                    "friendly_name": f"Benchmark {entity_idx}",
+                },
+            )
+        return batch_size
+
+    return await _async_benchmark_recorder(hass, fire_batch, 10)
+
+
+@benchmark
+async def recorder_events(hass):
+    """Record 100k custom events of 10 types with 100 distinct payloads."""
+    batch_size = 10**4
+
+    def fire_batch(batch):
+        for idx in range(batch_size):
+            hass.bus.async_fire(
+                f"benchmark_event_{idx % 10}", {"payload": (batch + idx) % 100}
+            )
+        return batch_size
+
+    return await _async_benchmark_recorder(hass, fire_batch, 10)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
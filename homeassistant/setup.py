@@ -53,6 +53,16 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_SETUP_PHASE_TIME is a dict [str, dict[str, float]], indicating how many
+# seconds were spent in each phase of setting up a component:
+# - loader: finding and parsing the manifest and resolving the dependencies
+# - import: importing the component
+# - setup: running the setup of the component
+DATA_SETUP_PHASE_TIME = "setup_phase_time"
+SETUP_PHASE_LOADER = "loader"
+SETUP_PHASE_IMPORT = "import"
+SETUP_PHASE_SETUP = "setup"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 SLOW_SETUP_WARNING = 10
@@ -195,8 +205,12 @@ async def _async_setup_component(
         return False
 
     # Validate all dependencies exist and there are no circular dependencies
+    start = timer()
     if not await integration.resolve_dependencies():
         return False
+    _async_add_phase_time(
+        hass, domain, SETUP_PHASE_LOADER, integration.load_seconds + timer() - start
+    )
 
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
@@ -208,11 +222,13 @@ async def _async_setup_component(
 
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
+    start = timer()
     try:
-        component = integration.get_component()
+        component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}")
         return False
+    _async_add_phase_time(hass, domain, SETUP_PHASE_IMPORT, timer() - start)
 
     processed_config = await conf_util.async_process_component_config(
         hass, config, integration
@@ -289,6 +305,7 @@ async def _async_setup_component(
             if warn_task:
                 warn_task.cancel()
         _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
+        _async_add_phase_time(hass, domain, SETUP_PHASE_SETUP, end - start)
 
         if result is False:
             log_error("Integration failed to initialize.")
@@ -357,7 +374,7 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        platform = await integration.async_get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -370,7 +387,7 @@ async def async_prepare_setup_platform(
     # If the integration is not set up yet, and can be set up, set it up.
     if integration.domain not in hass.config.components:
         try:
-            component = integration.get_component()
+            component = await integration.async_get_component()
         except ImportError as exc:
             log_error(f"Unable to import the component ({exc}).")
             return None
@@ -407,6 +424,35 @@ async def async_process_deps_reqs(
     processed.add(integration.domain)
 
 
+async def async_pre_import_integrations(
+    hass: core.HomeAssistant, integrations: Iterable[loader.Integration]
+) -> None:
+    """Import the components and entity platforms of integrations in the executor.
+
+    Only integrations that opt in with import_executor in their manifest are
+    imported. They are imported one at a time, dependencies first, so that
+    setting them up later does not have to wait on imports. Requirements are
+    not installed here, failures are ignored and setting up the integration
+    installs the requirements, retries the import and reports the error.
+    """
+    # The dependencies of an integration are a subset of the dependencies of
+    # everything depending on it
+    for integration in sorted(
+        integrations, key=lambda integration: len(integration.all_dependencies)
+    ):
+        if integration.disabled or not integration.import_executor:
+            continue
+        domain = integration.domain
+        try:
+            await integration.async_get_component()
+            for platform_name in await hass.async_add_executor_job(
+                integration.platforms_exist, BASE_PLATFORMS
+            ):
+                await integration.async_get_platform(platform_name)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to pre-import %s", domain, exc_info=True)
+
+
 @core.callback
 def async_when_setup(
     hass: core.HomeAssistant,
@@ -481,6 +527,18 @@ def async_get_loaded_integrations(hass: core.HomeAssistant) -> set[str]:
     return integrations
 
 
+@core.callback
+def _async_add_phase_time(
+    hass: core.HomeAssistant, domain: str, phase: str, seconds: float
+) -> None:
+    """Add the seconds spent in a setup phase of a component."""
+    phase_time: dict[str, dict[str, float]] = hass.data.setdefault(
+        DATA_SETUP_PHASE_TIME, {}
+    )
+    phases = phase_time.setdefault(domain, {})
+    phases[phase] = phases.get(phase, 0.0) + seconds
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant, components: Iterable[str]
@@ -156,6 +156,11 @@ async def test_diagnostics(
                     "sources": {},
                     "timings": {},
                 },
+                "advertisement_stages": {
+                    "counts": {},
+                    "match_seconds": 0.0,
+                    "dispatch_seconds": 0.0,
+                },
                 "connectable_history": [],
                 "all_history": [],
                 "scanners": [
@@ -327,6 +332,11 @@ async def test_diagnostics_macos(
                     "sources": {"44:44:33:11:23:45": "local"},
                     "timings": {"44:44:33:11:23:45": [ANY]},
                 },
+                "advertisement_stages": {
+                    "counts": {"dispatched": 1},
+                    "match_seconds": ANY,
+                    "dispatch_seconds": ANY,
+                },
                 "connectable_history": [
                     {
                         "address": "44:44:33:11:23:45",
@@ -518,6 +528,11 @@ async def test_diagnostics_remote_adapter(
                     "sources": {"44:44:33:11:23:45": "esp32"},
                     "timings": {"44:44:33:11:23:45": [ANY]},
                 },
+                "advertisement_stages": {
+                    "counts": ANY,
+                    "match_seconds": ANY,
+                    "dispatch_seconds": ANY,
+                },
                 "all_history": [
                     {
                         "address": "44:44:33:11:23:45",
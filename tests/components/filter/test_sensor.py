@@ -485,6 +485,68 @@ def test_time_sma(values: list[State]) -> None:
     assert filtered.state == 21.5
 
 
+@pytest.mark.parametrize(
+    "filter_factory",
+    [
+        lambda: OutlierFilter(window_size=3, precision=2, entity=None, radius=1.1),
+        lambda: LowPassFilter(
+            window_size=10, precision=2, entity=None, time_constant=10
+        ),
+        lambda: RangeFilter(entity=None, precision=2, lower_bound=10, upper_bound=20),
+        lambda: ThrottleFilter(window_size=3, precision=2, entity=None),
+        lambda: TimeThrottleFilter(
+            window_size=timedelta(minutes=2), precision=2, entity=None
+        ),
+        lambda: TimeSMAFilter(
+            window_size=timedelta(minutes=2), precision=2, entity=None, type="last"
+        ),
+    ],
+)
+def test_filter_states_matches_filter_state(
+    values: list[State], filter_factory
+) -> None:
+    """Test filtering a batch of states gives the same result as one by one."""
+    out = State("sensor.test_monitored", "unknown")
+    states = [out, *values, *values[::-1], out]
+    timestamp = values[0].last_updated
+    for idx, state in enumerate(states):
+        states[idx] = State(
+            state.entity_id,
+            state.state,
+            last_updated=timestamp + timedelta(minutes=idx),
+        )
+
+    filt = filter_factory()
+    expected = []
+    for state in states:
+        state = State(state.entity_id, state.state, last_updated=state.last_updated)
+        try:
+            filtered = filt.filter_state(state)
+        except ValueError:
+            continue
+        if not filt.skip_processing:
+            expected.append(filtered.state)
+
+    filt = filter_factory()
+    filtered_states = filt.filter_states(
+        [
+            (idx, State(state.entity_id, state.state, last_updated=state.last_updated))
+            for idx, state in enumerate(states[:5])
+        ]
+    )
+    filtered_states += filt.filter_states(
+        [
+            (idx, State(state.entity_id, state.state, last_updated=state.last_updated))
+            for idx, state in enumerate(states[5:], 5)
+        ]
+    )
+    assert [state.state for _, state in filtered_states] == expected
+    # The filtered states keep the index of their source state
+    indices = [idx for idx, _ in filtered_states]
+    assert indices == sorted(set(indices))
+    assert all(0 <= idx < len(states) for idx in indices)
+
+
 async def test_reload(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Verify we can reload filter sensors."""
     hass.states.async_set("sensor.test_monitored", 12345)
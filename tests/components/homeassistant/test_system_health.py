@@ -0,0 +1,20 @@
+"""Test Home Assistant system health."""
+from homeassistant.core import HomeAssistant, State
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_json_cache_stats(hass: HomeAssistant) -> None:
+    """Test the hits and misses of the JSON cache are reported."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+
+    info = await get_system_health_info(hass, "homeassistant")
+    state = State("light.kitchen", "on")
+    state.as_dict_json()
+    state.as_dict_json()
+    new_info = await get_system_health_info(hass, "homeassistant")
+
+    assert new_info["json_cache_hits"] == info["json_cache_hits"] + 1
+    assert new_info["json_cache_misses"] == info["json_cache_misses"] + 1
@@ -1815,3 +1815,117 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "expected_body"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            "sensor.temperature,domain=sensor,entity_id=temperature value=21.5 12345",
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            b"sensor.temperature,domain=sensor,entity_id=temperature value=21.5 12345\n",
+        ),
+    ],
+    indirect=["mock_client"],
+)
+async def test_event_listener_line_protocol(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api, expected_body
+) -> None:
+    """Test the event listener writes line protocol when configured."""
+    config = {"line_protocol": True}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+
+    state = MagicMock(
+        state="21.5",
+        domain="sensor",
+        entity_id="sensor.temperature",
+        object_id="temperature",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+    handler_method(event)
+    hass.data[influxdb.DOMAIN].block_till_done()
+
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    if influxdb.API_VERSION_2 in config.values():
+        assert write_api.call_args == call(bucket=DEFAULT_BUCKET, record=expected_body)
+    else:
+        assert write_api.call_args == call(
+            expected_body, time_precision=None, protocol="line"
+        )
+
+
+@pytest.mark.parametrize(
+    ("overflow_policy", "expected_events"),
+    [("drop_newest", ["first", "second"]), ("drop_oldest", ["second", "third"])],
+)
+async def test_event_listener_queue_overflow(
+    hass: HomeAssistant, overflow_policy, expected_events
+) -> None:
+    """Test the bounded queue drops events according to the overflow policy."""
+    instance = influxdb.InfluxThread(
+        hass,
+        Mock(),
+        Mock(),
+        0,
+        max_queue_size=2,
+        overflow_policy=overflow_policy,
+    )
+
+    for event in ("first", "second", "third"):
+        instance._event_listener(event)
+
+    assert [instance.queue.get_nowait()[1] for _ in range(2)] == expected_events
+    assert instance.dropped == {"overflow": 1}
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api"),
+    [(influxdb.API_VERSION_2, BASE_V2_CONFIG, _get_write_api_mock_v2)],
+    indirect=["mock_client"],
+)
+async def test_event_listener_spool(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api, tmp_path
+) -> None:
+    """Test events are spooled while unreachable and replayed afterwards."""
+    spool_file = tmp_path / "influxdb.spool"
+    config = {"spool_file": str(spool_file)}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+    # Failed writes have to raise to be spooled
+    assert mock_client.return_value.write_api.call_args == call(
+        write_options=influxdb.SYNCHRONOUS
+    )
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="fake.entity",
+        object_id="entity",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = OSError("foo")
+
+    handler_method(event)
+    hass.data[influxdb.DOMAIN].block_till_done()
+    spooled = b"fake.entity,domain=fake,entity_id=entity value=1.0 12345\n"
+    assert spool_file.read_bytes() == spooled
+    assert hass.data[influxdb.DOMAIN].dropped == {}
+
+    write_api.side_effect = None
+    handler_method(event)
+    hass.data[influxdb.DOMAIN].block_till_done()
+    assert write_api.call_args == call(bucket=DEFAULT_BUCKET, record=spooled)
+    assert not spool_file.exists()
+    assert hass.data[influxdb.DOMAIN].spool_bytes == 0
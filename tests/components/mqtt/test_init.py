@@ -14,7 +14,11 @@ import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    WildcardSubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -1022,6 +1026,65 @@ async def test_subscribe_topic_not_match(
     assert len(calls) == 0
 
 
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a/b/d", False),
+        ("a/+/c", "a/b", False),
+        ("a/#", "a", True),
+        ("a/#", "a/b/c", True),
+        ("a/#", "ab", False),
+        ("#", "a/b", True),
+        ("#", "$SYS/a", False),
+        ("+/a", "$SYS/a", False),
+        ("$SYS/#", "$SYS/a", True),
+        ("$SYS/+", "$SYS/a", True),
+        ("+/+", "/a", True),
+        ("+", "/a", False),
+        ("a/+/#", "a/b", True),
+    ],
+)
+def test_wildcard_subscription_trie_match(
+    topic_filter: str, topic: str, matches: bool
+) -> None:
+    """Test matching topics against wildcard topic filters."""
+    trie = WildcardSubscriptionTrie()
+    subscription = Subscription(topic_filter, ha.HassJob(lambda msg: None))
+    trie.add(subscription)
+    assert (trie.match(topic) == [subscription]) is matches
+
+
+def test_wildcard_subscription_trie_add_remove() -> None:
+    """Test tracking and untracking wildcard subscriptions."""
+    trie = WildcardSubscriptionTrie()
+    sub_1 = Subscription("home/+/state", ha.HassJob(lambda msg: None))
+    sub_2 = Subscription("home/#", ha.HassJob(lambda msg: None))
+    sub_3 = Subscription("home/+/state", ha.HassJob(lambda msg: None))
+    for sub in (sub_1, sub_2, sub_3):
+        trie.add(sub)
+
+    assert set(trie) == {sub_1, sub_2, sub_3}
+    assert trie.has_topic("home/+/state")
+    assert not trie.has_topic("home/+")
+    assert set(trie.match("home/kitchen/state")) == {sub_1, sub_2, sub_3}
+
+    trie.remove(sub_1)
+    assert set(trie.match("home/kitchen/state")) == {sub_2, sub_3}
+    with pytest.raises(ValueError):
+        trie.remove(sub_1)
+
+    trie.remove(sub_3)
+    assert not trie.has_topic("home/+/state")
+    assert trie.match("home/kitchen/state") == [sub_2]
+
+    trie.remove(sub_2)
+    assert list(trie) == []
+    assert trie.match("home/kitchen/state") == []
+    with pytest.raises(KeyError):
+        trie.remove(sub_2)
+
+
 async def test_subscribe_topic_level_wildcard(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
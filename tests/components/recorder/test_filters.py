@@ -6,6 +6,7 @@ from homeassistant.components.recorder.filters import (
     Filters,
     extract_include_exclude_filter_conf,
     merge_include_exclude_filters,
+    sqlalchemy_filter_from_entity_filter,
 )
 from homeassistant.helpers.entityfilter import (
     CONF_DOMAINS,
@@ -13,6 +14,7 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    convert_include_exclude_filter,
 )
 
 EMPTY_INCLUDE_FILTER = {
@@ -156,3 +158,23 @@ async def test_an_empty_filter_raises() -> None:
         match="No filter configuration provided, check has_config before calling this method",
     ):
         filters.events_entity_filter()
+
+
+def test_sqlalchemy_filter_from_entity_filter() -> None:
+    """Test building a sql filter from an entity filter."""
+    empty_filter = convert_include_exclude_filter(
+        extract_include_exclude_filter_conf({})
+    )
+    assert sqlalchemy_filter_from_entity_filter(empty_filter) is None
+
+    entity_filter = convert_include_exclude_filter(
+        extract_include_exclude_filter_conf(SIMPLE_INCLUDE_EXCLUDE_FILTER)
+    )
+    filters = sqlalchemy_filter_from_entity_filter(entity_filter)
+    assert filters is not None
+    assert filters.has_config
+    assert repr(filters) == (
+        "<Filters excluded_entities={'sensor.one'} excluded_domains={'homeassistant'}"
+        " excluded_entity_globs={'climate.*'} included_entities={'sensor.one'}"
+        " included_domains={'homeassistant'} included_entity_globs={'climate.*'}>"
+    )
@@ -366,11 +366,11 @@ def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        if instance.states_manager.has_queued or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -1380,6 +1380,54 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+def test_saving_sets_old_state_within_one_commit(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test old states are linked when an entity changes more than once per commit."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+
+    hass.states.set("test.one", "s1", {"attr": 1})
+    hass.states.set("test.two", "s2", {"attr": 1})
+    hass.states.set("test.one", "s3", {"attr": 2})
+    hass.states.set("test.one", "s4", {"attr": 1})
+    hass.states.remove("test.two")
+    wait_recording_done(hass)
+    hass.states.set("test.one", "s5", {"attr": 2})
+    wait_recording_done(hass)
+
+    if instance._bulk_insert_states:
+        assert instance.state_rows_per_second
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state[None].entity_id == "test.two"
+        assert states_by_state[None].old_state_id == states_by_state["s2"].state_id
+
+    attributes_ids = {
+        state: row.attributes_id for state, row in states_by_state.items()
+    }
+    assert attributes_ids["s1"] == attributes_ids["s4"]
+    assert attributes_ids["s3"] == attributes_ids["s5"]
+    assert attributes_ids["s1"] != attributes_ids["s3"]
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
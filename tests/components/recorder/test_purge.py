@@ -159,6 +159,43 @@ async def test_purge_old_states(
         assert state_attributes.count() == 3
 
 
+async def test_purge_old_states_reports_progress(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging old states reports progress and stops at the slice end."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with patch.object(purge, "PURGE_SLICE_SECONDS", -1):
+        finished = purge_old_data(
+            instance, purge_before, states_batch_size=10, repack=False
+        )
+    assert not finished
+    progress = instance.purge_progress
+    assert progress.purge_before == purge_before
+    assert progress.estimated_remaining_rows == 4
+    # The old states share 2 attributes rows that are purged with them
+    assert progress.purged_rows == 6
+    assert progress.rows_per_second > 0
+    assert not progress.completed
+
+    finished = purge_old_data(instance, purge_before, repack=False)
+    assert finished
+    assert instance.purge_progress is progress
+    assert progress.purged_rows == 6
+    assert progress.estimated_remaining_rows == 0
+    assert progress.completed
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+        assert session.query(StateAttributes).count() == 1
+
+    finished = purge_old_data(instance, dt_util.utcnow(), repack=False)
+    assert instance.purge_progress is not progress
+
+
 async def test_purge_old_states_encouters_database_corruption(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -5,8 +5,10 @@ import pytest
 
 from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.purge import PurgeProgress
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from .common import async_wait_recording_done
 
@@ -116,3 +118,42 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
     }
+
+
+async def test_recorder_system_health_state_rows_per_second(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health reports the state write throughput."""
+    if recorder_db_url.startswith("mysql://"):
+        # MySQL can not return the ids of an executemany
+        return
+
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.test", "1")
+    hass.states.async_set("sensor.test", "2")
+    await async_wait_recording_done(hass)
+
+    info = await get_system_health_info(hass, "recorder")
+    assert float(info["state_rows_per_second"]) > 0
+
+
+async def test_recorder_system_health_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health reports the purge progress."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert "purge_rows_per_second" not in info
+    assert "purge_estimated_remaining_rows" not in info
+
+    recorder_mock.purge_progress = PurgeProgress(
+        dt_util.utcnow(),
+        purged_rows=500,
+        purge_seconds=2.0,
+        estimated_remaining_rows=1000,
+    )
+    info = await get_system_health_info(hass, "recorder")
+    assert info["purge_rows_per_second"] == "250.0"
+    assert info["purge_estimated_remaining_rows"] == 1000
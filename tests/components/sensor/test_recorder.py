@@ -34,7 +34,11 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
@@ -5195,3 +5199,109 @@ async def test_exclude_attributes(
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+async def test_compile_statistics_from_accumulated_states(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test statistics compiled from accumulated states match the database."""
+    now = dt_util.utcnow()
+    period0 = now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+    period1 = period0 + timedelta(minutes=5)
+    period1_end = period1 + timedelta(minutes=5)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+
+    with freeze_time(period0 + timedelta(seconds=1)) as freezer:
+        hass.states.async_set("sensor.power", "5", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.energy", "1", ENERGY_SENSOR_ATTRIBUTES)
+        # The first compile starts collecting states for the next period
+        do_adhoc_statistics(hass, start=period0 - timedelta(hours=1))
+        await async_wait_recording_done(hass)
+
+        freezer.move_to(period1 + timedelta(minutes=1))
+        hass.states.async_set("sensor.power", "10", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.energy", "3", ENERGY_SENSOR_ATTRIBUTES)
+        freezer.move_to(period1 + timedelta(minutes=2))
+        hass.states.async_set(
+            "sensor.power", "10", {**POWER_SENSOR_ATTRIBUTES, "extra": "attribute"}
+        )
+        hass.states.async_set("sensor.energy", "unavailable", ENERGY_SENSOR_ATTRIBUTES)
+        freezer.move_to(period1 + timedelta(minutes=3))
+        hass.states.async_set("sensor.power", "20", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.energy", "6", ENERGY_SENSOR_ATTRIBUTES)
+        await async_wait_recording_done(hass)
+
+        freezer.move_to(period1_end + timedelta(seconds=10))
+        instance = get_instance(hass)
+        with patch.object(
+            sensor_recorder.history, "get_full_significant_states_with_session"
+        ) as history_mock:
+            accumulated = await instance.async_add_executor_job(
+                sensor_recorder.compile_statistics, hass, period1, period1_end
+            )
+        assert not history_mock.called
+
+        with patch.object(
+            sensor_recorder.SensorStatisticsAccumulator,
+            "get_period",
+            return_value=None,
+        ):
+            from_database = await instance.async_add_executor_job(
+                sensor_recorder.compile_statistics, hass, period1, period1_end
+            )
+
+    assert accumulated.platform_stats == from_database.platform_stats
+    stats = {
+        result["meta"]["statistic_id"]: result["stat"]
+        for result in accumulated.platform_stats
+    }
+    assert stats["sensor.power"] == {
+        "start": period1,
+        "mean": pytest.approx(13.0),
+        "min": 5.0,
+        "max": 20.0,
+    }
+    assert stats["sensor.energy"]["sum"] == 5.0
+
+
+async def test_compile_accumulated_statistics_skips_sensors_added_later(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test sensors added after the period ended are not compiled for it."""
+    now = dt_util.utcnow()
+    period0 = now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+    period1 = period0 + timedelta(minutes=5)
+    period1_end = period1 + timedelta(minutes=5)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+
+    with freeze_time(period0 + timedelta(seconds=1)) as freezer:
+        hass.states.async_set("sensor.power", "5", POWER_SENSOR_ATTRIBUTES)
+        # The first compile starts collecting states for the next period
+        do_adhoc_statistics(hass, start=period0 - timedelta(hours=1))
+        await async_wait_recording_done(hass)
+
+        freezer.move_to(period1 + timedelta(minutes=1))
+        hass.states.async_set("sensor.power", "10", POWER_SENSOR_ATTRIBUTES)
+        freezer.move_to(period1_end + timedelta(seconds=5))
+        hass.states.async_set("sensor.new_power", "7", POWER_SENSOR_ATTRIBUTES)
+        await async_wait_recording_done(hass)
+
+        freezer.move_to(period1_end + timedelta(seconds=10))
+        instance = get_instance(hass)
+        with patch.object(
+            sensor_recorder.history, "get_full_significant_states_with_session"
+        ) as history_mock:
+            compiled = await instance.async_add_executor_job(
+                sensor_recorder.compile_statistics, hass, period1, period1_end
+            )
+        assert not history_mock.called
+
+    stats = {
+        result["meta"]["statistic_id"]: result["stat"]
+        for result in compiled.platform_stats
+    }
+    assert stats.keys() == {"sensor.power"}
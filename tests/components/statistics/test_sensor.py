@@ -564,6 +564,99 @@ async def test_percentile(hass: HomeAssistant) -> None:
     assert state.state == str(2.72)
 
 
+async def test_rolling_window_characteristics(hass: HomeAssistant) -> None:
+    """Test characteristics stay correct while samples leave the buffer."""
+    expected_fns = {
+        "mean": statistics.mean,
+        "median": statistics.median,
+        "percentile": lambda values: statistics.quantiles(
+            values, n=100, method="exclusive"
+        )[89],
+        "standard_deviation": statistics.stdev,
+        "sum": sum,
+        "value_max": max,
+        "value_min": min,
+        "variance": statistics.variance,
+    }
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": f"test_{characteristic}",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 4,
+                    "percentile": 90,
+                    "precision": 6,
+                }
+                for characteristic in expected_fns
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for idx, value in enumerate(VALUES_NUMERIC * 2):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            str(value),
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+        window = (VALUES_NUMERIC * 2)[max(0, idx - 3) : idx + 1]
+
+        for characteristic, expected_fn in expected_fns.items():
+            state = hass.states.get(f"sensor.test_{characteristic}")
+            assert state is not None
+            if len(window) < 2 and characteristic in (
+                "percentile",
+                "standard_deviation",
+                "variance",
+            ):
+                assert state.state == STATE_UNKNOWN
+                continue
+            expected = round(float(expected_fn(window)), 6)
+            assert float(state.state) == expected, (characteristic, window)
+
+
+async def test_non_finite_source_states(hass: HomeAssistant) -> None:
+    """Test nan and inf states are rejected and do not corrupt the window."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": f"test_{characteristic}",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 2,
+                }
+                for characteristic in ("mean", "median", "value_max")
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for value in ("1", "nan", "3", "inf", "-inf", "5", "nan"):
+        hass.states.async_set("sensor.test_monitored", value)
+        await hass.async_block_till_done()
+
+    for characteristic, expected in (
+        ("mean", 4.0),
+        ("median", 4.0),
+        ("value_max", 5.0),
+    ):
+        state = hass.states.get(f"sensor.test_{characteristic}")
+        assert state is not None
+        assert float(state.state) == expected
+        assert state.attributes["buffer_usage_ratio"] == 1.0
+        assert state.attributes["source_value_valid"] is False
+
+
 async def test_device_class(hass: HomeAssistant) -> None:
     """Test device class, which depends on the source entity."""
     assert await async_setup_component(
@@ -829,6 +829,10 @@ async def test_durations(hass: HomeAssistant, worker_finished_stream) -> None:
     # check that the Part duration metadata matches the durations in the media
     running_metadata_duration = 0
     for segment in complete_segments:
+        # The parts of a complete segment are views on the data of the segment
+        segment_data = segment.get_data_with_init()
+        assert segment_data == segment.init + segment.get_data()
+        assert all(part.data.obj is segment_data for part in segment.parts)
         av_segment = av.open(io.BytesIO(segment.init + segment.get_data()))
         av_segment.close()
         for part_num, part in enumerate(segment.parts):
@@ -8,7 +8,7 @@ from unittest.mock import patch
 import pytest
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import DATA_TRACE, DEFAULT_STORED_TRACES
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.helpers.typing import UNDEFINED
@@ -587,6 +587,107 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+async def test_trace_byte_budget(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test changed variables are left out of traces exceeding the budget."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, "automation", [sun_config])
+    client = await hass_ws_client()
+
+    hass.bus.async_fire("test_event", {"payload": "small"})
+    await hass.async_block_till_done()
+    with patch("homeassistant.components.trace.models.TRACE_MAX_BYTES", 4096):
+        hass.bus.async_fire("test_event", {"payload": "x" * 8192})
+        await hass.async_block_till_done()
+
+    await client.send_json(
+        {"id": next_id(), "type": "trace/list", "domain": "automation"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    small_run_id, large_run_id = (
+        trace["run_id"]
+        for trace in _find_traces(response["result"], "automation", "sun")
+    )
+
+    traces = []
+    for run_id in (small_run_id, large_run_id):
+        await client.send_json(
+            {
+                "id": next_id(),
+                "type": "trace/get",
+                "domain": "automation",
+                "item_id": "sun",
+                "run_id": run_id,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        traces.append(response["result"])
+
+    small_trace, large_trace = traces
+    assert "changed_variables_truncated" not in small_trace
+    trigger_step = small_trace["trace"]["trigger/0"][0]
+    assert trigger_step["changed_variables"]["trigger"]["event"]["data"] == {
+        "payload": "small"
+    }
+    assert large_trace["changed_variables_truncated"] is True
+    assert "changed_variables" not in large_trace["trace"]["trigger/0"][0]
+    assert large_trace["trace"].keys() == small_trace["trace"].keys()
+    assert large_trace["state"] == "stopped"
+
+
+async def test_trace_memory_limit(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the oldest finished traces are evicted when over the memory limit."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(hass, "automation", [sun_config, moon_config])
+    client = await hass_ws_client()
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    for _ in range(3):
+        hass.bus.async_fire("test_event2")
+        await hass.async_block_till_done()
+
+    traces = hass.data[DATA_TRACE]
+    total = sum(trace.size for key in traces for trace in traces[key].values())
+    assert all(trace.size for key in traces for trace in traces[key].values())
+
+    # The next run only fits when the oldest finished trace is evicted
+    with patch("homeassistant.components.trace.TRACES_MAX_MEMORY", total - 1):
+        hass.bus.async_fire("test_event2")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": "automation"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], "automation", "sun")) == 0
+    assert len(_find_traces(response["result"], "automation", "moon")) == 4
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
@@ -1,4 +1,5 @@
 """Tests for WebSocket API commands."""
+import asyncio
 from copy import deepcopy
 import datetime
 from unittest.mock import ANY, patch
@@ -20,7 +21,11 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_PHASE_TIME,
+    DATA_SETUP_TIME,
+    async_setup_component,
+)
 from homeassistant.util.json import json_loads
 
 from tests.common import MockEntity, MockEntityPlatform, MockUser, async_mock_service
@@ -1003,6 +1008,81 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_throttled(
+    hass: HomeAssistant, websocket_client
+) -> None:
+    """Test subscribe entities coalesces changes within the throttle window."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    hass.states.async_set("light.unchanged", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "throttle_ms": 50}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {
+        "light.changed",
+        "light.removed",
+        "light.unchanged",
+    }
+
+    hass.states.async_set("light.changed", "off", {"color": "blue", "effect": "x"})
+    hass.states.async_set("light.changed", "on", {"effect": "x"})
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.added", "off")
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.temporary", "on")
+    hass.states.async_remove("light.temporary")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"s": "off", "a": {}, "c": ANY, "lc": ANY}},
+        "c": {
+            "light.changed": {
+                "+": {"s": "on", "a": {"effect": "x"}, "c": ANY, "lc": ANY},
+                "-": {"a": ["color"]},
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    # A single change shares the message of subscriptions without throttling
+    hass.states.async_set("light.unchanged", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.unchanged": {"+": {"s": "on", "c": ANY, "lc": ANY}}}
+    }
+
+    # Changes that cancel out are not sent
+    hass.states.async_set("light.temporary", "on")
+    hass.states.async_set("light.temporary", "off")
+    hass.states.async_remove("light.temporary")
+    await asyncio.sleep(0.1)
+    await websocket_client.send_json({"id": 8, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["type"] == "pong"
+
+    hass.states.async_set("light.unchanged", "off")
+    await websocket_client.send_json(
+        {"id": 9, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["success"]
+
+    await asyncio.sleep(0.1)
+    hass.states.async_set("light.unchanged", "on")
+    await websocket_client.send_json({"id": 10, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 10
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
 ) -> None:
@@ -1757,6 +1837,9 @@ async def test_integration_setup_info(
         "august": datetime.timedelta(seconds=12.5),
         "isy994": datetime.timedelta(seconds=12.8),
     }
+    hass.data[DATA_SETUP_PHASE_TIME] = {
+        "august": {"loader": 0.5, "import": 2.0, "setup": 10.0},
+    }
     await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
 
     msg = await websocket_client.receive_json()
@@ -1764,8 +1847,12 @@ async def test_integration_setup_info(
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {
+            "domain": "august",
+            "seconds": 12.5,
+            "phases": {"loader": 0.5, "import": 2.0, "setup": 10.0},
+        },
+        {"domain": "isy994", "seconds": 12.8, "phases": {}},
     ]
 
 
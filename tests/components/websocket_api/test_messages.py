@@ -1,8 +1,10 @@
 """Test Websocket API messages module."""
+from unittest.mock import patch
+
 import pytest
 
+from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.messages import (
-    _cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
     message_to_json,
@@ -29,26 +31,21 @@ async def test_cached_event_message(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
     assert len(events) == 2
-    lru_event_cache.cache_clear()
-
-    msg0 = cached_event_message(2, events[0])
-    assert msg0 == cached_event_message(2, events[0])
 
-    msg1 = cached_event_message(2, events[1])
-    assert msg1 == cached_event_message(2, events[1])
+    with patch.object(
+        messages, "message_to_json", wraps=messages.message_to_json
+    ) as mock_to_json:
+        msg0 = cached_event_message(2, events[0])
+        assert msg0 == cached_event_message(2, events[0])
 
-    assert msg0 != msg1
+        msg1 = cached_event_message(2, events[1])
+        assert msg1 == cached_event_message(2, events[1])
 
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
+        assert msg0 != msg1
+        assert mock_to_json.call_count == 2
 
-    cached_event_message(2, events[1])
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 3
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
+        cached_event_message(2, events[1])
+        assert mock_to_json.call_count == 2
 
 
 async def test_cached_event_message_with_different_idens(hass: HomeAssistant) -> None:
@@ -67,19 +64,16 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
 
     assert len(events) == 1
 
-    lru_event_cache.cache_clear()
-
-    msg0 = cached_event_message(2, events[0])
-    msg1 = cached_event_message(3, events[0])
-    msg2 = cached_event_message(4, events[0])
+    with patch.object(
+        messages, "message_to_json", wraps=messages.message_to_json
+    ) as mock_to_json:
+        msg0 = cached_event_message(2, events[0])
+        msg1 = cached_event_message(3, events[0])
+        msg2 = cached_event_message(4, events[0])
 
     assert msg0 != msg1
     assert msg0 != msg2
-
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 1
-    assert cache_info.currsize == 1
+    assert mock_to_json.call_count == 1
 
 
 async def test_state_diff_event(hass: HomeAssistant) -> None:
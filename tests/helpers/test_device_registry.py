@@ -1664,3 +1664,55 @@ async def test_only_disable_device_if_all_config_entries_are_disabled(
 
     entry1 = device_registry.async_get(entry1.id)
     assert not entry1.disabled
+
+
+async def test_device_registry_area_and_config_entry_indexes(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test the area and config entry indexes follow updates."""
+    config_entry_1 = MockConfigEntry()
+    config_entry_1.add_to_hass(hass)
+    config_entry_2 = MockConfigEntry()
+    config_entry_2.add_to_hass(hass)
+
+    device1 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_1.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "34:56:AB:CD:EF:12")},
+    )
+    device2 = device_registry.async_get_or_create(
+        config_entry_id=config_entry_2.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "34:56:AB:CD:EF:12")},
+    )
+    device1 = device_registry.async_update_device(device1.id, area_id="kitchen")
+
+    assert dr.async_entries_for_area(device_registry, "kitchen") == [device1]
+    assert {
+        device.id
+        for device in dr.async_entries_for_config_entry(
+            device_registry, config_entry_1.entry_id
+        )
+    } == {device1.id, device2.id}
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [device2]
+
+    device_registry.async_clear_area_id("kitchen")
+    assert dr.async_entries_for_area(device_registry, "kitchen") == []
+
+    device_registry.async_clear_config_entry(config_entry_1.entry_id)
+    assert device_registry.async_get(device1.id) is None
+    assert (
+        dr.async_entries_for_config_entry(device_registry, config_entry_1.entry_id)
+        == []
+    )
+    assert dr.async_entries_for_config_entry(
+        device_registry, config_entry_2.entry_id
+    ) == [device_registry.async_get(device2.id)]
+
+    device_registry.async_remove_device(device2.id)
+    assert device_registry.devices._area_id_index == {}
+    assert device_registry.devices._config_entry_id_index == {}
@@ -1045,3 +1045,89 @@ async def test_warn_using_async_update_ha_state(
     caplog.clear()
     await ent.async_update_ha_state()
     assert "is using self.async_update_ha_state()" not in caplog.text
+
+
+async def test_unchanged_writes_are_suppressed(hass: HomeAssistant) -> None:
+    """Test writes that change nothing skip the state machine."""
+    extra_attributes = {"level": 1}
+    ent = MockEntity(
+        unique_id="qwer",
+        device_info={
+            "identifiers": {("hue", "1234")},
+            "connections": {(dr.CONNECTION_NETWORK_MAC, "abcd")},
+            "name": "Device Bla",
+        },
+        has_entity_name=True,
+        name="Entity Blu",
+        state="on",
+        extra_state_attributes=extra_attributes,
+    )
+
+    async def async_setup_entry(hass, config_entry, async_add_entities):
+        """Mock setup entry method."""
+        async_add_entities([ent])
+        return True
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+    assert await entity_platform.async_setup_entry(config_entry)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Device Bla Entity Blu"
+    assert entity_platform.suppressed_state_writes == 0
+
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id) is state
+    assert entity_platform.suppressed_state_writes == 1
+
+    # Attributes mutated in place are picked up
+    extra_attributes["level"] = 2
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes["level"] == 2
+    assert entity_platform.suppressed_state_writes == 1
+
+    extra_attributes["mode"] = "auto"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id).attributes["mode"] == "auto"
+    del extra_attributes["mode"]
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert "mode" not in state.attributes
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id) is state
+    assert entity_platform.suppressed_state_writes == 2
+
+    # Attributes overwritten by a property are compared with the property
+    extra_attributes[ATTR_FRIENDLY_NAME] = "Ignored"
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id) is state
+    assert entity_platform.suppressed_state_writes == 3
+    del extra_attributes[ATTR_FRIENDLY_NAME]
+
+    # The state machine was changed by someone else
+    hass.states.async_set(ent.entity_id, "off")
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.state == "on"
+    assert state.attributes["level"] == 2
+    assert entity_platform.suppressed_state_writes == 3
+
+    # Device registry updates invalidate the cached friendly name
+    dev_reg = dr.async_get(hass)
+    device = dev_reg.async_get_device({("hue", "1234")})
+    dev_reg.async_update_device(device.id, name_by_user="Device Renamed")
+    await hass.async_block_till_done()
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Device Renamed Entity Blu"
+
+    # Force update always writes
+    ent._attr_force_update = True
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id) is not state
+    assert entity_platform.suppressed_state_writes == 3
@@ -1410,6 +1410,67 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+async def test_entity_registry_items_indexes(
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the device, area and config entry indexes follow updates."""
+    config_entry = MockConfigEntry(domain="light")
+    entry1 = entity_registry.async_get_or_create(
+        "light",
+        "hue",
+        "1234",
+        config_entry=config_entry,
+        device_id="device1",
+    )
+    entry2 = entity_registry.async_get_or_create(
+        "light", "hue", "2345", device_id="device1"
+    )
+    entity_registry.async_update_entity(entry2.entity_id, area_id="kitchen")
+
+    assert er.async_entries_for_device(entity_registry, "device1") == [
+        entry1,
+        entity_registry.async_get(entry2.entity_id),
+    ]
+    assert er.async_entries_for_area(entity_registry, "kitchen") == [
+        entity_registry.async_get(entry2.entity_id)
+    ]
+    assert er.async_entries_for_config_entry(
+        entity_registry, config_entry.entry_id
+    ) == [entry1]
+
+    entity_registry.async_update_entity(
+        entry1.entity_id, new_entity_id="light.renamed", device_id="device2"
+    )
+    entity_registry.async_update_entity(
+        "light.renamed", disabled_by=er.RegistryEntryDisabler.USER
+    )
+    assert er.async_entries_for_device(entity_registry, "device2") == []
+    assert er.async_entries_for_device(
+        entity_registry, "device2", include_disabled_entities=True
+    ) == [entity_registry.async_get("light.renamed")]
+    assert [
+        entry.entity_id
+        for entry in er.async_entries_for_config_entry(
+            entity_registry, config_entry.entry_id
+        )
+    ] == ["light.renamed"]
+
+    entity_registry.async_clear_area_id("kitchen")
+    assert er.async_entries_for_area(entity_registry, "kitchen") == []
+
+    entity_registry.async_clear_config_entry(config_entry.entry_id)
+    assert entity_registry.async_get("light.renamed") is None
+    assert (
+        er.async_entries_for_config_entry(entity_registry, config_entry.entry_id) == []
+    )
+
+    entity_registry.async_remove(entry2.entity_id)
+    assert er.async_entries_for_device(entity_registry, "device1") == []
+    assert entity_registry.entities._device_id_index == {}
+    assert entity_registry.entities._area_id_index == {}
+    assert entity_registry.entities._config_entry_id_index == {}
+
+
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
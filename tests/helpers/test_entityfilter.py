@@ -417,6 +417,25 @@ def test_get_filter() -> None:
     assert underlying_filter("switch.kitchen")
 
 
+def test_filter_results_are_memoized() -> None:
+    """Test the filter only evaluates an entity_id once."""
+    conf = {
+        "include": {"domains": ["light"], "entity_globs": ["sensor.kitchen_*"]},
+        "exclude": {"entities": ["light.kitchen"]},
+    }
+    filt: EntityFilter = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
+    underlying_filter = filt.get_filter()
+    assert underlying_filter("sensor.kitchen_4")
+    assert not underlying_filter("light.kitchen")
+    assert underlying_filter("sensor.kitchen_4")
+    assert underlying_filter.cache_info().hits == 1
+    assert underlying_filter.cache_info().misses == 2
+
+    # A reloaded filter starts with an empty cache
+    reloaded: EntityFilter = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
+    assert reloaded.get_filter().cache_info().currsize == 0
+
+
 def test_complex_include_exclude_filter() -> None:
     """Test a complex include exclude filter."""
     conf = {
@@ -34,6 +34,7 @@ from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
     async_track_state_change_filtered,
+    async_track_state_change_index_stats,
     async_track_state_removed_domain,
     async_track_sunrise,
     async_track_sunset,
@@ -2080,6 +2081,63 @@ async def test_track_template_result_and_conditional_upper_case(
     assert specific_runs[2] == "on"
 
 
+async def test_track_template_result_dispatches_by_dependency(
+    hass: HomeAssistant,
+) -> None:
+    """Test a state change only re-renders the templates depending on it."""
+    template_sensor = Template("{{ states('sensor.a') }}", hass)
+    template_light = Template("{{ states('light.b') }}", hass)
+    template_switches = Template("{{ states.switch | count }}", hass)
+    results = []
+
+    @ha.callback
+    def result_callback(event, updates):
+        results.extend((update.template, update.result) for update in updates)
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_sensor, None),
+            TrackTemplate(template_light, None),
+            TrackTemplate(template_switches, None, timedelta(seconds=0)),
+        ],
+        result_callback,
+    )
+    await hass.async_block_till_done()
+    assert info.listeners == {
+        "all": False,
+        "domains": {"switch"},
+        "entities": {"sensor.a", "light.b"},
+        "time": False,
+    }
+    stats = async_track_state_change_index_stats(hass)
+    assert stats["entities"] == 2
+    assert stats["domains"] == 1
+
+    hass.states.async_set("sensor.a", "1")
+    await hass.async_block_till_done()
+    assert results == [(template_sensor, 1)]
+    stats = async_track_state_change_index_stats(hass)
+    assert stats["events"] == 1
+    assert stats["jobs"] == 1
+    assert stats["templates"] == 1
+
+    hass.states.async_set("switch.c", "on")
+    await hass.async_block_till_done()
+    assert results[1:] == [(template_switches, 1)]
+    assert async_track_state_change_index_stats(hass)["templates"] == 2
+
+    hass.states.async_set("sensor.other", "1")
+    await hass.async_block_till_done()
+    assert len(results) == 2
+    assert async_track_state_change_index_stats(hass)["events"] == 2
+
+    info.async_remove()
+    stats = async_track_state_change_index_stats(hass)
+    assert stats["entities"] == 0
+    assert stats["domains"] == 0
+
+
 async def test_track_template_result_iterator(hass: HomeAssistant) -> None:
     """Test tracking template."""
     iterator_runs = []
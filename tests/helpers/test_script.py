@@ -594,6 +594,56 @@ async def test_multiple_runs_delay(hass: HomeAssistant) -> None:
         assert events[-1].data["value"] == 2
 
 
+async def test_static_values_rendered_at_compile(hass: HomeAssistant) -> None:
+    """Test values without templates are rendered when the script is created."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"event": "test_event", "event_data": {"value": 1}},
+            {"delay": {"seconds": 0}},
+            {"delay": "00:00:{{ 0 }}"},
+            {"event": "test_event", "event_data_template": {"value": "{{ 2 }}"}},
+            # Containers in event data would be shared between events
+            {"event": "test_event", "event_data": {"value": [3]}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    steps = script_obj._compiled_sequence
+    assert [step.action_type for step in steps] == [
+        "event",
+        "delay",
+        "delay",
+        "event",
+        "event",
+    ]
+    assert steps[0].rendered == {"event_data": {"value": 1}}
+    assert steps[1].rendered == {"delay": timedelta(0)}
+    assert steps[2].rendered == {}
+    assert steps[3].rendered == {}
+    assert steps[4].rendered == {}
+
+    with patch(
+        "homeassistant.helpers.script.template.render_complex",
+        wraps=template.render_complex,
+    ) as render_complex:
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    # Only the templates of the third and the fourth step are rendered
+    rendered = [call.args[0] for call in render_complex.call_args_list]
+    assert any(value is sequence[2]["delay"] for value in rendered)
+    assert any(value is sequence[3]["event_data_template"] for value in rendered)
+    assert not any(value is sequence[0]["event_data"] for value in rendered)
+    assert not any(value is sequence[1]["delay"] for value in rendered)
+    assert [event.data for event in events] == [
+        {"value": 1},
+        {"value": 2},
+        {"value": [3]},
+    ]
+    assert events[2].data["value"] is not sequence[4]["event_data"]["value"]
+
+
 async def test_delay_template_ok(hass: HomeAssistant) -> None:
     """Test the delay as a template."""
     sequence = cv.SCRIPT_SCHEMA({"delay": "00:00:{{ 5 }}"})
@@ -2,6 +2,8 @@
 import asyncio
 from datetime import timedelta
 import json
+import os
+import threading
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -17,7 +19,11 @@ from homeassistant.helpers import storage
 from homeassistant.util import dt
 from homeassistant.util.color import RGBColor
 
-from tests.common import async_fire_time_changed, async_test_home_assistant
+from tests.common import (
+    async_fire_time_changed,
+    async_test_home_assistant,
+    flush_store,
+)
 
 MOCK_VERSION = 1
 MOCK_VERSION_2 = 2
@@ -548,3 +554,189 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
     }
 
     await hass.async_stop(force=True)
+
+
+async def test_saving_with_delay_snapshot(
+    hass: HomeAssistant, store, hass_storage: dict[str, Any]
+) -> None:
+    """Test saving data built from a snapshot in the executor."""
+    threads = []
+
+    def _serialize():
+        threads.append(threading.get_ident())
+        return MOCK_DATA
+
+    store.async_delay_save_snapshot(lambda: _serialize, 1)
+    assert store.key not in hass_storage
+
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert hass_storage[store.key] == {
+        "version": MOCK_VERSION,
+        "minor_version": 1,
+        "key": MOCK_KEY,
+        "data": MOCK_DATA,
+    }
+    assert threads and threads[0] != threading.get_ident()
+
+
+async def test_loading_while_delay_snapshot(
+    hass: HomeAssistant, store, hass_storage: dict[str, Any]
+) -> None:
+    """Test we load the data of a pending snapshot save."""
+    store.async_delay_save_snapshot(lambda: lambda: {"delay": "yes"}, 1)
+    assert await store.async_load() == {"delay": "yes"}
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test changed entries are journaled and replayed when loading."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    def _store():
+        return storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+        )
+
+    def _read_journal(store):
+        with open(f"{store.path}{storage.JOURNAL_SUFFIX}") as journal:
+            return [json.loads(line) for line in journal]
+
+    items = {"a": {"id": "a", "value": 1}, "b": {"id": "b", "value": 2}}
+    store = _store()
+
+    async def _save():
+        data = {"name": "test", "items": list(items.values())}
+        store.async_delay_save_snapshot(lambda: lambda: data)
+        await flush_store(store)
+
+    await _save()
+    assert not os.path.exists(f"{store.path}{storage.JOURNAL_SUFFIX}")
+
+    items["a"] = {"id": "a", "value": 3}
+    del items["b"]
+    items["c"] = {"id": "c", "value": 4}
+    await _save()
+    journal = _read_journal(store)
+    assert journal[1:] == [
+        {"collection": "items", "id": "a", "entry": {"id": "a", "value": 3}},
+        {"collection": "items", "id": "c", "entry": {"id": "c", "value": 4}},
+        {"collection": "items", "id": "b"},
+    ]
+
+    expected = {"name": "test", "items": list(items.values())}
+    assert await _store().async_load() == expected
+
+    # Changes outside of the journaled collections rewrite the whole file
+    store.async_delay_save_snapshot(lambda: lambda: {**expected, "name": "new"})
+    await flush_store(store)
+    assert not os.path.exists(f"{store.path}{storage.JOURNAL_SUFFIX}")
+    assert await _store().async_load() == {**expected, "name": "new"}
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_entries_changed_in_place(tmpdir: py.path.local) -> None:
+    """Test entries changed in place after a save are journaled."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+    )
+    items = [{"id": "a", "value": 1}]
+    data = {"items": items}
+
+    async def _load():
+        return await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+        ).async_load()
+
+    store.async_delay_save(lambda: data)
+    await flush_store(store)
+    items[0]["value"] = 2
+    store.async_delay_save(lambda: data)
+    await flush_store(store)
+    assert await _load() == {"items": [{"id": "a", "value": 2}]}
+
+    await store.async_save(data)
+    items[0]["value"] = 3
+    store.async_delay_save(lambda: data)
+    await flush_store(store)
+    assert await _load() == {"items": [{"id": "a", "value": 3}]}
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the file is rewritten once the journal is full."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+    )
+    journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+
+    with patch.object(storage, "JOURNAL_MAX_RECORDS", 2):
+        for value in range(3):
+            data = {"items": [{"id": "a", "value": value}]}
+            store.async_delay_save_snapshot(lambda data=data: lambda: data)
+            await flush_store(store)
+            if value == 1:
+                assert os.path.exists(journal_path)
+        store.async_delay_save_snapshot(lambda: lambda: {"items": []})
+        await flush_store(store)
+
+    # The journal of the old file must not be applied to the new file
+    assert not os.path.exists(journal_path)
+    loaded = await storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+    ).async_load()
+    assert loaded == {"items": []}
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_merged_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is merged into the file when Home Assistant stops."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+    )
+    journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+
+    store.async_delay_save(lambda: {"name": "test", "items": [{"id": "a"}]})
+    await flush_store(store)
+    data = {"name": "test", "items": [{"id": "a", "value": 1}, {"id": "b"}]}
+    store.async_delay_save(lambda: data)
+    await flush_store(store)
+    assert os.path.exists(journal_path)
+
+    hass.state = CoreState.stopping
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    assert not os.path.exists(journal_path)
+    with open(store.path) as file:
+        written = json.load(file)
+    assert written["data"] == data
+    assert (
+        await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_collections={"items": "id"}
+        ).async_load()
+        == data
+    )
+
+    await hass.async_stop(force=True)
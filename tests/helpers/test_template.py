@@ -11,6 +11,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from lru import LRU  # pylint: disable=no-name-in-module
 import orjson
 import pytest
 import voluptuous as vol
@@ -4060,27 +4061,39 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_compiled_template_cache() -> None:
+    """Test compiled code is shared by templates with the same source."""
     template_string = (
-        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
+        "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }} cache"
     )
+    stats = template.compiled_template_cache_stats()
     tpl = template.Template(
         (template_string),
     )
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    new_stats = template.compiled_template_cache_stats()
+    assert new_stats["misses"] == stats["misses"] + 1
+    assert new_stats["hits"] == stats["hits"]
 
     tpl2 = template.Template(
         (template_string),
     )
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    new_stats = template.compiled_template_cache_stats()
+    assert new_stats["misses"] == stats["misses"] + 1
+    assert new_stats["hits"] == stats["hits"] + 1
+    assert tpl2._compiled_code is tpl._compiled_code
 
+    # Compiled code outlives the templates, until evicted
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.COMPILED_TEMPLATE_LRU.get((template_string, "no_hass"))
+
+    with patch.object(template, "COMPILED_TEMPLATE_LRU", LRU(2)):
+        for idx in range(3):
+            template.Template(f"{{{{ {idx} }}}}").ensure_valid()
+        assert template.compiled_template_cache_stats()["size"] == 2
+        assert template.COMPILED_TEMPLATE_LRU.get(("{{ 0 }}", "no_hass")) is None
 
 
 def test_is_template_string() -> None:
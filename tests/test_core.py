@@ -11,7 +11,7 @@ import os
 from tempfile import TemporaryDirectory
 import time
 from typing import Any
-from unittest.mock import MagicMock, Mock, PropertyMock, patch
+from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 
 import pytest
 import voluptuous as vol
@@ -35,6 +35,7 @@ from homeassistant.const import (
 import homeassistant.core as ha
 from homeassistant.core import HassJob, HomeAssistant, State
 from homeassistant.exceptions import (
+    HomeAssistantError,
     InvalidEntityFormatError,
     InvalidStateError,
     MaxLengthExceeded,
@@ -489,6 +490,38 @@ def test_state_as_dict_json() -> None:
     assert state.as_dict_json() is as_dict_json_1
 
 
+def test_json_fragment_cache() -> None:
+    """Test JSON is cached per kind on states and events."""
+    state = ha.State("light.kitchen", "on", {"brightness": 100})
+    event = ha.Event("some_event", {"some": "attr"})
+
+    assert state.as_dict_json() is state.as_dict_json()
+    assert event.as_dict_json() is event.as_dict_json()
+    serialize = Mock(return_value='"serialized"')
+    assert state.json_fragment("test_kind", serialize) == '"serialized"'
+    assert state.json_fragment("test_kind", serialize) == '"serialized"'
+    assert event.json_fragment("test_kind", serialize) == '"serialized"'
+    assert serialize.mock_calls == [call(state), call(event)]
+
+
+def test_json_cache_stats() -> None:
+    """Test the hits and misses of the JSON cache are counted."""
+    state = ha.State("light.kitchen", "on", {"brightness": 100})
+    event = ha.Event("some_event", {"some": "attr"})
+    before = ha.json_cache_stats()
+
+    assert state.as_dict_json() is state.as_dict_json()
+    assert state.as_compressed_state_json() is state.as_compressed_state_json()
+    assert event.as_dict_json() is event.as_dict_json()
+    serialize = Mock(return_value='"serialized"')
+    state.json_fragment("test_kind", serialize)
+    state.json_fragment("test_kind", serialize)
+
+    stats = ha.json_cache_stats()
+    assert stats["hits"] - before["hits"] == 4
+    assert stats["misses"] - before["misses"] == 4
+
+
 def test_state_as_compressed_state() -> None:
     """Test a State as compressed state."""
     last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
@@ -626,6 +659,92 @@ async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_listen_batch(hass: HomeAssistant) -> None:
+    """Test events fired in the same loop iteration are delivered as one batch."""
+    batches = []
+
+    @ha.callback
+    def listener(events):
+        """Mock batch listener."""
+        batches.append(events)
+
+    @ha.callback
+    def event_filter(event):
+        """Mock filter."""
+        return not event.data.get("skip")
+
+    unsub = hass.bus.async_listen_batch("test", listener, event_filter)
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"idx": 1})
+    hass.bus.async_fire("test", {"idx": 2, "skip": True})
+    hass.bus.async_fire("other", {"idx": 3})
+    hass.bus.async_fire("test", {"idx": 4})
+    assert batches == []
+
+    await hass.async_block_till_done()
+    assert len(batches) == 1
+    assert [event.data["idx"] for event in batches[0]] == [1, 4]
+
+    hass.bus.async_fire("test", {"idx": 5})
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert [event.data["idx"] for event in batches[1]] == [5]
+
+    unsub()
+    hass.bus.async_fire("test", {"idx": 6})
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+
+async def test_eventbus_listen_batch_unsub_before_flush(hass: HomeAssistant) -> None:
+    """Test events pending when a batch listener is removed are not delivered."""
+    batches = []
+
+    @ha.callback
+    def listener(events):
+        """Mock batch listener."""
+        batches.append(events)
+
+    unsub = hass.bus.async_listen_batch("test", listener)
+    hass.bus.async_fire("test", {"idx": 1})
+    unsub()
+    await hass.async_block_till_done()
+
+    assert batches == []
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_listen_batch_coroutine(hass: HomeAssistant) -> None:
+    """Test a coroutine batch listener."""
+    batches = []
+
+    async def listener(events):
+        """Mock batch listener."""
+        batches.append(events)
+
+    hass.bus.async_listen_batch("test", listener)
+    for idx in range(500):
+        hass.bus.async_fire("test", {"idx": idx})
+    await hass.async_block_till_done()
+
+    assert len(batches) == 1
+    assert len(batches[0]) == 500
+
+
+async def test_eventbus_listen_batch_filter_must_be_callback(
+    hass: HomeAssistant,
+) -> None:
+    """Test a batch listener filter must be a callback."""
+
+    def event_filter(event):
+        """Mock filter."""
+        return True
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batch("test", lambda events: None, event_filter)
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -834,6 +953,38 @@ def test_state_repr() -> None:
     )
 
 
+def test_state_attributes_are_shared() -> None:
+    """Test states with equal attributes share them."""
+    state1 = ha.State("light.bowl", "on", {"brightness": 144, "name": "Bowl"})
+    state2 = ha.State("light.lamp", "on", {"brightness": 144, "name": "Bowl"})
+    assert state1.attributes is state2.attributes
+    assert ha.State("light.bowl", "off", state1.attributes).attributes is (
+        state1.attributes
+    )
+
+    # Values of different types are kept apart
+    state3 = ha.State("light.bowl", "on", {"brightness": 144.0, "name": "Bowl"})
+    assert state3.attributes is not state1.attributes
+    assert isinstance(state3.attributes["brightness"], float)
+    state4 = ha.State("light.bowl", "on", {"on": True})
+    state5 = ha.State("light.bowl", "on", {"on": 1})
+    assert state4.attributes is not state5.attributes
+    assert state5.attributes["on"] is not True
+
+    # Mutable values are copied
+    state6 = ha.State("light.bowl", "on", {"effects": ["a"]})
+    state7 = ha.State("light.bowl", "on", {"effects": ["a"]})
+    assert state6.attributes is not state7.attributes
+
+
+async def test_statemachine_shares_unchanged_attributes(hass: HomeAssistant) -> None:
+    """Test the state machine shares unchanged attributes."""
+    hass.states.async_set("light.bowl", "on", {"effects": ["a"]})
+    state = hass.states.get("light.bowl")
+    hass.states.async_set("light.bowl", "off", {"effects": ["a"]})
+    assert hass.states.get("light.bowl").attributes is state.attributes
+
+
 async def test_statemachine_is_state(hass: HomeAssistant) -> None:
     """Test is_state method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -1648,6 +1799,41 @@ async def test_async_entity_ids_count(hass: HomeAssistant) -> None:
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_async_domain_index_tracks_set_and_remove(hass: HomeAssistant) -> None:
+    """Test the per-domain lookups stay in sync with set and remove."""
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("switch.link", "on")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.frog"]
+    assert hass.states.async_entity_ids(["switch", "light"]) == [
+        "switch.link",
+        "light.bowl",
+        "light.frog",
+    ]
+    assert hass.states.async_entity_ids_count(["light", "vacuum"]) == 2
+    # Repeated domains in the filter are only counted once
+    assert hass.states.async_entity_ids(["light", "light"]) == [
+        "light.bowl",
+        "light.frog",
+    ]
+    assert hass.states.async_entity_ids_count(("light", "light")) == 2
+    assert len(hass.states.async_all(["switch", "switch"])) == 1
+
+    hass.states.async_set("light.bowl", "off")
+    assert [state.state for state in hass.states.async_all("light")] == ["off", "on"]
+
+    assert hass.states.async_remove("light.bowl")
+    assert hass.states.async_entity_ids("light") == ["light.frog"]
+    assert hass.states.async_remove("light.frog")
+    assert hass.states.async_entity_ids("light") == []
+    assert hass.states.async_entity_ids_count("light") == 0
+    assert hass.states.async_all(["light", "switch"]) == [
+        hass.states.get("switch.link")
+    ]
+
+
 async def test_hassjob_forbid_coroutine() -> None:
     """Test hassjob forbids coroutines."""
 
@@ -1,14 +1,26 @@
 """Test to verify that we can load components."""
+import asyncio
+from datetime import timedelta
+import os
+import pathlib
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant import loader
-from homeassistant.components import http, hue
+from homeassistant.components import http, hue, webhook
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass: HomeAssistant) -> None:
@@ -726,3 +738,125 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_concurrent_failing_imports(hass: HomeAssistant) -> None:
+    """Test concurrent imports that fail all raise the ImportError."""
+    integration = loader.Integration(
+        hass,
+        "homeassistant.components.not_a_component",
+        None,
+        {
+            "name": "Not a component",
+            "domain": "not_a_component",
+            "import_executor": True,
+        },
+    )
+
+    with patch(
+        "homeassistant.loader.importlib.import_module",
+        side_effect=ImportError("not found"),
+    ) as mock_import:
+        results = await asyncio.gather(
+            *(integration.async_get_component() for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(result, ImportError) for result in results)
+    # Waiters retry one at a time after the import they waited on failed
+    assert mock_import.call_count == 3
+    assert not integration._import_futures
+
+
+async def test_import_executor_opt_in(hass: HomeAssistant) -> None:
+    """Test only integrations that opt in are imported in the executor."""
+    integration = await loader.async_get_integration(hass, "template")
+    assert integration.import_executor is False
+
+    with patch.object(hass, "async_add_executor_job") as mock_add_executor_job:
+        component = await integration.async_get_component()
+        platform = await integration.async_get_platform("light")
+    assert not mock_add_executor_job.mock_calls
+    assert component is hass.data[loader.DATA_COMPONENTS]["template"]
+    assert platform is hass.data[loader.DATA_COMPONENTS]["template.light"]
+
+    integration = loader.Integration(
+        hass,
+        "homeassistant.components.scene",
+        None,
+        {"name": "Scene", "domain": "scene", "import_executor": True},
+    )
+    assert integration.import_executor is True
+    component = await integration.async_get_component()
+    assert component is hass.data[loader.DATA_COMPONENTS]["scene"]
+    import_time = hass.data[loader.DATA_IMPORT_TIME]
+    assert "homeassistant.components.template.light" in import_time
+    assert "homeassistant.components.scene" in import_time
+
+
+async def test_manifest_cache_saved(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test parsed manifests and resolved dependencies are saved."""
+    integration = await loader.async_get_integration(hass, "webhook")
+    assert await integration.resolve_dependencies()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["ha_version"] == __version__
+    manifests = data["manifests"]
+    entry = manifests[str(integration.file_path)]
+    assert entry["manifest"]["domain"] == "webhook"
+    assert "is_built_in" not in entry["manifest"]
+    http_path = str(pathlib.Path(http.__file__).parent)
+    assert entry["dependencies"] == {"http": http_path}
+    assert manifests[http_path]["manifest"]["domain"] == "http"
+
+
+@pytest.mark.parametrize(
+    ("ha_version", "size_offset", "name", "dependencies"),
+    [
+        (__version__, 0, "Cached Webhook", set()),
+        (__version__, 1, "Webhook", {"http"}),
+        ("2000.1.0", 0, "Webhook", {"http"}),
+    ],
+)
+async def test_manifest_cache_loaded(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    ha_version: str,
+    size_offset: int,
+    name: str,
+    dependencies: set[str],
+) -> None:
+    """Test cached manifests are only used when they did not change."""
+    webhook_path = pathlib.Path(webhook.__file__).parent
+    manifest_stat = os.stat(webhook_path / "manifest.json")
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": ha_version,
+            "manifests": {
+                str(webhook_path): {
+                    "mtime_ns": manifest_stat.st_mtime_ns,
+                    "size": manifest_stat.st_size + size_offset,
+                    "manifest": {
+                        "domain": "webhook",
+                        "name": "Cached Webhook",
+                        "dependencies": ["http"],
+                    },
+                    "dependencies": {},
+                }
+            },
+        },
+    }
+
+    integration = await loader.async_get_integration(hass, "webhook")
+    assert integration.name == name
+    assert await integration.resolve_dependencies()
+    assert integration.all_dependencies == dependencies
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 import voluptuous as vol
 
-from homeassistant import config_entries, setup
+from homeassistant import config_entries, loader, setup
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
@@ -782,3 +782,47 @@ async def test_setup_config_entry_from_yaml(
     caplog.clear()
     hass.data.pop(setup.DATA_SETUP)
     hass.config.components.remove("test_integration_only_entry")
+
+
+async def test_pre_import_integrations(hass: HomeAssistant) -> None:
+    """Test components and entity platforms are imported in dependency order."""
+    template = await loader.async_get_integration(hass, "template")
+    assert await template.resolve_dependencies()
+    broken = mock_integration(hass, MockModule("broken", ["template"]))
+    hass.data[loader.DATA_COMPONENTS].pop("broken")
+    assert await broken.resolve_dependencies()
+
+    with patch.object(loader.Integration, "import_executor", True), patch.object(
+        loader.Integration, "async_get_component", autospec=True
+    ) as mock_get_component:
+        await setup.async_pre_import_integrations(hass, [broken, template])
+    assert [call.args[0] for call in mock_get_component.mock_calls] == [
+        template,
+        broken,
+    ]
+
+    with patch.object(loader.Integration, "import_executor", True), patch(
+        "homeassistant.requirements.async_get_integration_with_requirements"
+    ) as mock_requirements:
+        await setup.async_pre_import_integrations(hass, [template, broken])
+    assert not mock_requirements.mock_calls
+    components = hass.data[loader.DATA_COMPONENTS]
+    assert "broken" not in components
+    assert "template" in components
+    assert "template.sensor" in components
+    import_time = hass.data[loader.DATA_IMPORT_TIME]
+    assert "homeassistant.components.template.sensor" in import_time
+
+
+async def test_pre_import_skips_integrations_without_opt_in(
+    hass: HomeAssistant,
+) -> None:
+    """Test integrations are only imported in the executor when they opt in."""
+    template = await loader.async_get_integration(hass, "template")
+    assert not template.import_executor
+
+    with patch.object(
+        loader.Integration, "async_get_component", autospec=True
+    ) as mock_get_component:
+        await setup.async_pre_import_integrations(hass, [template])
+    assert not mock_get_component.mock_calls